@@ -319,3 +319,57 @@ DJANGO_GITHUB_WEBHOOKS = {
 DJANGO_GITLAB_WEBHOOKS = {
     "ALLOWED_EVENTS": ("Issue Hook",),
 }
+
+# Webhooks processing
+WEBHOOKS = {
+    # Verified events are enqueued to Redis and applied by the consume_webhook_events command (202 response)
+    "ASYNC": env.bool("WEBHOOKS_ASYNC", default=False),
+    # Seconds to wait for a queued event, before the consumer checks for the stop (or exits in burst mode)
+    "CONSUMER_TIMEOUT": env.int("WEBHOOKS_CONSUMER_TIMEOUT", default=5),
+    # Max events count, that are applied by the consumer in one transaction (issue changes are applied in bulk)
+    "CONSUMER_BATCH_SIZE": env.int("WEBHOOKS_CONSUMER_BATCH_SIZE", default=100),
+    # Seconds to hold issue and star events, so only the newest event of the issue (repository) is applied,
+    # 0 disables coalescing (async processing only)
+    "COALESCE_WINDOW": env.int("WEBHOOKS_COALESCE_WINDOW", default=2),
+    # Webhook secret and repository id cache (Redis and in-process LRU), that is used for the events verification
+    "SECRETS_CACHE_TTL": env.int("WEBHOOKS_SECRETS_CACHE_TTL", default=60 * 60 * 24),
+    # In-process entries are not invalidated in the other processes, so they expire sooner
+    "SECRETS_LOCAL_CACHE_TTL": env.int("WEBHOOKS_SECRETS_LOCAL_CACHE_TTL", default=60),
+    "SECRETS_LOCAL_CACHE_MAX_ENTRIES": env.int("WEBHOOKS_SECRETS_LOCAL_CACHE_MAX_ENTRIES", default=10000),
+    # Seconds to keep the delivery ids, duplicate deliveries (retries) are dropped during this time
+    "DELIVERIES_TTL": env.int("WEBHOOKS_DELIVERIES_TTL", default=60 * 60 * 24),
+}
+
+# VCS clients
+VCS_CLIENTS = {
+    # Keep-alive connection pool size per VCS API host (shared by all clients in a process)
+    "POOL_MAXSIZE": env.int("VCS_CLIENTS_POOL_MAXSIZE", default=10),
+    # Block when all pool connections are in use instead of opening an extra (not pooled) connection
+    "POOL_BLOCK": env.bool("VCS_CLIENTS_POOL_BLOCK", default=False),
+    "MAX_RETRIES": env.int("VCS_CLIENTS_MAX_RETRIES", default=0),
+    # Cached VCS account token is reloaded from the DB, when it expires in less than specified seconds
+    "TOKEN_EXPIRES_LEEWAY": env.int("VCS_CLIENTS_TOKEN_EXPIRES_LEEWAY", default=60),
+    # Conditional requests cache: response validators (ETag / Last-Modified) and parsed bodies per account and url
+    "VALIDATORS_CACHE_TTL": env.int("VCS_CLIENTS_VALIDATORS_CACHE_TTL", default=60 * 60 * 24),
+    "VALIDATORS_CACHE_MAX_ENTRIES": env.int("VCS_CLIENTS_VALIDATORS_CACHE_MAX_ENTRIES", default=10000),
+    # Requests are delayed (or tasks are rescheduled) when account has less remaining requests than threshold
+    "RATE_LIMIT_THRESHOLD": env.int("VCS_CLIENTS_RATE_LIMIT_THRESHOLD", default=10),
+    # Max seconds to wait for the rate limit reset in place, otherwise task is rescheduled to the reset time
+    "RATE_LIMIT_MAX_DELAY": env.int("VCS_CLIENTS_RATE_LIMIT_MAX_DELAY", default=30),
+    # Fetch repository data concurrently with the async (httpx) clients on repository add
+    "ASYNC_ADD_REPOSITORY": env.bool("VCS_CLIENTS_ASYNC_ADD_REPOSITORY", default=False),
+    # Max concurrent requests of a single async client
+    "ASYNC_MAX_CONCURRENCY": env.int("VCS_CLIENTS_ASYNC_MAX_CONCURRENCY", default=5),
+    # Fetch GitHub repository, languages and issues with the GraphQL API on repository add
+    "GITHUB_GRAPHQL": env.bool("VCS_CLIENTS_GITHUB_GRAPHQL", default=False),
+}
+
+# Public repositories and issues endpoints responses cache (invalidated by the version counters bumped on writes)
+RESPONSES_CACHE = {
+    "ENABLED": env.bool("RESPONSES_CACHE_ENABLED", default=False),
+    # Cached responses are invalidated by the versions, TTL only bounds the cache size
+    "TTL": env.int("RESPONSES_CACHE_TTL", default=60 * 60),
+}
+
+# Serialize repositories and issues lists from values() rows and render them with orjson
+FAST_LIST_RESPONSES = env.bool("FAST_LIST_RESPONSES", default=False)
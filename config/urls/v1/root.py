@@ -1,6 +1,7 @@
 from rest_framework_nested import routers
 from django.urls import path, include
 
+from openwiden import views
 from openwiden.repositories import views as repository_views
 from openwiden.users import views as users_views
 from openwiden.webhooks import urls as webhook_urls
@@ -13,6 +14,7 @@ router = routers.DefaultRouter()
 router.register("repositories", repository_views.Repository, basename="repository")
 repository_router = routers.NestedSimpleRouter(router, "repositories", lookup="repository")
 repository_router.register("issues", repository_views.Issue, basename="repository-issue")
+router.register("issues", repository_views.IssueFeed, basename="issue")
 router.register("user/repositories", repository_views.UserRepositories, basename="user-repository")
 
 # Users
@@ -27,7 +29,9 @@ auth_urlpatterns = [
 
 urlpatterns = [
     path("webhooks/", include(webhook_urls, namespace="webhooks")),
+    path("issues/search/", repository_views.issue_search_view, name="issue-search"),
     path("programming_languages/", repository_views.programming_languages_view, name="programming_languages"),
+    path("metrics/", views.metrics_view, name="metrics"),
 ]
 
 urlpatterns += auth_urlpatterns
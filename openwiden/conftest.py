@@ -1,4 +1,7 @@
 import socket
+from copy import deepcopy
+from typing import Union
+from unittest import mock
 
 import pytest
 from django.contrib.auth.models import AnonymousUser
@@ -21,6 +24,22 @@ from openwiden.repositories.tests import factories as repo_factories
 fake = Faker()
 
 
+@pytest.fixture()
+def create_mock_response():
+    def _create_mock_response(
+        data: Union[list, dict] = None, status_code: int = 200, headers: dict = None, links: dict = None, **kwargs
+    ) -> mock.MagicMock:
+        return mock.MagicMock(
+            json=mock.MagicMock(return_value=deepcopy(data)),
+            status_code=status_code,
+            headers=headers or {},
+            links=links or {},
+            **kwargs,
+        )
+
+    return _create_mock_response
+
+
 @pytest.fixture(autouse=True)
 def media_storage(settings, tmpdir):
     settings.MEDIA_ROOT = tmpdir.strpath
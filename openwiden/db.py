@@ -0,0 +1,58 @@
+from typing import List, Sequence, Tuple, Type
+
+from django.db import connection, models
+
+
+def bulk_upsert(
+    *,
+    model: Type[models.Model],
+    rows: List[dict],
+    conflict_fields: Sequence[str],
+    update_fields: Sequence[str],
+    version_field: str = None,
+) -> Tuple[int, int]:
+    """
+    Inserts rows or updates existed ones (by conflict fields) with a single INSERT ... ON CONFLICT DO UPDATE query.
+    Every row should contain values for the same fields (field names or attnames for foreign keys).
+    If version field is specified, existed rows are updated only with the same or newer version values,
+    so stale rows (e.g. written concurrently in the other order) do not overwrite newer data.
+    Returns created and updated rows count.
+    """
+    if not rows:
+        return 0, 0
+
+    # Postgres cannot update the same row twice in one statement, so the last row for a conflict key wins
+    rows = list({tuple(row[f] for f in conflict_fields): row for row in rows}.values())
+
+    opts = model._meta
+    fields = [opts.get_field(name) for name in rows[0]]
+    quote_name = connection.ops.quote_name
+    conflict_columns = [opts.get_field(name).column for name in conflict_fields]
+    update_columns = [opts.get_field(name).column for name in update_fields]
+
+    condition = ""
+    if version_field is not None:
+        version_column = quote_name(opts.get_field(version_field).column)
+        condition = f" WHERE EXCLUDED.{version_column} >= {quote_name(opts.db_table)}.{version_column}"
+
+    sql = (
+        "INSERT INTO {table} ({columns}) VALUES {values} "
+        "ON CONFLICT ({conflict}) DO UPDATE SET {update}{condition} "
+        "RETURNING (xmax = 0)"
+    ).format(
+        table=quote_name(opts.db_table),
+        columns=", ".join(quote_name(f.column) for f in fields),
+        values=", ".join(["({})".format(", ".join(["%s"] * len(fields)))] * len(rows)),
+        conflict=", ".join(quote_name(c) for c in conflict_columns),
+        update=", ".join(f"{quote_name(c)} = EXCLUDED.{quote_name(c)}" for c in update_columns),
+        condition=condition,
+    )
+    params = [field.get_db_prep_save(row[name], connection) for row in rows for name, field in zip(rows[0], fields)]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        # Rows skipped by the version condition are not returned
+        results = cursor.fetchall()
+        created_count = sum(1 for (created,) in results if created)
+
+    return created_count, len(results) - created_count
@@ -1,14 +1,17 @@
-from typing import Tuple
+from typing import Tuple, Dict, Iterable
+
+from django.db.models import Count, Max, Q
 
 from openwiden import enums, vcs_clients
 from openwiden.organizations import models, exceptions
+from openwiden.repositories import cache
 from openwiden.users import models as users_models
 
 
 def sync_github_organization(
     *, organization: vcs_clients.github.models.Organization,
 ) -> Tuple[models.Organization, bool]:
-    return models.Organization.objects.update_or_create(
+    instance, created = models.Organization.objects.update_or_create(
         vcs=enums.VersionControlService.GITHUB,
         remote_id=organization.organization_id,
         defaults=dict(
@@ -19,12 +22,16 @@ def sync_github_organization(
             created_at=organization.created_at,
         ),
     )
+    # Organization is a part of the cached repositories responses (new ones are not referenced yet)
+    if not created:
+        cache.bump_version()
+    return instance, created
 
 
 def sync_gitlab_organization(
     *, organization: vcs_clients.gitlab.models.Organization,
 ) -> Tuple[models.Organization, bool]:
-    return models.Organization.objects.update_or_create(
+    instance, created = models.Organization.objects.update_or_create(
         vcs=enums.VersionControlService.GITLAB,
         remote_id=organization.organization_id,
         defaults=dict(
@@ -35,6 +42,10 @@ def sync_gitlab_organization(
             created_at=organization.created_at,
         ),
     )
+    # Organization is a part of the cached repositories responses (new ones are not referenced yet)
+    if not created:
+        cache.bump_version()
+    return instance, created
 
 
 def sync_organization_membership(
@@ -53,3 +64,61 @@ def sync_organization_membership(
     return models.Member.objects.update_or_create(
         organization=organization, vcs_account=vcs_account, defaults=dict(is_admin=is_admin),
     )
+
+
+def get_or_create_organizations(*, vcs: str, organizations: Dict[int, str]) -> Dict[int, models.Organization]:
+    """
+    Returns organizations by remote id for the specified remote ids and names.
+    Missed organizations are created in bulk, existed organizations are not updated.
+    """
+    qs = models.Organization.objects.filter(vcs=vcs, remote_id__in=organizations.keys())
+    organizations_by_remote_id = {organization.remote_id: organization for organization in qs}
+    missed_remote_ids = organizations.keys() - organizations_by_remote_id.keys()
+
+    if missed_remote_ids:
+        models.Organization.objects.bulk_create(
+            [
+                models.Organization(vcs=vcs, remote_id=remote_id, name=organizations[remote_id])
+                for remote_id in missed_remote_ids
+            ],
+            ignore_conflicts=True,
+        )
+        # Query created organizations again, because some of them could be created concurrently
+        qs = models.Organization.objects.filter(vcs=vcs, remote_id__in=missed_remote_ids)
+        organizations_by_remote_id.update({organization.remote_id: organization for organization in qs})
+
+    return organizations_by_remote_id
+
+
+def create_organizations_memberships(
+    *, organizations: Iterable[models.Organization], vcs_account: users_models.VCSAccount,
+) -> int:
+    """
+    Creates VCS account membership for every organization, where VCS account is not a member yet.
+    Returns created memberships count.
+    """
+    organizations_ids = {organization.id for organization in organizations}
+    if not organizations_ids:
+        return 0
+
+    # Resolve existed memberships and members order for every organization with a single query
+    members_stats = {
+        stats["organization_id"]: stats
+        for stats in models.Member.objects.filter(organization_id__in=organizations_ids)
+        .values("organization_id")
+        .annotate(max_order=Max("_order"), vcs_account_memberships=Count("id", filter=Q(vcs_account=vcs_account)))
+    }
+
+    memberships = []
+    for organization_id in organizations_ids:
+        stats = members_stats.get(organization_id)
+        if stats is None:
+            memberships.append(models.Member(organization_id=organization_id, vcs_account=vcs_account, _order=0))
+        elif stats["vcs_account_memberships"] == 0:
+            memberships.append(
+                models.Member(organization_id=organization_id, vcs_account=vcs_account, _order=stats["max_order"] + 1)
+            )
+
+    models.Member.objects.bulk_create(memberships, ignore_conflicts=True)
+
+    return len(memberships)
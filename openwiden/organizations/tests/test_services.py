@@ -0,0 +1,59 @@
+from unittest import mock
+
+import pytest
+
+from openwiden import enums
+from openwiden.organizations import services, models
+from openwiden.repositories import cache
+from openwiden.vcs_clients.github import models as github_models
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_or_create_organizations(create_org, django_assert_num_queries):
+    existed = create_org(vcs=enums.VersionControlService.GITHUB, remote_id=1, name="existed")
+
+    with django_assert_num_queries(3):
+        organizations = services.get_or_create_organizations(
+            vcs=enums.VersionControlService.GITHUB, organizations={1: "renamed", 2: "new"},
+        )
+
+    assert organizations[1].id == existed.id
+    assert organizations[1].name == "existed"
+    assert organizations[2].name == "new"
+    assert models.Organization.objects.filter(vcs=enums.VersionControlService.GITHUB, remote_id=2).exists()
+
+
+def test_create_organizations_memberships(create_org, create_member, vcs_account, django_assert_num_queries):
+    member_org = create_org()
+    create_member(organization=member_org, vcs_account=vcs_account)
+    other_members_org = create_org()
+    create_member(organization=other_members_org)
+    new_org = create_org()
+
+    with django_assert_num_queries(2):
+        created_count = services.create_organizations_memberships(
+            organizations=[member_org, other_members_org, new_org], vcs_account=vcs_account,
+        )
+
+    assert created_count == 2
+    assert models.Member.objects.filter(vcs_account=vcs_account).count() == 3
+    assert models.Member.objects.get(organization=other_members_org, vcs_account=vcs_account)._order == 1
+
+
+@mock.patch.object(cache, "bump_version")
+def test_sync_github_organization_bumps_responses_version(patched_bump_version, create_org):
+    existed = create_org(vcs=enums.VersionControlService.GITHUB, remote_id=1, name="existed")
+    organization_data = github_models.Organization(
+        login="renamed",
+        organization_id=existed.remote_id,
+        html_url="https://github.com/renamed",
+        avatar_url="https://github.com/renamed.png",
+        description="",
+        created_at="2020-08-01T19:46:03Z",
+    )
+
+    organization, created = services.sync_github_organization(organization=organization_data)
+
+    assert (organization.name, created) == ("renamed", False)
+    patched_bump_version.assert_called_once_with()
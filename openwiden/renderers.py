@@ -0,0 +1,23 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(value) -> str:
+    # Types, that are not supported by orjson natively (decimals, lazy translation strings) are rendered as strings
+    return str(value)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer, that uses orjson (native UUID and datetime serialization) instead of the stdlib json module.
+    Datetimes are rendered in the same format as DRF does for UTC ("Z" suffix).
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
@@ -8,3 +8,6 @@ class RepositoriesConfig(BaseAppConfig):
     label = "repositories"
     verbose_name = _("repositories")
     unique_id = 2
+
+    def ready(self):
+        from . import receivers  # noqa: F401
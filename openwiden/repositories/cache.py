@@ -0,0 +1,108 @@
+import json
+import time
+from hashlib import sha1
+from logging import getLogger
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.utils.encoders import JSONEncoder
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "repositories:responses"
+
+# Global version is bumped on repositories writes and is a part of every cached response key,
+# repository version is bumped on the repository issues writes and is a part of the issues responses keys.
+# Missing versions (e.g. evicted or lost on Redis restart) are seeded with the current time in microseconds,
+# so versions, that were used before, are not reproduced.
+GLOBAL_VERSION_KEY = f"{KEY_PREFIX}:version"
+REPOSITORY_VERSION_KEY = f"{KEY_PREFIX}:version:{{repository_id}}"
+
+
+def get_version(*, repository_id: str = None) -> Optional[str]:
+    """
+    Returns current version of the cached responses (global or global and repository one) or None,
+    if it's not available.
+    """
+    keys = [GLOBAL_VERSION_KEY]
+    if repository_id is not None:
+        keys.append(REPOSITORY_VERSION_KEY.format(repository_id=repository_id))
+
+    try:
+        redis = get_redis_connection()
+        versions = redis.mget(keys)
+        if None in versions:
+            pipeline = redis.pipeline()
+            epoch = _get_epoch()
+            for key, version in zip(keys, versions):
+                if version is None:
+                    pipeline.set(key, epoch, nx=True)
+            pipeline.mget(keys)
+            versions = pipeline.execute()[-1]
+    except RedisError as e:
+        log.warning(f"[Responses cache] failed to get version: {e}")
+        return None
+
+    if None in versions:
+        return None
+    return ".".join(version.decode() for version in versions)
+
+
+def _get_epoch() -> int:
+    return time.time_ns() // 1000
+
+
+def _bump_version(repository_id: Optional[str]) -> None:
+    if repository_id is None:
+        key = GLOBAL_VERSION_KEY
+    else:
+        key = REPOSITORY_VERSION_KEY.format(repository_id=repository_id)
+
+    try:
+        pipeline = get_redis_connection().pipeline()
+        pipeline.set(key, _get_epoch(), nx=True)
+        pipeline.incr(key)
+        pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[Responses cache] failed to bump version {key}: {e}")
+
+
+def bump_version(*, repository_id: str = None) -> None:
+    """
+    Invalidates all cached responses (or the repository issues ones, if repository id is specified).
+    Version is bumped after the current transaction commit, so the old data could not be cached with
+    the new version.
+    """
+    repository_id = None if repository_id is None else str(repository_id)
+    transaction.on_commit(lambda: _bump_version(repository_id))
+
+
+def get_response_key(*, scope: str, version: str, params: dict) -> str:
+    """
+    Returns cached response key by the scope (view and action), version and request params.
+    Params are normalised: keys and values are sorted. Empty params are kept, because they could change
+    the response (e.g. empty cursor switches to the keyset pagination).
+    """
+    normalized_params = sorted((key, sorted(values)) for key, values in params.items())
+    params_hash = sha1(json.dumps(normalized_params).encode()).hexdigest()
+    return f"{KEY_PREFIX}:{scope}:{version}:{params_hash}"
+
+
+def get_response(key: str) -> Optional[object]:
+    try:
+        value = get_redis_connection().get(key)
+    except RedisError as e:
+        log.warning(f"[Responses cache] failed to get cached response: {e}")
+        return None
+
+    return json.loads(value) if value else None
+
+
+def set_response(key: str, data) -> None:
+    try:
+        get_redis_connection().setex(key, settings.RESPONSES_CACHE["TTL"], json.dumps(data, cls=JSONEncoder))
+    except RedisError as e:
+        log.warning(f"[Responses cache] failed to cache response: {e}")
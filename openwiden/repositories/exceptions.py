@@ -30,3 +30,8 @@ class NotAddedRepositoryCannotBeRemoved(RepositoryException):
 class RepositoryDoesNotExist(RepositoryException):
     error_message = messages.REPOSITORY_DOES_NOT_EXIST
     error_code = 5
+
+
+class RepositoryHasNoVCSAccount(RepositoryException):
+    error_message = messages.REPOSITORY_HAS_NO_VCS_ACCOUNT
+    error_code = 6
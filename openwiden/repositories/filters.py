@@ -2,18 +2,50 @@ from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 from django_filters.constants import EMPTY_VALUES
 
-from openwiden.repositories import models
+from openwiden.repositories import models, selectors
 from openwiden import enums
 
 
-class ProgrammingLanguagesFilter(filters.Filter):
+class AnyOfFilter(filters.Filter):
+    """
+    Filters by any of the comma separated values.
+    """
+
+    def filter(self, qs: QuerySet, value: str) -> QuerySet:
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter(**{f"{self.field_name}__{self.lookup_expr}": value.split(",")})
+
+
+class ProgrammingLanguagesFilter(AnyOfFilter):
+    """
+    Orders repositories by open issues count, unless they are ordered by the search rank.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        # has_any_keys (?| operator) is supported by the GIN index, unlike keys__overlap (akeys(...) && array)
+        kwargs.setdefault("lookup_expr", "has_any_keys")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs: "QuerySet[models.Repository]", value: str) -> "QuerySet[models.Repository]":
+        if value in EMPTY_VALUES:
+            return qs
+        qs = super().filter(qs, value)
+        if self.parent.data.get("search"):
+            return qs
+        return qs.order_by("-open_issues_count")
+
+
+class SearchFilter(filters.CharFilter):
     def filter(self, qs: "QuerySet[models.Repository]", value: str) -> "QuerySet[models.Repository]":
         if value in EMPTY_VALUES:
             return qs
-        return qs.filter(**{f"{self.field_name}__keys__overlap": value.split(",")}).order_by("-open_issues_count")
+        return selectors.search_repositories(queryset=qs, text=value)
 
 
 class Repository(filters.FilterSet):
+    search = SearchFilter(help_text="Full text search by name and description, results are ordered by the rank.")
+
     vcs = filters.ChoiceFilter(choices=enums.VersionControlService.choices)
 
     stars_count_gte = filters.NumberFilter(field_name="stars_count", lookup_expr="gte")
@@ -28,6 +60,7 @@ class Repository(filters.FilterSet):
     class Meta:
         model = models.Repository
         fields = (
+            "search",
             "vcs",
             "stars_count_gte",
             "open_issues_count_gte",
@@ -36,3 +69,17 @@ class Repository(filters.FilterSet):
             "updated_at",
             "programming_languages",
         )
+
+
+class Issue(filters.FilterSet):
+    labels = AnyOfFilter(lookup_expr="overlap", help_text="Comma separated labels, any of them should match.")
+    programming_languages = AnyOfFilter(
+        field_name="repository__programming_languages",
+        lookup_expr="has_any_keys",
+        help_text="Comma separated repository programming languages, any of them should match.",
+    )
+    vcs = filters.ChoiceFilter(field_name="repository__vcs", choices=enums.VersionControlService.choices)
+
+    class Meta:
+        model = models.Issue
+        fields = ("labels", "programming_languages", "vcs")
@@ -0,0 +1,71 @@
+import random
+from typing import Iterator
+from uuid import uuid4
+
+from django.utils import timezone
+
+from openwiden import enums
+from openwiden.repositories import models
+from openwiden.repositories.enums import IssueState, RepositoryState
+from openwiden.users import models as users_models
+
+LANGUAGES = (
+    "Python JavaScript TypeScript Go Rust Java Kotlin Swift C C++ C# PHP Ruby Elixir Erlang Haskell Scala Clojure "
+    "Dart Lua Perl R Julia Shell Dockerfile HTML CSS Vue Svelte Nim"
+).split()
+
+# Remote ids of the synthetic objects start from this value, so they do not conflict with the real ones
+REMOTE_ID_OFFSET = 1_000_000_000
+
+
+class Rollback(Exception):
+    """
+    Raised to roll back the transaction with the synthetic objects.
+    """
+
+
+def generate_repositories(
+    count: int, added_ratio: float, owner: users_models.VCSAccount = None,
+) -> Iterator[models.Repository]:
+    now = timezone.now()
+    for i in range(count):
+        yield models.Repository(
+            id=uuid4(),
+            vcs=enums.VersionControlService.GITHUB,
+            remote_id=REMOTE_ID_OFFSET + i,
+            name=f"repository-{i}",
+            url=f"https://github.com/benchmark/repository-{i}",
+            owner=owner,
+            open_issues_count=random.randint(0, 1000),
+            stars_count=random.randint(0, 10000),
+            created_at=now,
+            updated_at=now,
+            programming_languages={
+                name: str(random.randint(1, 100)) for name in random.sample(LANGUAGES, random.randint(1, 4))
+            },
+            state=RepositoryState.ADDED if random.random() < added_ratio else RepositoryState.INITIAL,
+        )
+
+
+def generate_issues(count: int, repository: models.Repository) -> Iterator[models.Issue]:
+    now = timezone.now()
+    for i in range(count):
+        yield models.Issue(
+            id=uuid4(),
+            repository=repository,
+            remote_id=REMOTE_ID_OFFSET + i,
+            title=f"Issue {i}",
+            description="Issue description. " * random.randint(1, 50),
+            state=IssueState.OPEN,
+            labels=random.sample(["bug", "good first issue", "help wanted", "documentation"], random.randint(0, 2)),
+            url=f"https://github.com/benchmark/repository/issues/{i}",
+            created_at=now,
+            updated_at=now,
+        )
+
+
+def create_vcs_account() -> users_models.VCSAccount:
+    user = users_models.User.objects.create(username=f"benchmark-{uuid4()}")
+    return users_models.VCSAccount.objects.create(
+        user=user, vcs=enums.VersionControlService.GITHUB, remote_id=REMOTE_ID_OFFSET, login="benchmark",
+    )
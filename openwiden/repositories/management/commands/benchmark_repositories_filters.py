@@ -0,0 +1,75 @@
+from typing import Iterator, List, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from openwiden.repositories import filters, models, selectors
+from ._synthetic import Rollback, generate_repositories
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates synthetic repositories in a transaction (rolled back at the end) and prints query plans "
+        "and execution times of the repositories list filters with index scans disabled and enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repositories", type=int, default=100_000, help="Synthetic repositories count.")
+        parser.add_argument("--added-ratio", type=float, default=0.2, help="Ratio of the added repositories.")
+        parser.add_argument("--languages", default="Rust,Elixir", help="Programming languages filter value.")
+
+    def _explain(self, queryset: QuerySet) -> Tuple[float, List[str]]:
+        """
+        Returns execution time (ms) and scan nodes of the query plan.
+        """
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0][0]
+
+        def get_scan_nodes(node: dict) -> Iterator[str]:
+            if "Scan" in node["Node Type"]:
+                yield " ".join(filter(None, [node["Node Type"], node.get("Index Name")]))
+            for child in node.get("Plans", []):
+                yield from get_scan_nodes(child)
+
+        return plan["Execution Time"], list(get_scan_nodes(plan["Plan"]))
+
+    def _benchmark(self, name: str, queryset: QuerySet) -> None:
+        for index_scans_enabled in (False, True):
+            with connection.cursor() as cursor:
+                setting = "on" if index_scans_enabled else "off"
+                cursor.execute(f"SET LOCAL enable_indexscan = {setting}")
+                cursor.execute(f"SET LOCAL enable_bitmapscan = {setting}")
+
+            execution_time, scan_nodes = self._explain(queryset)
+            self.stdout.write(
+                f"{name} (index scans {'enabled' if index_scans_enabled else 'disabled'}): "
+                f"{execution_time:.2f} ms, {', '.join(scan_nodes)}"
+            )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.stdout.write(f"Creating {options['repositories']} synthetic repositories...")
+                models.Repository.objects.bulk_create(
+                    generate_repositories(options["repositories"], options["added_ratio"]), batch_size=5000,
+                )
+
+                with connection.cursor() as cursor:
+                    cursor.execute(f"ANALYZE {connection.ops.quote_name(models.Repository._meta.db_table)}")
+
+                added_repositories = selectors.get_added_repositories()
+                filtered_repositories = filters.Repository(
+                    data={"programming_languages": options["languages"]}, queryset=added_repositories,
+                ).qs
+
+                self._benchmark("Programming languages filter", filtered_repositories)
+                self._benchmark("Programming languages filter, first page", filtered_repositories[:10])
+                first_page = added_repositories.order_by("-open_issues_count")[:10]
+                self._benchmark("Added repositories, first page", first_page)
+
+                raise Rollback()
+        except Rollback:
+            self.stdout.write("Synthetic repositories are rolled back.")
@@ -0,0 +1,78 @@
+import time
+from typing import Callable, List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import QuerySet
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ModelSerializer
+
+from openwiden.renderers import ORJSONRenderer
+from openwiden.repositories import models, serializers
+from ._synthetic import Rollback, create_vcs_account, generate_issues, generate_repositories
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates synthetic repositories and issues in a transaction (rolled back at the end) and compares "
+        "throughput and latency of the list pages serialization and rendering: model serializers with the "
+        "JSON renderer and values() rows with the orjson renderer."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=1000, help="Rows count per page.")
+        parser.add_argument("--iterations", type=int, default=50, help="Serialized pages count per path.")
+
+    def _serialize(self, serializer_class: ModelSerializer, queryset: QuerySet, page_size: int) -> bytes:
+        data = serializer_class(queryset[:page_size], many=True).data
+        return JSONRenderer().render(data)
+
+    def _serialize_values(self, serializer_class: ModelSerializer, queryset: QuerySet, page_size: int) -> bytes:
+        rows = serializer_class.get_values_queryset(queryset)[:page_size]
+        return ORJSONRenderer().render([serializer_class.to_values_representation(row) for row in rows])
+
+    def _benchmark(self, name: str, serialize: Callable[[], bytes], page_size: int, iterations: int) -> None:
+        timings: List[float] = []
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            serialize()
+            timings.append(time.perf_counter() - started_at)
+
+        timings.sort()
+        p50 = timings[len(timings) // 2]
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        throughput = page_size * iterations / sum(timings)
+        self.stdout.write(f"{name}: {throughput:.0f} rows/s, p50 {p50 * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms",)
+
+    def handle(self, *args, **options):
+        page_size, iterations = options["page_size"], options["iterations"]
+
+        try:
+            with transaction.atomic():
+                self.stdout.write(f"Creating {page_size} synthetic repositories and issues...")
+                owner = create_vcs_account()
+                repositories = models.Repository.objects.bulk_create(
+                    generate_repositories(page_size, added_ratio=1, owner=owner), batch_size=5000,
+                )
+                models.Issue.objects.bulk_create(generate_issues(page_size, repositories[0]), batch_size=5000)
+
+                repositories_queryset = models.Repository.objects.filter(owner=owner).select_related(
+                    "owner", "organization"
+                )
+                issues_queryset = models.Issue.objects.filter(repository=repositories[0])
+
+                for name, serializer_class, queryset in (
+                    ("Repositories", serializers.Repository, repositories_queryset),
+                    ("Issues", serializers.Issue, issues_queryset),
+                ):
+                    for path, serialize in (("serializer", self._serialize), ("values", self._serialize_values)):
+                        self._benchmark(
+                            f"{name} ({path})",
+                            lambda: serialize(serializer_class, queryset, page_size),
+                            page_size,
+                            iterations,
+                        )
+
+                raise Rollback()
+        except Rollback:
+            self.stdout.write("Synthetic repositories and issues are rolled back.")
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from openwiden.exceptions import ServiceException
+from openwiden.repositories import selectors, services
+from openwiden.vcs_clients.exceptions import RateLimitExceeded
+
+
+class Command(BaseCommand):
+    help = "Syncs issues of the added repositories, that were updated since the last sync."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full", action="store_true", help="Sync all repository issues instead of the updated ones.",
+        )
+
+    def handle(self, *args, **options):
+        for repository in selectors.get_added_repositories().iterator():
+            try:
+                created, updated = services.sync_repository_issues(repository=repository, full=options["full"])
+            except RateLimitExceeded as e:
+                # Repositories of the other accounts are synced, skipped ones are synced by the next run
+                self.stderr.write(f"{repository} ({repository.id}): sync skipped: {e}")
+            except ServiceException as e:
+                self.stderr.write(f"{repository} ({repository.id}): sync failed: {e.json_dumped_detail}")
+            except ValueError as e:
+                self.stderr.write(f"{repository} ({repository.id}): sync failed: {e}")
+            else:
+                self.stdout.write(f"{repository} ({repository.id}): {created} created, {updated} updated")
@@ -5,6 +5,7 @@ REPOSITORY_CANNOT_BE_ADDED_DUE_TO_STATE = _("Repository cannot be added due to {
 REPOSITORY_ALREADY_REMOVED = _("Repository already removed.")
 NOT_ADDED_REPOSITORY_CANNOT_BE_REMOVED = _("Not added repository cannot be removed.")
 REPOSITORY_DOES_NOT_EXIST = _("Repository with id {id} does not exist.")
+REPOSITORY_HAS_NO_VCS_ACCOUNT = _("Repository with id {id} has no version control service account to sync with.")
 
 REPOSITORY_IS_ADDED = _("Repository is added.")
 REPOSITORY_IS_REMOVED = _("Repository is removed.")
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0007_auto_20200927_0813'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='repository',
+            name='issues_synced_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='issues synced at'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0008_repository_issues_synced_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['repository', '-created_at', '-id'], name='issue_repository_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repository',
+            index=models.Index(fields=['state', '-open_issues_count', '-id'], name='repository_state_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:18
+
+from django.db import migrations, models
+import model_utils.fields
+import uuid
+
+
+def fill_programming_languages(apps, schema_editor):
+    Repository = apps.get_model("repositories", "Repository")
+    ProgrammingLanguage = apps.get_model("repositories", "ProgrammingLanguage")
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT language, COUNT(*) FROM {} CROSS JOIN LATERAL skeys(programming_languages) AS language "
+            "WHERE state = 'added' GROUP BY language".format(schema_editor.quote_name(Repository._meta.db_table))
+        )
+        ProgrammingLanguage.objects.bulk_create(
+            [ProgrammingLanguage(name=name, repositories_count=count) for name, count in cursor.fetchall()]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgrammingLanguage',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='name')),
+                ('repositories_count', models.PositiveIntegerField(default=0, verbose_name='repositories count')),
+            ],
+            options={
+                'verbose_name': 'programming language',
+                'verbose_name_plural': 'programming languages',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.RunPython(fill_programming_languages, migrations.RunPython.noop),
+    ]
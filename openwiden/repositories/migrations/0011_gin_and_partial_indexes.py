@@ -0,0 +1,30 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:19
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0010_programminglanguage'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='repository',
+            name='repository_state_keyset_idx',
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['labels'], name='issue_labels_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repository',
+            index=models.Index(condition=models.Q(state='added'), fields=['-open_issues_count', '-id'], name='repository_added_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repository',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(state='added'), fields=['programming_languages'], name='repository_added_langs_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+def create_search_vector_trigger(table: str, title_column: str, description_column: str) -> migrations.RunSQL:
+    """
+    Search vector is updated by a trigger, so bulk upserts of the sync are covered as well.
+    """
+    function = f"{table}_search_vector_update"
+    return migrations.RunSQL(
+        sql=f"""
+            CREATE FUNCTION {function}() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('pg_catalog.english', coalesce(NEW.{title_column}, '')), 'A') ||
+                    setweight(to_tsvector('pg_catalog.english', coalesce(NEW.{description_column}, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {title_column}, {description_column} ON {table}
+            FOR EACH ROW EXECUTE PROCEDURE {function}();
+
+            UPDATE {table} SET {title_column} = {title_column};
+        """,
+        reverse_sql=f"""
+            DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+            DROP FUNCTION IF EXISTS {function}();
+        """,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0011_gin_and_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='search vector'),
+        ),
+        migrations.AddField(
+            model_name='repository',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='search vector'),
+        ),
+        create_search_vector_trigger('repositories_repository', 'name', 'description'),
+        create_search_vector_trigger('repositories_issue', 'title', 'description'),
+        migrations.AddIndex(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='issue_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repository',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(state='added'), fields=['search_vector'], name='repository_added_search_idx'),
+        ),
+    ]
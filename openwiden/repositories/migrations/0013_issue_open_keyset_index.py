@@ -0,0 +1,17 @@
+# Generated by Django 3.0.7 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('repositories', '0012_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(state='open'), fields=['-created_at', '-id'], name='issue_open_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,214 @@
+from calendar import timegm
+from hashlib import sha1
+from typing import Callable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from openwiden.renderers import ORJSONRenderer
+from . import cache
+
+
+class ResponseVersionMixin:
+    """
+    Provides version of the view responses, that is bumped on the related data writes (see cache.bump_version).
+    """
+
+    def get_cache_repository_id(self) -> Optional[str]:
+        return None
+
+    def get_response_version(self) -> Optional[str]:
+        # View instance is created per request, so version is requested once
+        if not hasattr(self, "_response_version"):
+            self._response_version = cache.get_version(repository_id=self.get_cache_repository_id())
+        return self._response_version
+
+    def get_response_key(self, request: Request, version: str, **kwargs) -> str:
+        # Host is a part of the key, because pagination links are absolute
+        params = dict(request.query_params.lists(), host=[request.get_host()])
+        params.update((key, [str(value)]) for key, value in kwargs.items())
+        return cache.get_response_key(scope=f"{self.basename}:{self.action}", version=version, params=params)
+
+
+class CachedResponseMixin(ResponseVersionMixin):
+    """
+    Caches list and retrieve responses data in Redis by the request params and the responses version,
+    so cached responses are invalidated exactly.
+    """
+
+    def _get_cached_response(self, handler: Callable, request: Request, *args, **kwargs) -> Response:
+        if not settings.RESPONSES_CACHE["ENABLED"]:
+            return handler(request, *args, **kwargs)
+
+        version = self.get_response_version()
+        if version is None:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_key(request, version, **kwargs)
+        data = cache.get_response(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set_response(key, response.data)
+        return response
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self._get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self._get_cached_response(super().retrieve, request, *args, **kwargs)
+
+
+class ConditionalResponseMixin(ResponseVersionMixin):
+    """
+    Handles conditional list and retrieve requests: not modified responses (304) are returned without
+    serialization. ETag is calculated from the responses version and the request params. If version
+    is not available, ETag and Last-Modified are calculated from the objects count and max updated_at.
+    """
+
+    def get_validators(self, request: Request, **kwargs) -> Tuple[str, Optional[int]]:
+        version = self.get_response_version()
+        if version is not None:
+            return quote_etag(sha1(self.get_response_key(request, version, **kwargs).encode()).hexdigest()), None
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            except DjangoValidationError:
+                # Malformed lookup value (e.g. UUID)
+                raise NotFound()
+        aggregation = queryset.order_by().aggregate(count=Count("pk"), last_modified=Max("updated_at"))
+
+        last_modified = aggregation["last_modified"]
+        value = f"{request.get_full_path()}:{aggregation['count']}:{last_modified and last_modified.isoformat()}"
+        etag = quote_etag(sha1(value.encode()).hexdigest())
+        return etag, last_modified and timegm(last_modified.utctimetuple())
+
+    def _get_conditional_response(self, handler: Callable, request: Request, *args, **kwargs) -> Response:
+        etag, last_modified = self.get_validators(request, **kwargs)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self._get_conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self._get_conditional_response(super().retrieve, request, *args, **kwargs)
+
+
+class SparseFieldsetMixin:
+    """
+    Narrows the serializer fields and the selected columns (other columns are deferred) to the fields
+    specified with "fields" query param (all by default) without fields specified with "omit" query param,
+    e.g. "?omit=description" skips large text columns.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def _get_query_param_fields(self, query_param: str) -> Tuple[str, ...]:
+        # Request is not specified on the schema generation
+        if self.request is None:
+            return ()
+        value = self.request.query_params.get(query_param, "")
+        return tuple(field for field in value.split(",") if field)
+
+    def get_sparse_fields(self) -> Optional[Tuple[str, ...]]:
+        """
+        Returns fields to serialize or None (all fields).
+        """
+        fields = self._get_query_param_fields(self.fields_query_param)
+        omit = self._get_query_param_fields(self.omit_query_param)
+        if not fields and not omit:
+            return None
+
+        available_fields = self.get_serializer_class().Meta.fields
+        for query_param, names in ((self.fields_query_param, fields), (self.omit_query_param, omit)):
+            unknown_fields = set(names) - set(available_fields)
+            if unknown_fields:
+                raise ValidationError({query_param: f"Unknown fields: {', '.join(sorted(unknown_fields))}."})
+
+        return tuple(field for field in available_fields if field in (fields or available_fields) and field not in omit)
+
+    def get_pagination_fields(self) -> Tuple[str, ...]:
+        """
+        Returns fields, that are used by the pagination (could not be deferred).
+        """
+        pagination_class = getattr(self.pagination_class, "keyset_pagination_class", self.pagination_class)
+        ordering_field = getattr(pagination_class, "ordering_field", None)
+        return ("id", ordering_field) if ordering_field else ("id",)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_sparse_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        queryset = super().filter_queryset(queryset)
+
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+
+        # Relations are not deferred, since they could be selected with select_related
+        required_fields = set(fields + self.get_pagination_fields())
+        deferred_fields = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if not field.is_relation and not field.primary_key and field.name not in required_fields
+        ]
+        return queryset.defer(*deferred_fields)
+
+
+class ValuesListMixin(SparseFieldsetMixin):
+    """
+    Fast list action path (if enabled in settings): rows are serialized from values() with the serializer
+    class values mapping and rendered with orjson.
+    """
+
+    def is_values_list(self) -> bool:
+        return settings.FAST_LIST_RESPONSES and self.action == "list"
+
+    def get_renderers(self) -> List[BaseRenderer]:
+        renderers = super().get_renderers()
+        if self.is_values_list():
+            renderers.insert(0, ORJSONRenderer())
+        return renderers
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        if not self.is_values_list():
+            return super().list(request, *args, **kwargs)
+
+        serializer_class = self.get_serializer_class()
+        fields = self.get_sparse_fields()
+        queryset = serializer_class.get_values_queryset(
+            self.filter_queryset(self.get_queryset()), fields=fields, extra_fields=self.get_pagination_fields(),
+        )
+
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+        data = [serializer_class.to_values_representation(row, fields=fields) for row in rows]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
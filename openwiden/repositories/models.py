@@ -1,4 +1,6 @@
 from django.contrib.postgres.fields import ArrayField, HStoreField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from model_utils.models import UUIDModel
 from django.utils.translation import gettext_lazy as _
@@ -8,6 +10,9 @@ from openwiden.organizations.models import Organization
 from openwiden.users.models import VCSAccount
 from openwiden.repositories import enums as repo_enums
 
+# Text search configuration of the search vectors, that are updated by the DB triggers (see migration 0012)
+SEARCH_CONFIG = "english"
+
 
 class Repository(UUIDModel):
     vcs = models.CharField(_("version control service"), max_length=50, choices=enums.VersionControlService.choices)
@@ -38,6 +43,12 @@ class Repository(UUIDModel):
 
     programming_languages = HStoreField(verbose_name=_("programming languages"), blank=True, null=True)
 
+    # Watermark for the incremental issues sync: issues updated after this time are synced on the next sync
+    issues_synced_at = models.DateTimeField(_("issues synced at"), blank=True, null=True)
+
+    # Weighted name (A) and description (B) search vector
+    search_vector = SearchVectorField(_("search vector"), blank=True, null=True, editable=False)
+
     state = models.CharField(
         max_length=13,
         choices=repo_enums.RepositoryState.choices,
@@ -50,6 +61,26 @@ class Repository(UUIDModel):
         verbose_name = _("repository")
         verbose_name_plural = _("repositories")
         constraints = (models.UniqueConstraint(fields=("vcs", "remote_id",), name="unique_repository",),)
+        indexes = (
+            # Keyset pagination of the added repositories list
+            models.Index(
+                fields=("-open_issues_count", "-id"),
+                name="repository_added_keyset_idx",
+                condition=models.Q(state=repo_enums.RepositoryState.ADDED),
+            ),
+            # Programming languages filter (?| operator) of the added repositories
+            GinIndex(
+                fields=("programming_languages",),
+                name="repository_added_langs_idx",
+                condition=models.Q(state=repo_enums.RepositoryState.ADDED),
+            ),
+            # Full text search of the added repositories
+            GinIndex(
+                fields=("search_vector",),
+                name="repository_added_search_idx",
+                condition=models.Q(state=repo_enums.RepositoryState.ADDED),
+            ),
+        )
 
     def __str__(self):
         return self.name
@@ -82,11 +113,45 @@ class Issue(UUIDModel):
     closed_at = models.DateTimeField(_("closed at"), blank=True, null=True)
     updated_at = models.DateTimeField(_("updated at"))
 
+    # Weighted title (A) and description (B) search vector
+    search_vector = SearchVectorField(_("search vector"), blank=True, null=True, editable=False)
+
     class Meta:
         ordering = ("-created_at",)
         verbose_name = _("issue")
         verbose_name_plural = _("issues")
         constraints = (models.UniqueConstraint(fields=["repository", "remote_id"], name="unique_issue"),)
+        indexes = (
+            # Keyset pagination of the repository issues list
+            models.Index(fields=("repository", "-created_at", "-id"), name="issue_repository_keyset_idx"),
+            # Keyset pagination of the open issues feed
+            models.Index(
+                fields=("-created_at", "-id"),
+                name="issue_open_keyset_idx",
+                condition=models.Q(state=repo_enums.IssueState.OPEN),
+            ),
+            # Labels filters (array containment / overlap)
+            GinIndex(fields=("labels",), name="issue_labels_idx"),
+            # Full text search
+            GinIndex(fields=("search_vector",), name="issue_search_idx"),
+        )
 
     def __str__(self):
         return self.title
+
+
+class ProgrammingLanguage(UUIDModel):
+    """
+    Programming languages of the added repositories with repositories count (kept in sync by the receivers).
+    """
+
+    name = models.CharField(_("name"), max_length=255, unique=True)
+    repositories_count = models.PositiveIntegerField(_("repositories count"), default=0)
+
+    class Meta:
+        ordering = ("name",)
+        verbose_name = _("programming language")
+        verbose_name_plural = _("programming languages")
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,194 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Union
+
+import coreapi
+import coreschema
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, QuerySet
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    Encodes datetimes with microseconds (DjangoJSONEncoder cuts them to milliseconds), otherwise rows
+    with the same milliseconds are skipped at the page boundary.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Keyset (seek) pagination: next page is selected with "(field, id) < (last field value, last id)" condition,
+    that is backed by the composite index, instead of OFFSET scan. Total count is not calculated.
+    Rows are ordered by the ordering field and the id (tie-breaker) in descending order.
+    """
+
+    ordering_field: str = None
+    page_size: int = pagination.PageNumberPagination.page_size
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 100
+    cursor_query_param: str = "cursor"
+    invalid_cursor_message: str = "Invalid cursor"
+
+    def __init__(self) -> None:
+        self.base_url: Optional[str] = None
+        self.next_position: Optional[list] = None
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def encode_cursor(self, position: list) -> str:
+        return urlsafe_b64encode(json.dumps(position, cls=CursorEncoder).encode()).decode()
+
+    def decode_cursor(self, request: Request, model: Model) -> Optional[list]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        fields = [model._meta.get_field(self.ordering_field), model._meta.pk]
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(fields):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            return [field.to_python(value) for field, value in zip(fields, position)]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_position(self, instance: Union[Model, dict]) -> list:
+        # Rows of the values() queryset are paginated as well
+        if isinstance(instance, dict):
+            return [instance[self.ordering_field], instance["id"]]
+        return [getattr(instance, self.ordering_field), instance.pk]
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> List[Model]:
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request, queryset.model)
+
+        opts = queryset.model._meta
+        queryset = queryset.order_by(f"-{self.ordering_field}", f"-{opts.pk.attname}")
+
+        if position is not None:
+            # Row values comparison uses the composite index for both columns
+            column = opts.get_field(self.ordering_field).column
+            queryset = queryset.extra(
+                where=[f'("{opts.db_table}"."{column}", "{opts.db_table}"."{opts.pk.column}") < (%s, %s)'],
+                params=position,
+            )
+
+        # Extra row is fetched to find out if there is a next page
+        results = list(queryset[: page_size + 1])
+        has_next = len(results) > page_size
+        results = results[:page_size]
+
+        self.next_position = self._get_position(results[-1]) if has_next else None
+        return results
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(OrderedDict([("next", self.get_next_link()), ("results", data)]))
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {"next": {"type": "string", "nullable": True}, "results": schema},
+        }
+
+    def get_schema_fields(self, view) -> List[coreapi.Field]:
+        return [
+            coreapi.Field(
+                name=self.cursor_query_param,
+                required=False,
+                location="query",
+                schema=coreschema.String(title="Cursor", description="Keyset pagination cursor."),
+            ),
+            coreapi.Field(
+                name=self.page_size_query_param,
+                required=False,
+                location="query",
+                schema=coreschema.Integer(title="Page size", description=f"Max {self.max_page_size}."),
+            ),
+        ]
+
+
+class PageNumberOrKeysetPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination by default and keyset pagination, if cursor query param is specified
+    (an empty cursor for the first page). Keyset pagination is not used for the search results, because
+    they are ordered by the rank.
+    """
+
+    keyset_pagination_class = KeysetPagination
+    ranked_query_params = ("search",)
+
+    def __init__(self) -> None:
+        self.keyset_pagination: Optional[KeysetPagination] = None
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> Optional[List[Model]]:
+        is_ranked = any(request.query_params.get(query_param) for query_param in self.ranked_query_params)
+        if self.keyset_pagination_class.cursor_query_param in request.query_params and not is_ranked:
+            self.keyset_pagination = self.keyset_pagination_class()
+            return self.keyset_pagination.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data) -> Response:
+        if self.keyset_pagination:
+            return self.keyset_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_fields(self, view) -> List[coreapi.Field]:
+        return super().get_schema_fields(view) + [
+            coreapi.Field(
+                name=self.keyset_pagination_class.cursor_query_param,
+                required=False,
+                location="query",
+                schema=coreschema.String(
+                    title="Cursor",
+                    description=(
+                        "Keyset pagination cursor (empty for the first page), page param is ignored. "
+                        "Search results are paginated by page number."
+                    ),
+                ),
+            ),
+        ]
+
+
+class RepositoryKeysetPagination(KeysetPagination):
+    ordering_field = "open_issues_count"
+
+
+class IssueKeysetPagination(KeysetPagination):
+    ordering_field = "created_at"
+
+
+class RepositoryPagination(PageNumberOrKeysetPagination):
+    keyset_pagination_class = RepositoryKeysetPagination
+
+
+class IssuePagination(PageNumberOrKeysetPagination):
+    keyset_pagination_class = IssueKeysetPagination
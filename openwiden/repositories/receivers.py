@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from openwiden.repositories import enums, models, services
+
+# Fields, that affect the programming languages catalogue
+PROGRAMMING_LANGUAGES_FIELDS = {"state", "programming_languages"}
+
+
+def _get_added_languages(state: str, programming_languages: dict) -> set:
+    if state == enums.RepositoryState.ADDED and programming_languages:
+        return set(programming_languages.keys())
+    return set()
+
+
+@receiver(pre_save, sender=models.Repository)
+def remember_previous_programming_languages(instance: models.Repository, update_fields=None, **kwargs) -> None:
+    instance._previous_added_languages = set()
+
+    if update_fields is not None and not PROGRAMMING_LANGUAGES_FIELDS.intersection(update_fields):
+        return None
+
+    previous = models.Repository.objects.filter(pk=instance.pk).values("state", "programming_languages").first()
+    if previous:
+        instance._previous_added_languages = _get_added_languages(**previous)
+
+
+@receiver(post_save, sender=models.Repository)
+def refresh_programming_languages_on_save(instance: models.Repository, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and not PROGRAMMING_LANGUAGES_FIELDS.intersection(update_fields):
+        return None
+
+    previous_languages = getattr(instance, "_previous_added_languages", set())
+    languages = _get_added_languages(instance.state, instance.programming_languages)
+
+    # Counts are changed only for the languages, that were added to or removed from the catalogue by this repository
+    changed_languages = previous_languages ^ languages
+    if changed_languages:
+        services.refresh_programming_languages(names=changed_languages)
+
+
+@receiver(post_delete, sender=models.Repository)
+def refresh_programming_languages_on_delete(instance: models.Repository, **kwargs) -> None:
+    languages = _get_added_languages(instance.state, instance.programming_languages)
+
+    if languages:
+        services.refresh_programming_languages(names=languages)
@@ -1,20 +1,23 @@
-from typing import Set
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, QuerySet, Q
 
-from django.db.models import Func, QuerySet, Q
-
-from openwiden.users.models import User
+from openwiden.organizations.models import Member
+from openwiden.users.models import User, VCSAccount
 
 from . import models, enums, exceptions
 
 
-class HStoreSetKeys(Func):
-    function = "skeys"
-
-
 def get_added_repositories() -> "QuerySet[models.Repository]":
     return models.Repository.objects.filter(state=enums.RepositoryState.ADDED).select_related("owner", "organization")
 
 
+def get_open_issues() -> "QuerySet[models.Issue]":
+    """
+    Returns open issues of the all added repositories.
+    """
+    return models.Issue.objects.filter(state=enums.IssueState.OPEN, repository__state=enums.RepositoryState.ADDED)
+
+
 def get_repository(*, id: str) -> models.Repository:
     try:
         return models.Repository.objects.get(id=id)
@@ -30,14 +33,57 @@ def get_user_repositories(*, user: User) -> "QuerySet[models.Repository]":
     return models.Repository.objects.filter(query).select_related("owner", "organization")
 
 
-def get_programming_languages() -> Set[str]:
+def find_repository_vcs_account(*, repository: models.Repository) -> VCSAccount:
+    """
+    Returns version control service account, that has access to the repository: the owner account for
+    user's repository or organization member account (admins are preferred) for organization's repository.
+    """
+    if repository.owner_id:
+        return repository.owner
+
+    member = (
+        Member.objects.filter(organization_id=repository.organization_id)
+        .select_related("vcs_account")
+        .order_by("-is_admin", "_order")
+        .first()
+    )
+    if member is None:
+        raise exceptions.RepositoryHasNoVCSAccount(id=repository.id)
+
+    return member.vcs_account
+
+
+def get_programming_languages() -> "QuerySet[models.ProgrammingLanguage]":
+    """
+    Returns programming languages of the all added repositories with repositories count.
+    """
+    return models.ProgrammingLanguage.objects.filter(repositories_count__gt=0).order_by("name")
+
+
+def get_search_query(*, text: str) -> SearchQuery:
+    return SearchQuery(text, config=models.SEARCH_CONFIG)
+
+
+def search_repositories(*, queryset: "QuerySet[models.Repository]", text: str) -> "QuerySet[models.Repository]":
+    """
+    Returns repositories matching the search text (by name and description) ordered by the rank.
+    """
+    query = get_search_query(text=text)
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "-open_issues_count")
+    )
+
+
+def search_issues(*, text: str) -> "QuerySet[models.Issue]":
     """
-    Returns set of the unique programming languages names from the all added repositories.
+    Returns issues of the added repositories matching the search text (by title and description)
+    ordered by the rank.
     """
+    query = get_search_query(text=text)
     return (
-        models.Repository.objects.filter(state=enums.RepositoryState.ADDED)
-        .annotate(names=HStoreSetKeys("programming_languages"))
-        .order_by("names")
-        .distinct()
-        .values_list("names", flat=True)
+        models.Issue.objects.filter(repository__state=enums.RepositoryState.ADDED, search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "-created_at")
     )
@@ -1,5 +1,7 @@
 import logging
+from typing import Sequence, Tuple
 
+from django.db.models import QuerySet
 from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 
@@ -15,7 +17,43 @@ class OwnerSerializer(serializers.Serializer):
     name = serializers.CharField()
 
 
-class Repository(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Serializes only specified fields (all fields by default).
+    """
+
+    def __init__(self, *args, fields: Sequence[str] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ValuesSerializerMixin:
+    """
+    Fast serialization path for the lists: rows are selected with values() and mapped to the representation
+    as is, without the model instances and the serializer fields (values should be JSON serializable by the
+    renderer, e.g. orjson one). Only specified fields are selected (all fields by default).
+    """
+
+    @classmethod
+    def get_values_fields(cls, fields: Sequence[str] = None) -> Tuple[str, ...]:
+        return tuple(cls.Meta.fields if fields is None else fields)
+
+    @classmethod
+    def get_values_queryset(
+        cls, queryset: QuerySet, fields: Sequence[str] = None, extra_fields: Sequence[str] = (),
+    ) -> QuerySet:
+        # Extra fields are selected, but not represented (e.g. pagination fields)
+        return queryset.values(*dict.fromkeys(cls.get_values_fields(fields) + tuple(extra_fields)))
+
+    @classmethod
+    def to_values_representation(cls, row: dict, fields: Sequence[str] = None) -> dict:
+        return {field: row[field] for field in (cls.Meta.fields if fields is None else fields)}
+
+
+class Repository(SparseFieldsetMixin, ValuesSerializerMixin, serializers.ModelSerializer):
     owner = serializers.SerializerMethodField()
 
     class Meta:
@@ -38,10 +76,11 @@ class Repository(serializers.ModelSerializer):
 
     @swagger_serializer_method(OwnerSerializer)
     def get_owner(self, obj: models.Repository) -> dict:
+        # Only selected related owner / organization are used, so no extra query per repository is made
         if obj.owner:
             data = {
                 "type": OwnerType.USER,
-                "id": obj.owner.user.id,
+                "id": obj.owner.user_id,
                 "name": obj.owner.login,
             }
         elif obj.organization:
@@ -55,8 +94,31 @@ class Repository(serializers.ModelSerializer):
 
         return data
 
+    @classmethod
+    def get_values_fields(cls, fields: Sequence[str] = None) -> Tuple[str, ...]:
+        fields = super().get_values_fields(fields)
+        if "owner" not in fields:
+            return fields
+        fields = tuple(field for field in fields if field != "owner")
+        return fields + ("owner__user_id", "owner__login", "organization_id", "organization__name")
+
+    @classmethod
+    def to_values_representation(cls, row: dict, fields: Sequence[str] = None) -> dict:
+        fields = cls.Meta.fields if fields is None else fields
+        if "owner" not in fields:
+            return super().to_values_representation(row, fields)
 
-class Issue(serializers.ModelSerializer):
+        if row["owner__user_id"]:
+            owner = {"type": OwnerType.USER, "id": row["owner__user_id"], "name": row["owner__login"]}
+        elif row["organization_id"]:
+            owner = {"type": OwnerType.ORGANIZATION, "id": row["organization_id"], "name": row["organization__name"]}
+        else:
+            raise ValueError(f"repository with id {row['id']} has no owner!")
+
+        return {field: owner if field == "owner" else row[field] for field in fields}
+
+
+class Issue(SparseFieldsetMixin, ValuesSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = models.Issue
         fields = (
@@ -72,6 +134,17 @@ class Issue(serializers.ModelSerializer):
         )
 
 
+class IssueWithRepository(Issue):
+    class Meta(Issue.Meta):
+        fields = Issue.Meta.fields + ("repository",)
+
+
 class UserRepository(Repository):
     class Meta(Repository.Meta):
         fields = Repository.Meta.fields + ("state",)
+
+
+class ProgrammingLanguage(serializers.ModelSerializer):
+    class Meta:
+        model = models.ProgrammingLanguage
+        fields = ("name", "repositories_count")
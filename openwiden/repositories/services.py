@@ -1,7 +1,17 @@
-from typing import Tuple
-
-from openwiden import enums, vcs_clients
-from openwiden.repositories import models, enums as repository_enums, exceptions
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from logging import getLogger
+from typing import Tuple, Iterable, Iterator, List, Dict, Optional, Union
+from uuid import uuid4
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from openwiden import enums, vcs_clients, db
+from openwiden.repositories import cache, models, enums as repository_enums, exceptions, selectors
 from openwiden.users import models as users_models, selectors as users_selectors
 from openwiden.organizations import models as organizations_models
 from openwiden.organizations import services as organizations_services
@@ -9,13 +19,30 @@ from openwiden.vcs_clients.github.models import OwnerType
 from openwiden.vcs_clients.gitlab.models.repository import NamespaceKind
 from openwiden.webhooks import services as webhooks_services
 
+log = getLogger(__name__)
+
+# Max issues count, that is written with a single query on the issues sync
+ISSUES_SYNC_CHUNK_SIZE = 500
+
+# Time, that is subtracted from the issues sync watermark to not miss issues updated during the previous sync
+ISSUES_SYNC_OVERLAP = timedelta(minutes=1)
+
 
 def _add_github_repository(*, repository: models.Repository, vcs_account: users_models.VCSAccount,) -> None:
     github_client = vcs_clients.GitHubClient(vcs_account)
+    data = None
 
     # Sync repository
-    repository_data = github_client.get_repository(repository.remote_id)
-    programming_languages = github_client.get_repository_languages(repository.remote_id)
+    if settings.VCS_CLIENTS["GITHUB_GRAPHQL"]:
+        # Repository, languages and issues are fetched with the paged GraphQL query
+        synced_at = timezone.now()
+        data = github_client.get_repository_data(
+            owner=repository.owner_name, name=repository.name, issues_since=_get_issues_since(repository=repository),
+        )
+        repository_data, programming_languages = data.repository, data.programming_languages
+    else:
+        repository_data = github_client.get_repository(repository.remote_id)
+        programming_languages = github_client.get_repository_languages(repository.remote_id)
     repository, _ = sync_github_repository(
         repository=repository_data,
         vcs_account=vcs_account,
@@ -33,10 +60,12 @@ def _add_github_repository(*, repository: models.Repository, vcs_account: users_
             organization=organization, vcs_account=vcs_account, membership_type=membership_type,
         )
 
-    # Sync issues
-    repository_issues = github_client.get_repository_issues(repository.remote_id)
-    for issue in repository_issues:
-        sync_github_repository_issue(issue=issue, repository=repository)
+    # Sync issues (only updated ones, if repository was added before)
+    if data:
+        sync_github_repository_issues(issues=data.issues, repository=repository)
+        _set_issues_synced_at(repository=repository, synced_at=synced_at)
+    else:
+        _sync_repository_issues(repository=repository, client=github_client)
 
     # Create webhook
     webhooks_services.create_repository_webhook(
@@ -70,10 +99,76 @@ def _add_gitlab_repository(*, repository: models.Repository, vcs_account: users_
             organization=organization, vcs_account=vcs_account, membership_type=membership_type,
         )
 
-    # Sync issues
-    issues = gitlab_client.get_repository_issues(repository.remote_id)
-    for issue in issues:
-        sync_gitlab_repository_issue(issue=issue, repository=repository)
+    # Sync issues (only updated ones, if repository was added before)
+    _sync_repository_issues(repository=repository, client=gitlab_client)
+
+    # Create webhook
+    webhooks_services.create_repository_webhook(
+        repository=repository, vcs_account=vcs_account,
+    )
+
+    # Update repository state
+    update_repository_state(repository=repository, state=repository_enums.RepositoryState.ADDED)
+
+
+async def get_repository_data(
+    *,
+    vcs_account: users_models.VCSAccount,
+    repository_id: int,
+    organization_id: int = None,
+    issues_since: datetime = None,
+) -> vcs_clients.RepositoryData:
+    """
+    Fetches repository data from VCS concurrently with the async client.
+    Could be awaited from the ASGI app directly, since it does not touch the DB in the event loop.
+    """
+    if vcs_account.vcs == enums.VersionControlService.GITHUB:
+        client_class = vcs_clients.AsyncGitHubClient
+    else:
+        client_class = vcs_clients.AsyncGitlabClient
+
+    async with client_class(vcs_account) as client:
+        return await client.get_repository_data(
+            repository_id, organization_id=organization_id, issues_since=issues_since,
+        )
+
+
+def _add_repository_concurrently(*, repository: models.Repository, vcs_account: users_models.VCSAccount) -> None:
+    organization_id = repository.organization.remote_id if repository.organization_id else None
+    synced_at = timezone.now()
+
+    # Fetch repository, languages, organization, membership and issues concurrently
+    data = async_to_sync(get_repository_data)(
+        vcs_account=vcs_account,
+        repository_id=repository.remote_id,
+        organization_id=organization_id,
+        issues_since=_get_issues_since(repository=repository),
+    )
+
+    # Sync repository, organization and issues
+    extra_defaults = dict(programming_languages=data.programming_languages)
+    if vcs_account.vcs == enums.VersionControlService.GITHUB:
+        repository, _ = sync_github_repository(
+            repository=data.repository, vcs_account=vcs_account, extra_defaults=extra_defaults,
+        )
+        if data.organization:
+            organization, _ = organizations_services.sync_github_organization(organization=data.organization)
+        sync_github_repository_issues(issues=data.issues, repository=repository)
+    else:
+        repository, _ = sync_gitlab_repository(
+            repository=data.repository, vcs_account=vcs_account, extra_defaults=extra_defaults,
+        )
+        if data.organization:
+            organization, _ = organizations_services.sync_gitlab_organization(organization=data.organization)
+        sync_gitlab_repository_issues(issues=data.issues, repository=repository)
+
+    # Sync membership
+    if data.organization:
+        organizations_services.sync_organization_membership(
+            organization=organization, vcs_account=vcs_account, membership_type=data.membership_type,
+        )
+
+    _set_issues_synced_at(repository=repository, synced_at=synced_at)
 
     # Create webhook
     webhooks_services.create_repository_webhook(
@@ -100,26 +195,96 @@ def add_repository(*, repository: models.Repository, user: users_models.User) ->
     vcs_account = users_selectors.find_vcs_account(user, repository.vcs)
     update_repository_state(repository=repository, state=repository_enums.RepositoryState.ADDING)
 
-    if vcs_account.vcs == enums.VersionControlService.GITHUB:
+    if settings.VCS_CLIENTS["ASYNC_ADD_REPOSITORY"]:
+        _add_repository_concurrently(repository=repository, vcs_account=vcs_account)
+    elif vcs_account.vcs == enums.VersionControlService.GITHUB:
         _add_github_repository(repository=repository, vcs_account=vcs_account)
     elif vcs_account.vcs == enums.VersionControlService.GITLAB:
         _add_gitlab_repository(repository=repository, vcs_account=vcs_account)
 
 
+def _get_issues_since(*, repository: models.Repository, full: bool = False) -> Optional[datetime]:
+    """
+    Returns time since which repository issues should be synced or None, if all issues should be synced.
+    """
+    if repository.issues_synced_at and not full:
+        return repository.issues_synced_at - ISSUES_SYNC_OVERLAP
+    return None
+
+
+def _set_issues_synced_at(*, repository: models.Repository, synced_at: datetime) -> None:
+    repository.issues_synced_at = synced_at
+    repository.save(update_fields=("issues_synced_at",))
+
+
+def _sync_repository_issues(
+    *,
+    repository: models.Repository,
+    client: Union[vcs_clients.GitHubClient, vcs_clients.GitlabClient],
+    full: bool = False,
+) -> Tuple[int, int]:
+    since = _get_issues_since(repository=repository, full=full)
+
+    # Watermark is taken before the fetch, so issues updated during the sync will be synced next time
+    synced_at = timezone.now()
+
+    if repository.vcs == enums.VersionControlService.GITHUB:
+        issues = client.get_repository_issues(repository.remote_id, since=since)
+        result = sync_github_repository_issues(repository=repository, issues=issues)
+    else:
+        issues = client.get_repository_issues(repository.remote_id, updated_after=since)
+        result = sync_gitlab_repository_issues(repository=repository, issues=issues)
+
+    _set_issues_synced_at(repository=repository, synced_at=synced_at)
+
+    return result
+
+
+def sync_repository_issues(
+    *, repository: models.Repository, vcs_account: users_models.VCSAccount = None, full: bool = False,
+) -> Tuple[int, int]:
+    """
+    Syncs repository issues, that were updated since the last sync (all issues for the first or full sync).
+    Returns created and updated issues count.
+    """
+    if vcs_account is None:
+        vcs_account = selectors.find_repository_vcs_account(repository=repository)
+
+    if repository.vcs == enums.VersionControlService.GITHUB:
+        client = vcs_clients.GitHubClient(vcs_account)
+    else:
+        client = vcs_clients.GitlabClient(vcs_account)
+
+    return _sync_repository_issues(repository=repository, client=client, full=full)
+
+
 def delete_issue_by_remote_id(*, vcs: str, remote_id: str) -> None:
     """
     Finds and deletes repository issue by id.
     """
-    models.Issue.objects.filter(repository__vcs=vcs, remote_id=remote_id).delete()
+    delete_issues_by_remote_ids(vcs=vcs, remote_ids=[remote_id])
+
+
+def delete_issues_by_remote_ids(*, vcs: str, remote_ids: Iterable[str]) -> int:
+    """
+    Finds and deletes repositories issues by ids with a single query. Returns deleted issues count.
+    """
+    issues = models.Issue.objects.filter(repository__vcs=vcs, remote_id__in=remote_ids)
+    for repository_id in issues.values_list("repository_id", flat=True).distinct():
+        cache.bump_version(repository_id=repository_id)
+    deleted_count, _ = issues.delete()
+    return deleted_count
 
 
 def delete_repository_by_remote_id(*, vcs: str, remote_id: str) -> None:
     models.Repository.objects.filter(vcs=vcs, remote_id=remote_id).delete()
+    cache.bump_version()
 
 
 def update_repository_state(*, repository: models.Repository, state: repository_enums.RepositoryState,) -> None:
     repository.state = state
     repository.save(update_fields=("state",))
+    cache.bump_version()
 
 
 def remove_repository(*, repository: models.Repository, user: users_models.User,) -> None:
@@ -139,20 +304,140 @@ def remove_repository(*, repository: models.Repository, user: users_models.User,
     update_repository_state(repository=repository, state=repository_enums.RepositoryState.REMOVED)
 
 
-def sync_user_repositories(*, vcs_account: users_models.VCSAccount) -> None:
+def _get_github_repository_defaults(repository: vcs_clients.github.models.Repository) -> dict:
+    return dict(
+        name=repository.name,
+        description=repository.description,
+        url=repository.html_url,
+        stars_count=repository.stargazers_count,
+        open_issues_count=repository.open_issues_count,
+        forks_count=repository.forks_count,
+        created_at=repository.created_at,
+        updated_at=repository.updated_at,
+    )
+
+
+def _get_gitlab_repository_defaults(repository: vcs_clients.gitlab.models.Repository) -> dict:
+    return dict(
+        name=repository.name,
+        description=repository.description,
+        url=repository.web_url,
+        stars_count=repository.star_count,
+        open_issues_count=repository.open_issues_count,
+        forks_count=repository.forks_count,
+        created_at=repository.created_at,
+        updated_at=repository.last_activity_at,
+    )
+
+
+def _get_github_user_repository_data(
+    repository: vcs_clients.github.models.Repository,
+) -> Tuple[int, dict, Optional[Tuple[int, str]]]:
+    if repository.owner.owner_type == OwnerType.ORGANIZATION:
+        organization = (repository.owner.owner_id, repository.owner.login)
+    else:
+        organization = None
+    return repository.repository_id, _get_github_repository_defaults(repository), organization
+
+
+def _get_gitlab_user_repository_data(
+    repository: vcs_clients.gitlab.models.Repository,
+) -> Tuple[int, dict, Optional[Tuple[int, str]]]:
+    if repository.namespace.kind == NamespaceKind.ORGANIZATION:
+        organization = (repository.namespace.namespace_id, repository.namespace.name)
+    else:
+        organization = None
+    return repository.repository_id, _get_gitlab_repository_defaults(repository), organization
+
+
+def _bulk_sync_user_repositories(
+    *,
+    vcs_account: users_models.VCSAccount,
+    repositories_data: List[Tuple[int, dict, Optional[Tuple[int, str]]]],
+    timings: Dict[str, float],
+) -> int:
+    """
+    Syncs page of user repositories (remote id, defaults and organization remote id with name) in bulk:
+    organizations and memberships are resolved with a single query each and repositories are
+    upserted with a single query per ownership type.
+    Returns synced repositories count.
+    """
+    started_at = time.perf_counter()
+    organizations_data = {organization[0]: organization[1] for _, _, organization in repositories_data if organization}
+    organizations = organizations_services.get_or_create_organizations(
+        vcs=vcs_account.vcs, organizations=organizations_data,
+    )
+    timings["organizations"] += time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    organizations_services.create_organizations_memberships(
+        organizations=organizations.values(), vcs_account=vcs_account,
+    )
+    timings["memberships"] += time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    rows_by_ownership = dict(owner_id=[], organization_id=[])
+    for remote_id, defaults, organization in repositories_data:
+        row = dict(id=uuid4(), vcs=vcs_account.vcs, remote_id=remote_id, state=repository_enums.RepositoryState.INITIAL)
+        row.update(defaults)
+        if organization:
+            rows_by_ownership["organization_id"].append(dict(row, organization_id=organizations[organization[0]].id))
+        else:
+            rows_by_ownership["owner_id"].append(dict(row, owner_id=vcs_account.id))
+
+    # Repository state is not updated on sync, it's managed by add / remove services only
+    update_fields = ("name", "description", "url", "stars_count", "open_issues_count", "forks_count")
+    update_fields += ("created_at", "updated_at")
+    for ownership_field, rows in rows_by_ownership.items():
+        db.bulk_upsert(
+            model=models.Repository,
+            rows=rows,
+            conflict_fields=("vcs", "remote_id"),
+            update_fields=update_fields + (ownership_field,),
+        )
+    cache.bump_version()
+    timings["repositories"] += time.perf_counter() - started_at
+
+    return len(repositories_data)
+
+
+def sync_user_repositories(*, vcs_account: users_models.VCSAccount) -> Dict[str, float]:
+    """
+    Syncs all user repositories page by page in bulk.
+    Returns time in seconds, that was spent on every sync phase.
+    """
     if vcs_account.vcs == enums.VersionControlService.GITHUB:
-        github_client = vcs_clients.GitHubClient(vcs_account)
-        user_repositories = github_client.get_user_repositories()
-        for repository in user_repositories:
-            sync_github_repository(repository=repository, vcs_account=vcs_account)
+        client = vcs_clients.GitHubClient(vcs_account)
+        get_repository_data = _get_github_user_repository_data
     elif vcs_account.vcs == enums.VersionControlService.GITLAB:
-        gitlab_client = vcs_clients.GitlabClient(vcs_account)
-        repositories = gitlab_client.get_user_repositories()
-        for repository in repositories:
-            sync_gitlab_repository(repository=repository, vcs_account=vcs_account)
+        client = vcs_clients.GitlabClient(vcs_account)
+        get_repository_data = _get_gitlab_user_repository_data
     else:
         raise ValueError(f"vcs {vcs_account.vcs} is not implemented!")
 
+    timings = dict(fetch=0.0, organizations=0.0, memberships=0.0, repositories=0.0)
+    repositories_count = 0
+    repositories = client.get_user_repositories()
+
+    while True:
+        started_at = time.perf_counter()
+        repositories_data = [get_repository_data(repository) for repository in islice(repositories, client.per_page)]
+        timings["fetch"] += time.perf_counter() - started_at
+
+        if not repositories_data:
+            break
+
+        repositories_count += _bulk_sync_user_repositories(
+            vcs_account=vcs_account, repositories_data=repositories_data, timings=timings,
+        )
+
+    log.info(
+        f"[Service] {repositories_count} repositories are synced for vcs account {vcs_account.id}, "
+        f"timings: {', '.join(f'{phase} {seconds:.3f}s' for phase, seconds in timings.items())}"
+    )
+
+    return timings
+
 
 def sync_github_repository(
     *,
@@ -160,16 +445,7 @@ def sync_github_repository(
     vcs_account: users_models.VCSAccount = None,
     extra_defaults: dict = None,
 ) -> Tuple[models.Repository, bool]:
-    defaults = dict(
-        name=repository.name,
-        description=repository.description,
-        url=repository.html_url,
-        stars_count=repository.stargazers_count,
-        open_issues_count=repository.open_issues_count,
-        forks_count=repository.forks_count,
-        created_at=repository.created_at,
-        updated_at=repository.updated_at,
-    )
+    defaults = _get_github_repository_defaults(repository)
 
     if extra_defaults:
         defaults.update(extra_defaults)
@@ -190,32 +466,151 @@ def sync_github_repository(
     repository_obj, created = models.Repository.objects.update_or_create(
         remote_id=repository.repository_id, vcs=enums.VersionControlService.GITHUB, defaults=defaults,
     )
+    cache.bump_version()
 
     return repository_obj, created
 
 
+def _get_github_issue_defaults(issue: vcs_clients.github.models.Issue) -> dict:
+    return dict(
+        title=issue.title,
+        description=issue.body,
+        state=issue.state,
+        labels=issue.labels,
+        url=issue.html_url,
+        created_at=issue.created_at,
+        updated_at=issue.updated_at,
+        closed_at=issue.closed_at,
+    )
+
+
+def _get_gitlab_issue_defaults(issue: vcs_clients.gitlab.models.Issue) -> dict:
+    return dict(
+        title=issue.title,
+        description=issue.description,
+        state=issue.state,
+        labels=issue.labels,
+        url=issue.web_url,
+        created_at=issue.created_at,
+        updated_at=issue.updated_at,
+        closed_at=issue.closed_at,
+    )
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _bulk_sync_repository_issues(*, repository_id: str, issues_defaults: Iterable[dict]) -> Tuple[int, int]:
+    """
+    Upserts repository issues in chunks, one INSERT ... ON CONFLICT query per chunk. Issues are not
+    overwritten with the older data (by updated_at), e.g. by the webhook events batches of the other consumer.
+    Returns created and updated issues count.
+    """
+    created_count = updated_count = 0
+    update_fields = ("title", "description", "state", "labels", "url", "created_at", "updated_at", "closed_at")
+
+    for chunk in _chunks(issues_defaults, ISSUES_SYNC_CHUNK_SIZE):
+        rows = [dict(id=uuid4(), repository_id=repository_id, **defaults) for defaults in chunk]
+        created, updated = db.bulk_upsert(
+            model=models.Issue,
+            rows=rows,
+            conflict_fields=("repository_id", "remote_id"),
+            update_fields=update_fields,
+            version_field="updated_at",
+        )
+        created_count += created
+        updated_count += updated
+
+    if created_count or updated_count:
+        cache.bump_version(repository_id=repository_id)
+
+    return created_count, updated_count
+
+
+def sync_github_repository_issues(
+    *, repository: models.Repository, issues: Iterable[vcs_clients.github.models.Issue],
+) -> Tuple[int, int]:
+    """
+    Syncs repository issues in bulk. Issues are consumed lazily, so paginated issues stream could be passed.
+    Returns created and updated issues count.
+    """
+    issues_defaults = (dict(remote_id=issue.issue_id, **_get_github_issue_defaults(issue)) for issue in issues)
+    return _bulk_sync_repository_issues(repository_id=repository.id, issues_defaults=issues_defaults)
+
+
+def sync_gitlab_repository_issues(
+    *, repository: models.Repository, issues: Iterable[vcs_clients.gitlab.models.Issue],
+) -> Tuple[int, int]:
+    """
+    Syncs repository issues in bulk. Issues are consumed lazily, so paginated issues stream could be passed.
+    Returns created and updated issues count.
+    """
+    issues_defaults = (dict(remote_id=issue.issue_id, **_get_gitlab_issue_defaults(issue)) for issue in issues)
+    return _bulk_sync_repository_issues(repository_id=repository.id, issues_defaults=issues_defaults)
+
+
+def _bulk_sync_issues(*, issues_defaults: Dict[str, List[dict]]) -> Tuple[int, int]:
+    created_count = updated_count = 0
+    for repository_id, repository_issues_defaults in issues_defaults.items():
+        created, updated = _bulk_sync_repository_issues(
+            repository_id=repository_id, issues_defaults=repository_issues_defaults,
+        )
+        created_count += created
+        updated_count += updated
+    return created_count, updated_count
+
+
+def bulk_sync_github_issues(*, issues: Dict[str, List[vcs_clients.github.models.Issue]]) -> Tuple[int, int]:
+    """
+    Syncs issues of the multiple repositories (issues by repository id) in bulk, one query per repository
+    issues chunk. Returns created and updated issues count.
+    """
+    issues_defaults = {
+        repository_id: [dict(remote_id=i.issue_id, **_get_github_issue_defaults(i)) for i in repository_issues]
+        for repository_id, repository_issues in issues.items()
+    }
+    return _bulk_sync_issues(issues_defaults=issues_defaults)
+
+
+def bulk_sync_gitlab_issues(*, issues: Dict[str, List[vcs_clients.gitlab.models.Issue]]) -> Tuple[int, int]:
+    """
+    Syncs issues of the multiple repositories (issues by repository id) in bulk, one query per repository
+    issues chunk. Returns created and updated issues count.
+    """
+    issues_defaults = {
+        repository_id: [dict(remote_id=i.issue_id, **_get_gitlab_issue_defaults(i)) for i in repository_issues]
+        for repository_id, repository_issues in issues.items()
+    }
+    return _bulk_sync_issues(issues_defaults=issues_defaults)
+
+
+def _get_repository_id(*, vcs: str, remote_id: int) -> str:
+    return models.Repository.objects.values_list("id", flat=True).get(vcs=vcs, remote_id=remote_id)
+
+
 def sync_github_repository_issue(
-    *, issue: vcs_clients.github.models.Issue, repository: models.Repository = None,
+    *, issue: vcs_clients.github.models.Issue, repository: models.Repository = None, repository_id: str = None,
 ) -> Tuple[models.Issue, bool]:
-    if not repository:
-        repository = models.Repository.objects.get(
-            vcs=enums.VersionControlService.GITHUB, remote_id=issue.repository_id,
-        )
+    """
+    Syncs repository issue. Repository is looked up by the issue remote repository id, if repository
+    (or its id, e.g. the webhook one) is not specified.
+    """
+    if repository:
+        repository_id = repository.id
+    elif not repository_id:
+        repository_id = _get_repository_id(vcs=enums.VersionControlService.GITHUB, remote_id=issue.repository_id)
 
-    return models.Issue.objects.update_or_create(
-        repository=repository,
-        remote_id=issue.issue_id,
-        defaults=dict(
-            title=issue.title,
-            description=issue.body,
-            state=issue.state,
-            labels=issue.labels,
-            url=issue.html_url,
-            created_at=issue.created_at,
-            updated_at=issue.updated_at,
-            closed_at=issue.closed_at,
-        ),
+    issue_obj, created = models.Issue.objects.update_or_create(
+        repository_id=repository_id, remote_id=issue.issue_id, defaults=_get_github_issue_defaults(issue),
     )
+    cache.bump_version(repository_id=repository_id)
+
+    return issue_obj, created
 
 
 def sync_gitlab_repository(
@@ -224,16 +619,7 @@ def sync_gitlab_repository(
     vcs_account: users_models.VCSAccount,
     extra_defaults: dict = None,
 ) -> Tuple[models.Repository, bool]:
-    defaults = dict(
-        name=repository.name,
-        description=repository.description,
-        url=repository.web_url,
-        stars_count=repository.star_count,
-        open_issues_count=repository.open_issues_count,
-        forks_count=repository.forks_count,
-        created_at=repository.created_at,
-        updated_at=repository.last_activity_at,
-    )
+    defaults = _get_gitlab_repository_defaults(repository)
 
     if extra_defaults:
         defaults.update(extra_defaults)
@@ -255,27 +641,59 @@ def sync_gitlab_repository(
     repository_obj, created = models.Repository.objects.update_or_create(
         vcs=enums.VersionControlService.GITLAB, remote_id=repository.repository_id, defaults=defaults,
     )
+    cache.bump_version()
 
     return repository_obj, created
 
 
 def sync_gitlab_repository_issue(
-    *, issue: vcs_clients.gitlab.models.Issue, repository: models.Repository = None
+    *, issue: vcs_clients.gitlab.models.Issue, repository: models.Repository = None, repository_id: str = None,
 ) -> None:
-    if repository is None:
-        repository = models.Repository.objects.get(vcs=enums.VersionControlService.GITLAB, remote_id=issue.project_id,)
+    """
+    Syncs repository issue. Repository is looked up by the issue project id, if repository
+    (or its id, e.g. the webhook one) is not specified.
+    """
+    if repository is not None:
+        repository_id = repository.id
+    elif not repository_id:
+        repository_id = _get_repository_id(vcs=enums.VersionControlService.GITLAB, remote_id=issue.project_id)
 
     models.Issue.objects.update_or_create(
-        repository=repository,
-        remote_id=issue.issue_id,
-        defaults=dict(
-            title=issue.title,
-            description=issue.description,
-            state=issue.state,
-            labels=issue.labels,
-            url=issue.web_url,
-            created_at=issue.created_at,
-            updated_at=issue.updated_at,
-            closed_at=issue.closed_at,
-        ),
+        repository_id=repository_id, remote_id=issue.issue_id, defaults=_get_gitlab_issue_defaults(issue),
     )
+    cache.bump_version(repository_id=repository_id)
+
+
+def refresh_programming_languages(*, names: Iterable[str] = None) -> None:
+    """
+    Recalculates added repositories count of the specified programming languages (all languages by default).
+    Languages, that are not used by the added repositories anymore, are deleted.
+    """
+    names = None if names is None else list(set(names))
+    if names == []:
+        return None
+
+    sql = (
+        "SELECT language, COUNT(*) FROM {table} CROSS JOIN LATERAL skeys(programming_languages) AS language "
+        "WHERE state = %s {names_filter} GROUP BY language"
+    ).format(
+        table=connection.ops.quote_name(models.Repository._meta.db_table),
+        names_filter="AND programming_languages ?| %s AND language = ANY(%s)" if names is not None else "",
+    )
+    params = [repository_enums.RepositoryState.ADDED] + ([names, names] if names is not None else [])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        counts = dict(cursor.fetchall())
+
+    db.bulk_upsert(
+        model=models.ProgrammingLanguage,
+        rows=[dict(id=uuid4(), name=name, repositories_count=count) for name, count in counts.items()],
+        conflict_fields=("name",),
+        update_fields=("repositories_count",),
+    )
+
+    unused_languages = models.ProgrammingLanguage.objects.exclude(name__in=counts.keys())
+    if names is not None:
+        unused_languages = unused_languages.filter(name__in=names)
+    unused_languages.delete()
@@ -1,11 +1,38 @@
+from datetime import datetime
+from logging import getLogger
+
+from django_q.models import Schedule
+from django_q.tasks import schedule
+
 from openwiden.users import models as users_models, services as users_services
 from openwiden.exceptions import ServiceException
+from openwiden.vcs_clients.exceptions import RateLimitExceeded
 from . import services, models, messages, enums
 
+log = getLogger(__name__)
+
+
+def _reschedule(func: str, next_run: datetime, **kwargs) -> None:
+    """
+    Schedules task to run once at the specified time (kwargs should be literals, e.g. ids).
+    """
+    log.info(f"[Task] {func} is rescheduled to {next_run.isoformat()} ({kwargs})")
+    schedule(func, schedule_type=Schedule.ONCE, repeats=1, next_run=next_run, **kwargs)
+
 
 def add_repository(repository: models.Repository, user: users_models.User):
+    state = repository.state
+
     try:
         services.add_repository(repository=repository, user=user)
+    except RateLimitExceeded as e:
+        services.update_repository_state(repository=repository, state=state)
+        _reschedule(
+            "openwiden.repositories.tasks.add_repository_by_id",
+            e.reset_at,
+            repository_id=str(repository.id),
+            user_id=str(user.id),
+        )
     except ServiceException as e:
         services.update_repository_state(
             repository=repository, state=enums.RepositoryState.ADD_FAILED,
@@ -15,9 +42,23 @@ def add_repository(repository: models.Repository, user: users_models.User):
         users_services.send_notification(user=user, message=str(messages.REPOSITORY_IS_ADDED))
 
 
+def add_repository_by_id(repository_id: str, user_id: str):
+    add_repository(
+        repository=models.Repository.objects.get(id=repository_id), user=users_models.User.objects.get(id=user_id),
+    )
+
+
 def remove_repository(repository: models.Repository, user: users_models.User):
     try:
         services.remove_repository(repository=repository, user=user)
+    except RateLimitExceeded as e:
+        services.update_repository_state(repository=repository, state=enums.RepositoryState.ADDED)
+        _reschedule(
+            "openwiden.repositories.tasks.remove_repository_by_id",
+            e.reset_at,
+            repository_id=str(repository.id),
+            user_id=str(user.id),
+        )
     except ServiceException as e:
         services.update_repository_state(
             repository=repository, state=enums.RepositoryState.REMOVE_FAILED,
@@ -25,3 +66,22 @@ def remove_repository(repository: models.Repository, user: users_models.User):
         users_services.send_notification(user=user, message=e.json_dumped_detail)
     else:
         users_services.send_notification(user=user, message=str(messages.REPOSITORY_IS_REMOVED))
+
+
+def remove_repository_by_id(repository_id: str, user_id: str):
+    remove_repository(
+        repository=models.Repository.objects.get(id=repository_id), user=users_models.User.objects.get(id=user_id),
+    )
+
+
+def sync_user_repositories(vcs_account: users_models.VCSAccount):
+    try:
+        services.sync_user_repositories(vcs_account=vcs_account)
+    except RateLimitExceeded as e:
+        _reschedule(
+            "openwiden.repositories.tasks.sync_user_repositories_by_id", e.reset_at, vcs_account_id=vcs_account.id,
+        )
+
+
+def sync_user_repositories_by_id(vcs_account_id: int):
+    sync_user_repositories(vcs_account=users_models.VCSAccount.objects.get(id=vcs_account_id))
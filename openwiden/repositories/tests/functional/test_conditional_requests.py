@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from openwiden.repositories import cache
+from openwiden.repositories.enums import RepositoryState
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+@pytest.mark.parametrize("version", ["1", None])
+def test_repository_is_not_modified(create_api_client, create_repository, version):
+    repository = create_repository(state=RepositoryState.ADDED)
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-detail", args=[repository.id])
+
+    with mock.patch.object(cache, "get_version", return_value=version):
+        response = api_client.get(url)
+        not_modified_response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified_response["ETag"] == response["ETag"]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_issues_are_modified(create_api_client, create_repository, create_issue):
+    repository = create_repository(state=RepositoryState.ADDED)
+    create_issue(repository=repository)
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-issue-list", args=[repository.id])
+
+    with mock.patch.object(cache, "get_version", return_value=None):
+        response = api_client.get(url)
+        create_issue(repository=repository)
+        modified_response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    assert "Last-Modified" in response
+    assert modified_response.status_code == status.HTTP_200_OK
+    assert modified_response["ETag"] != response["ETag"]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_pagination_shapes_have_different_etags(create_api_client, create_repository):
+    create_repository(state=RepositoryState.ADDED)
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-list")
+
+    with mock.patch.object(cache, "get_version", return_value="1"):
+        page_number_response = api_client.get(url)
+        keyset_response = api_client.get(url, {"cursor": ""}, HTTP_IF_NONE_MATCH=page_number_response["ETag"])
+
+    assert keyset_response.status_code == status.HTTP_200_OK
+    assert "count" not in keyset_response.data
+    assert keyset_response["ETag"] != page_number_response["ETag"]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_malformed_id_is_not_found(create_api_client):
+    url = reverse("api-v1:repository-detail", args=["invalid"])
+
+    with mock.patch.object(cache, "get_version", return_value=None):
+        response = create_api_client().get(url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -45,3 +45,26 @@ def test_run(create_api_client, expected_programming_languages: List[str]):
     # Test
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == expected_programming_languages
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_counts(create_api_client, create_repository):
+    repository = create_repository(programming_languages={"Python": 90, "Docker": 10}, state=RepositoryState.ADDED)
+    create_repository(programming_languages={"Python": 100}, state=RepositoryState.ADDED)
+    create_repository(programming_languages={"Python": 100}, state=RepositoryState.INITIAL)
+
+    response = create_api_client().get(reverse("api-v1:programming_languages"), {"counts": "true"})
+
+    assert response.json() == [
+        {"name": "Docker", "repositories_count": 1},
+        {"name": "Python", "repositories_count": 2},
+    ]
+
+    # Languages are recalculated on repository state change
+    repository.state = RepositoryState.REMOVED
+    repository.save(update_fields=("state",))
+
+    response = create_api_client().get(reverse("api-v1:programming_languages"), {"counts": "true"})
+
+    assert response.json() == [{"name": "Python", "repositories_count": 1}]
@@ -0,0 +1,73 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from openwiden import enums
+from openwiden.repositories.enums import IssueState, RepositoryState
+
+
+@pytest.fixture
+def create_open_issue(create_issue):
+    def factory(**kwargs):
+        return create_issue(state=IssueState.OPEN, **kwargs)
+
+    return factory
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_issue_feed_lists_open_issues_of_added_repositories(
+    create_api_client, create_repository, create_issue, create_open_issue
+):
+    added = create_repository(state=RepositoryState.ADDED)
+    expected = create_open_issue(repository=added)
+    create_issue(repository=added, state=IssueState.CLOSED)
+    create_open_issue(repository=create_repository(state=RepositoryState.INITIAL))
+
+    response = create_api_client().get(reverse("api-v1:issue-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [i["id"] for i in response.data["results"]] == [str(expected.id)]
+    assert response.data["results"][0]["repository"] == added.id
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_issue_feed_filters(create_api_client, create_repository, create_open_issue):
+    python_repository = create_repository(
+        state=RepositoryState.ADDED, vcs=enums.VersionControlService.GITHUB, programming_languages={"Python": "100"},
+    )
+    go_repository = create_repository(
+        state=RepositoryState.ADDED, vcs=enums.VersionControlService.GITLAB, programming_languages={"Go": "100"},
+    )
+    good_first_issue = create_open_issue(repository=python_repository, labels=["good first issue"])
+    bug = create_open_issue(repository=go_repository, labels=["bug"])
+    api_client = create_api_client()
+    url = reverse("api-v1:issue-list")
+
+    for query, expected in (
+        ({"labels": "good first issue,help wanted"}, good_first_issue),
+        ({"programming_languages": "Go,Rust"}, bug),
+        ({"vcs": enums.VersionControlService.GITHUB}, good_first_issue),
+    ):
+        response = api_client.get(url, query)
+
+        assert [i["id"] for i in response.data["results"]] == [str(expected.id)]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_issue_feed_keyset_pagination(create_api_client, create_repository, create_open_issue):
+    repository = create_repository(state=RepositoryState.ADDED)
+    issues = [create_open_issue(repository=repository, remote_id=i) for i in range(5)]
+    expected_ids = [str(i.id) for i in sorted(issues, key=lambda i: (i.created_at, str(i.id)), reverse=True)]
+    api_client = create_api_client()
+    url = reverse("api-v1:issue-list") + "?page_size=2"
+    ids = []
+
+    while url:
+        response = api_client.get(url)
+        ids += [issue["id"] for issue in response.data["results"]]
+        url = response.data["next"]
+
+    assert ids == expected_ids
@@ -0,0 +1,101 @@
+import json
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from openwiden.repositories import models, pagination
+from openwiden.repositories.enums import IssueState, RepositoryState
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_repositories_keyset_pagination(create_api_client, create_repository):
+    # Same open issues count for the part of repositories to check id tie-breaker
+    repositories = [
+        create_repository(state=RepositoryState.ADDED, open_issues_count=i // 2, remote_id=i) for i in range(7)
+    ]
+    expected_ids = [
+        str(r.id) for r in sorted(repositories, key=lambda r: (r.open_issues_count, str(r.id)), reverse=True)
+    ]
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-list") + "?cursor=&page_size=3"
+    ids = []
+
+    while url:
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+
+        ids += [repository["id"] for repository in response.data["results"]]
+        url = response.data["next"]
+
+    assert ids == expected_ids
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_invalid_cursor(create_api_client):
+    response = create_api_client().get(reverse("api-v1:repository-list") + "?cursor=invalid")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize("position", [[], [1], [1, "3c1a4c0e-9c6b-4bb7-8f4a-1a4a3bb0b6a1", 2], {"id": 1}])
+def test_cursor_with_invalid_position(position):
+    cursor = urlsafe_b64encode(json.dumps(position).encode()).decode()
+    request = Request(APIRequestFactory().get("/", {"cursor": cursor}))
+
+    with pytest.raises(NotFound):
+        pagination.RepositoryKeysetPagination().decode_cursor(request, models.Repository)
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_page_number_pagination_by_default(create_api_client, create_repository):
+    create_repository(state=RepositoryState.ADDED)
+
+    response = create_api_client().get(reverse("api-v1:repository-list"))
+
+    assert response.data["count"] == 1
+
+
+def test_cursor_keeps_microseconds():
+    created_at = timezone.now().replace(microsecond=123456)
+    paginator = pagination.IssueKeysetPagination()
+    cursor = paginator.encode_cursor([created_at, "3c1a4c0e-9c6b-4bb7-8f4a-1a4a3bb0b6a1"])
+    request = Request(APIRequestFactory().get("/", {"cursor": cursor}))
+
+    position = paginator.decode_cursor(request, models.Issue)
+
+    assert position[0] == created_at
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_issues_with_the_same_milliseconds_are_not_skipped(create_api_client, create_repository, create_issue):
+    repository = create_repository(state=RepositoryState.ADDED)
+    created_at = timezone.now().replace(microsecond=500000)
+    issues = [
+        create_issue(
+            repository=repository, state=IssueState.OPEN, remote_id=i, created_at=created_at + timedelta(microseconds=i)
+        )
+        for i in range(5)
+    ]
+    api_client = create_api_client()
+    url = reverse("api-v1:issue-list") + "?page_size=2"
+    ids = []
+
+    while url:
+        response = api_client.get(url)
+        ids += [issue["id"] for issue in response.data["results"]]
+        url = response.data["next"]
+
+    assert ids == [str(issue.id) for issue in reversed(issues)]
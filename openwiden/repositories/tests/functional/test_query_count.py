@@ -0,0 +1,46 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from openwiden.repositories.enums import RepositoryState
+
+
+def get_queries_count(api_client, url: str) -> int:
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    return len(context.captured_queries)
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_repositories_queries_count_does_not_depend_on_page_size(create_api_client, create_repository):
+    repositories = [create_repository(state=RepositoryState.ADDED, remote_id=i) for i in range(10)]
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-list") + "?cursor=&page_size={page_size}"
+
+    assert get_queries_count(api_client, url.format(page_size=1)) == get_queries_count(
+        api_client, url.format(page_size=10)
+    )
+    assert get_queries_count(api_client, reverse("api-v1:repository-detail", args=[repositories[0].id])) == 1
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_user_repositories_queries_count_does_not_depend_on_repositories_count(
+    create_api_client, create_repository, create_vcs_account, user
+):
+    vcs_account = create_vcs_account(user=user)
+    api_client = create_api_client(user)
+    url = reverse("api-v1:user-repository-list")
+
+    create_repository(owner=vcs_account, remote_id=1)
+    expected_count = get_queries_count(api_client, url)
+
+    for i in range(2, 11):
+        create_repository(owner=vcs_account, remote_id=i)
+
+    assert get_queries_count(api_client, url) == expected_count
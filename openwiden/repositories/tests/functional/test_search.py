@@ -0,0 +1,77 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from openwiden.repositories.enums import RepositoryState
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_search_repositories(create_api_client, create_repository):
+    by_description = create_repository(
+        state=RepositoryState.ADDED, name="backend", description="Django parser", remote_id=1,
+    )
+    by_name = create_repository(state=RepositoryState.ADDED, name="parser", description="Library", remote_id=2)
+    create_repository(state=RepositoryState.ADDED, name="frontend", description="Vue app", remote_id=3)
+    create_repository(state=RepositoryState.INITIAL, name="parser", remote_id=4)
+
+    response = create_api_client().get(reverse("api-v1:repository-list"), {"search": "parsers"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [r["id"] for r in response.data["results"]] == [str(by_name.id), str(by_description.id)]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_search_repositories_keeps_rank_ordering(create_api_client, create_repository):
+    programming_languages = {"Python": "100"}
+    by_name = create_repository(
+        state=RepositoryState.ADDED,
+        name="parser",
+        description="Library",
+        open_issues_count=1,
+        programming_languages=programming_languages,
+        remote_id=1,
+    )
+    by_description = create_repository(
+        state=RepositoryState.ADDED,
+        name="backend",
+        description="Django parser",
+        open_issues_count=100,
+        programming_languages=programming_languages,
+        remote_id=2,
+    )
+
+    response = create_api_client().get(
+        reverse("api-v1:repository-list"), {"search": "parsers", "programming_languages": "Python", "cursor": ""},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 2
+    assert [r["id"] for r in response.data["results"]] == [str(by_name.id), str(by_description.id)]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_search_issues(create_api_client, create_repository, create_issue):
+    repository = create_repository(state=RepositoryState.ADDED)
+    by_description = create_issue(repository=repository, title="Fix", description="Crash on parsing")
+    by_title = create_issue(repository=repository, title="Parsing crash", description="Traceback")
+    create_issue(repository=repository, title="Docs", description="Typo")
+    create_issue(repository=create_repository(state=RepositoryState.INITIAL), title="Parsing crash")
+
+    response = create_api_client().get(reverse("api-v1:issue-search"), {"search": "parsing"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [i["id"] for i in response.data["results"]] == [str(by_title.id), str(by_description.id)]
+    assert response.data["results"][0]["repository"] == repository.id
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_search_issues_without_text(create_api_client, create_issue):
+    create_issue()
+
+    response = create_api_client().get(reverse("api-v1:issue-search"))
+
+    assert response.data["count"] == 0
@@ -0,0 +1,44 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from openwiden.repositories.enums import RepositoryState
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+@pytest.mark.parametrize("fast_list_responses", [False, True])
+def test_issues_sparse_fieldsets(create_api_client, create_repository, create_issue, settings, fast_list_responses):
+    settings.FAST_LIST_RESPONSES = fast_list_responses
+    repository = create_repository(state=RepositoryState.ADDED)
+    create_issue(repository=repository)
+    api_client = create_api_client()
+    url = reverse("api-v1:repository-issue-list", args=[repository.id])
+
+    response = api_client.get(url, {"fields": "id,title,description", "omit": "description"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(response.json()["results"][0]) == ["id", "title"]
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_repository_sparse_fieldsets(create_api_client, create_repository):
+    repository = create_repository(state=RepositoryState.ADDED)
+
+    response = create_api_client().get(
+        reverse("api-v1:repository-detail", args=[repository.id]), {"omit": "description,programming_languages"},
+    )
+
+    assert "description" not in response.data
+    assert "programming_languages" not in response.data
+    assert response.data["owner"]["id"] == repository.owner.user_id
+
+
+@pytest.mark.functional
+@pytest.mark.django_db
+def test_unknown_sparse_fields(create_api_client, create_repository):
+    response = create_api_client().get(reverse("api-v1:repository-list"), {"fields": "id,unknown"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data == {"fields": ["Unknown fields: unknown."]}
@@ -0,0 +1,66 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from openwiden.repositories import cache
+
+
+def test_response_key_params_are_normalised():
+    key = cache.get_response_key(scope="repository:list", version="1", params={"b": ["2", "1"], "a": ["1"]})
+
+    assert key == cache.get_response_key(scope="repository:list", version="1", params={"a": ["1"], "b": ["1", "2"]})
+    assert key != cache.get_response_key(
+        scope="repository:list", version="1", params={"a": ["1"], "b": ["1", "2"], "c": [""]},
+    )
+    assert key != cache.get_response_key(scope="repository:list", version="2", params={"a": ["1"], "b": ["1", "2"]})
+
+
+@mock.patch.object(cache, "get_redis_connection")
+def test_get_version(patched_get_redis_connection):
+    patched_get_redis_connection.return_value.mget.return_value = [b"3", b"1"]
+
+    assert cache.get_version(repository_id="1") == "3.1"
+    patched_get_redis_connection.return_value.mget.assert_called_once_with(
+        [cache.GLOBAL_VERSION_KEY, cache.REPOSITORY_VERSION_KEY.format(repository_id="1")]
+    )
+
+
+@mock.patch.object(cache, "_get_epoch", return_value=1600000000000000)
+@mock.patch.object(cache, "get_redis_connection")
+def test_missing_version_is_seeded_with_epoch(patched_get_redis_connection, patched_get_epoch):
+    redis = patched_get_redis_connection.return_value
+    redis.mget.return_value = [b"3", None]
+    redis.pipeline.return_value.execute.return_value = [True, [b"3", b"1600000000000000"]]
+
+    assert cache.get_version(repository_id="1") == "3.1600000000000000"
+    redis.pipeline.return_value.set.assert_called_once_with(
+        cache.REPOSITORY_VERSION_KEY.format(repository_id="1"), 1600000000000000, nx=True,
+    )
+
+
+@mock.patch.object(cache, "get_redis_connection")
+def test_bump_version_seeds_missing_version(patched_get_redis_connection):
+    pipeline = patched_get_redis_connection.return_value.pipeline.return_value
+
+    cache._bump_version(None)
+
+    pipeline.set.assert_called_once_with(cache.GLOBAL_VERSION_KEY, mock.ANY, nx=True)
+    pipeline.incr.assert_called_once_with(cache.GLOBAL_VERSION_KEY)
+
+
+@pytest.mark.django_db
+@mock.patch.object(cache, "set_response")
+@mock.patch.object(cache, "get_response", return_value={"count": 0, "results": []})
+@mock.patch.object(cache, "get_version", return_value="1")
+def test_cached_response_is_returned(patched_get_version, patched_get_response, patched_set_response, settings):
+    settings.RESPONSES_CACHE = {**settings.RESPONSES_CACHE, "ENABLED": True}
+
+    response = APIClient().get(reverse("api-v1:repository-list"), {"vcs": "github"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"count": 0, "results": []}
+    patched_get_version.assert_called_once_with(repository_id=None)
+    patched_set_response.assert_not_called()
@@ -1,5 +1,6 @@
 import pytest
 
+from openwiden.enums import OwnerType
 from openwiden.repositories import serializers, models
 
 pytestmark = pytest.mark.django_db
@@ -51,3 +52,17 @@ class TestUserRepositorySerializer:
     def test_meat(self):
         assert issubclass(serializers.UserRepository, serializers.Repository) is True
         assert serializers.UserRepository.Meta.fields == serializers.Repository.Meta.fields + ("state",)
+
+
+class TestValuesRepresentation:
+    def test_repository(self):
+        row = {field: field for field in serializers.Repository.get_values_fields()}
+        row.update(owner__user_id=None, organization_id="organization id")
+
+        data = serializers.Repository.to_values_representation(row)
+
+        assert tuple(data) == serializers.Repository.Meta.fields
+        assert data["owner"] == {"type": OwnerType.ORGANIZATION, "id": "organization id", "name": "organization__name"}
+
+    def test_issue(self):
+        assert serializers.Issue.get_values_fields() == serializers.Issue.Meta.fields
@@ -0,0 +1,91 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from openwiden.repositories import services, models
+from openwiden.vcs_clients.github import models as github_models
+
+pytestmark = pytest.mark.django_db
+
+
+def create_github_issue(issue_id: int, title: str = "Issue title") -> github_models.Issue:
+    return github_models.Issue(
+        issue_id=issue_id,
+        title=title,
+        html_url=f"https://github.com/test/test/issues/{issue_id}",
+        body="Issue description",
+        state="open",
+        labels=["good first issue"],
+        created_at="2020-08-01T19:46:03Z",
+        updated_at="2020-08-01T19:46:03Z",
+        closed_at=None,
+    )
+
+
+class TestSyncGithubRepositoryIssues:
+    def test_create_and_update(self, repository, issue):
+        issue.repository = repository
+        issue.updated_at = datetime(2020, 7, 1, tzinfo=timezone.utc)
+        issue.save()
+        issues = [create_github_issue(issue.remote_id, title="Updated title")]
+        issues += [create_github_issue(issue.remote_id + i) for i in range(1, 4)]
+
+        created, updated = services.sync_github_repository_issues(repository=repository, issues=issues)
+
+        assert (created, updated) == (3, 1)
+        assert models.Issue.objects.filter(repository=repository).count() == 4
+        issue.refresh_from_db()
+        assert issue.title == "Updated title"
+
+    @mock.patch.object(services, "ISSUES_SYNC_CHUNK_SIZE", 2)
+    def test_issues_are_written_in_chunks(self, repository, django_assert_num_queries):
+        issues = (create_github_issue(issue_id) for issue_id in range(1, 6))
+
+        with django_assert_num_queries(3):
+            created, updated = services.sync_github_repository_issues(repository=repository, issues=issues)
+
+        assert (created, updated) == (5, 0)
+
+    def test_stale_issue_is_not_updated(self, repository, issue):
+        issue.repository = repository
+        issue.title = "Newer title"
+        issue.updated_at = datetime(2020, 9, 1, tzinfo=timezone.utc)
+        issue.save()
+
+        created, updated = services.sync_github_repository_issues(
+            repository=repository, issues=[create_github_issue(issue.remote_id, title="Stale title")],
+        )
+
+        assert (created, updated) == (0, 0)
+        issue.refresh_from_db()
+        assert issue.title == "Newer title"
+
+
+class TestSyncRepositoryIssues:
+    @mock.patch.object(services.vcs_clients, "GitHubClient")
+    def test_first_sync_is_full(self, mock_client, create_repository, vcs_account):
+        repository = create_repository(vcs="github", owner=vcs_account, issues_synced_at=None)
+        mock_client.return_value.get_repository_issues.return_value = [create_github_issue(1)]
+
+        created, updated = services.sync_repository_issues(repository=repository)
+
+        assert (created, updated) == (1, 0)
+        mock_client.return_value.get_repository_issues.assert_called_once_with(repository.remote_id, since=None)
+        repository.refresh_from_db()
+        assert repository.issues_synced_at is not None
+
+    @mock.patch.object(services.vcs_clients, "GitHubClient")
+    def test_next_sync_is_incremental(self, mock_client, create_repository, vcs_account):
+        synced_at = timezone.now()
+        repository = create_repository(vcs="github", owner=vcs_account, issues_synced_at=synced_at)
+        mock_client.return_value.get_repository_issues.return_value = []
+
+        services.sync_repository_issues(repository=repository)
+
+        mock_client.return_value.get_repository_issues.assert_called_once_with(
+            repository.remote_id, since=synced_at - services.ISSUES_SYNC_OVERLAP,
+        )
+        repository.refresh_from_db()
+        assert repository.issues_synced_at > synced_at
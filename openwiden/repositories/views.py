@@ -1,41 +1,128 @@
+from typing import Optional
+
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django_q.tasks import async_task
 from drf_yasg import openapi
 from drf_yasg.utils import no_body, swagger_auto_schema
-from rest_framework import viewsets, permissions, status
+from rest_framework import generics, mixins as drf_mixins, viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from . import serializers, filters, selectors, tasks
+from . import serializers, filters, selectors, tasks, pagination, models, mixins
+
+
+sparse_fieldset_parameters = [
+    openapi.Parameter(
+        mixins.SparseFieldsetMixin.fields_query_param,
+        openapi.IN_QUERY,
+        description="Comma separated fields to return (all by default)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        mixins.SparseFieldsetMixin.omit_query_param,
+        openapi.IN_QUERY,
+        description="Comma separated fields to omit, e.g. description",
+        type=openapi.TYPE_STRING,
+    ),
+]
 
 
 @method_decorator(
-    name="list", decorator=swagger_auto_schema(operation_summary="Get repositories list"),
+    name="list",
+    decorator=swagger_auto_schema(
+        operation_summary="Get repositories list", manual_parameters=sparse_fieldset_parameters,
+    ),
+)
+@method_decorator(
+    name="retrieve",
+    decorator=swagger_auto_schema(
+        operation_summary="Get repository by id", manual_parameters=sparse_fieldset_parameters,
+    ),
 )
-@method_decorator(name="retrieve", decorator=swagger_auto_schema(operation_summary="Get repository by id"))
-class Repository(viewsets.ReadOnlyModelViewSet):
+class Repository(
+    mixins.ConditionalResponseMixin, mixins.CachedResponseMixin, mixins.ValuesListMixin, viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = serializers.Repository
     queryset = selectors.get_added_repositories()
     filterset_class = filters.Repository
+    pagination_class = pagination.RepositoryPagination
     permission_classes = (permissions.AllowAny,)
     lookup_field = "id"
 
 
-@method_decorator(name="list", decorator=swagger_auto_schema(operation_summary="Get repository issues list"))
-@method_decorator(name="retrieve", decorator=swagger_auto_schema(operation_summary="Get repository issue by id"))
-class Issue(viewsets.ReadOnlyModelViewSet):
+@method_decorator(
+    name="list",
+    decorator=swagger_auto_schema(
+        operation_summary="Get repository issues list", manual_parameters=sparse_fieldset_parameters,
+    ),
+)
+@method_decorator(
+    name="retrieve",
+    decorator=swagger_auto_schema(
+        operation_summary="Get repository issue by id", manual_parameters=sparse_fieldset_parameters,
+    ),
+)
+class Issue(
+    mixins.ConditionalResponseMixin, mixins.CachedResponseMixin, mixins.ValuesListMixin, viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = serializers.Issue
+    pagination_class = pagination.IssuePagination
     permission_classes = (permissions.AllowAny,)
     lookup_field = "id"
 
+    def get_cache_repository_id(self) -> Optional[str]:
+        return self.kwargs["repository_id"]
+
     def get_queryset(self):
         repository = selectors.get_repository(id=self.kwargs["repository_id"])
         return repository.issues.all()
 
 
+@method_decorator(
+    name="list",
+    decorator=swagger_auto_schema(
+        operation_summary="Get open issues of the all added repositories", manual_parameters=sparse_fieldset_parameters,
+    ),
+)
+class IssueFeed(mixins.ValuesListMixin, drf_mixins.ListModelMixin, viewsets.GenericViewSet):
+    serializer_class = serializers.IssueWithRepository
+    queryset = selectors.get_open_issues()
+    filterset_class = filters.Issue
+    pagination_class = pagination.IssueKeysetPagination
+    permission_classes = (permissions.AllowAny,)
+
+
+@method_decorator(
+    name="get",
+    decorator=swagger_auto_schema(
+        operation_summary="Search issues of the added repositories",
+        manual_parameters=[
+            openapi.Parameter(
+                "search",
+                openapi.IN_QUERY,
+                description="Full text search by title and description, results are ordered by the rank",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+        ],
+    ),
+)
+class IssueSearch(generics.ListAPIView):
+    serializer_class = serializers.IssueWithRepository
+    permission_classes = (permissions.AllowAny,)
+
+    def get_queryset(self):
+        text = self.request.query_params.get("search")
+        if not text:
+            return models.Issue.objects.none()
+        return selectors.search_issues(text=text)
+
+
+issue_search_view = IssueSearch.as_view()
+
+
 @method_decorator(name="list", decorator=swagger_auto_schema(operation_summary="Get user repositories list"))
 @method_decorator(name="retrieve", decorator=swagger_auto_schema(operation_summary="Get user repository by id"))
 @method_decorator(
@@ -77,11 +164,18 @@ class UserRepositories(viewsets.ReadOnlyModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-@method_decorator(name="get", decorator=cache_page(60))
 @method_decorator(
     name="get",
     decorator=swagger_auto_schema(
         operation_summary="Get a list of all programming languages from the added repositories",
+        manual_parameters=[
+            openapi.Parameter(
+                "counts",
+                openapi.IN_QUERY,
+                description="Return languages with the added repositories count",
+                type=openapi.TYPE_BOOLEAN,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: openapi.Schema(
                 type=openapi.TYPE_ARRAY,
@@ -95,7 +189,12 @@ class ProgrammingLanguagesView(APIView):
     permission_classes = (permissions.AllowAny,)
 
     def get(self, request: Request) -> Response:
-        return Response(selectors.get_programming_languages())
+        programming_languages = selectors.get_programming_languages()
+
+        if request.query_params.get("counts") in ("true", "1"):
+            return Response(serializers.ProgrammingLanguage(programming_languages, many=True).data)
+
+        return Response(programming_languages.values_list("name", flat=True))
 
 
 programming_languages_view = ProgrammingLanguagesView.as_view()
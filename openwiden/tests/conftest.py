@@ -1,19 +1,7 @@
-from copy import deepcopy
-from typing import Union
-from unittest import mock
-
 import pytest
 from django.utils import timezone
 
 
-@pytest.fixture()
-def create_mock_response():
-    def _create_mock_response(data: Union[list, dict] = None, status_code: int = 200, **kwargs) -> mock.MagicMock:
-        return mock.MagicMock(json=mock.MagicMock(return_value=deepcopy(data)), status_code=status_code, **kwargs)
-
-    return _create_mock_response
-
-
 @pytest.fixture()
 def github_token_json() -> dict:
     return {
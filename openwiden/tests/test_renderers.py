@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from rest_framework.renderers import JSONRenderer
+
+from openwiden.renderers import ORJSONRenderer
+
+
+def test_orjson_renderer_output_is_compatible_with_json_renderer():
+    data = {
+        "id": UUID("6f5b5e76-0f0b-4ad4-8f53-2c2a0fb1a6a8"),
+        "created_at": datetime(2020, 8, 1, 10, 30, tzinfo=timezone.utc),
+        "labels": ["bug"],
+        "closed_at": None,
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(
+        {**data, "created_at": "2020-08-01T10:30:00Z"}
+    ).replace(b" ", b"")
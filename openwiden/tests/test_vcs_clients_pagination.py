@@ -0,0 +1,51 @@
+from unittest import mock
+
+import pytest
+
+from openwiden import vcs_clients
+from openwiden.enums import VersionControlService
+
+
+@pytest.mark.django_db
+@mock.patch("requests.sessions.Session.request")
+def test_github_follows_link_header(
+    mock_request, create_vcs_account, create_mock_response, github_repository_issues_json,
+):
+    vcs_account = create_vcs_account(vcs=VersionControlService.GITHUB)
+    next_url = "https://api.github.com/repositories/1/issues?state=open&per_page=100&page=2"
+    mock_request.side_effect = [
+        create_mock_response(github_repository_issues_json, links={"next": {"url": next_url}}),
+        create_mock_response(github_repository_issues_json),
+    ]
+
+    issues = vcs_clients.GitHubClient(vcs_account).get_repository_issues(1)
+
+    # Nothing is requested until the first issue is consumed
+    assert mock_request.call_count == 0
+
+    issues = list(issues)
+    expected_count = len([issue for issue in github_repository_issues_json if "pull_request" not in issue]) * 2
+
+    assert len(issues) == expected_count
+    assert mock_request.call_count == 2
+    assert "per_page=100" in mock_request.call_args_list[0][0][1]
+    assert mock_request.call_args_list[1][0][1] == next_url
+
+
+@pytest.mark.django_db
+@mock.patch("requests.sessions.Session.request")
+def test_gitlab_follows_next_page_header(
+    mock_request, create_vcs_account, create_mock_response, gitlab_repository_issues_json,
+):
+    vcs_account = create_vcs_account(vcs=VersionControlService.GITLAB)
+    mock_request.side_effect = [
+        create_mock_response(gitlab_repository_issues_json, headers={"X-Next-Page": "2"}),
+        create_mock_response(gitlab_repository_issues_json, headers={"X-Next-Page": ""}),
+    ]
+
+    issues = list(vcs_clients.GitlabClient(vcs_account).get_repository_issues(1))
+
+    assert len(issues) == len(gitlab_repository_issues_json) * 2
+    assert mock_request.call_count == 2
+    assert "page=2" in mock_request.call_args_list[1][0][1]
+    assert "per_page=100" in mock_request.call_args_list[1][0][1]
@@ -1,6 +1,6 @@
 from authlib.integrations.django_client import token_update
 from django.dispatch import receiver
-from openwiden.users import models
+from openwiden.users import models, services
 
 
 @receiver(token_update)
@@ -18,3 +18,4 @@ def update_token(name, token, refresh_token=None, access_token=None, **kwargs) -
         vcs_account.refresh_token = token["refresh_token"]
         vcs_account.expires_at = token["expires_at"]
         vcs_account.save(update_fields=("access_token", "refresh_token", "expires_at"))
+        services.bump_token_version(vcs_account=vcs_account)
@@ -1,5 +1,5 @@
 from logging import getLogger
-from typing import Union
+from typing import Optional, Union
 from uuid import uuid4
 
 import requests
@@ -9,10 +9,11 @@ from django.contrib.auth.models import AnonymousUser
 from django.core.files.base import ContentFile
 from django_q.tasks import async_task
 from django_redis import get_redis_connection
+from redis.exceptions import RedisError
 from rest_framework.request import Request
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from openwiden.repositories import services as repositories_services
+from openwiden.repositories import tasks as repositories_tasks
 
 from . import models, serializers, exceptions
 
@@ -188,6 +189,7 @@ def oauth(*, vcs: str, user: Union[models.User, AnonymousUser], request: Request
         # Save changes for vcs_account
         if update_fields:
             vcs_account.save(update_fields=update_fields)
+            bump_token_version(vcs_account=vcs_account)
 
         # Return vcs_account's user, because we can handle case when
         # user is not authenticated, but vcs_account for specified profile does exist.
@@ -224,7 +226,7 @@ def create_vcs_account(
     # Save vcs account instance
     if serializer.is_valid():
         vcs_account = serializer.save()
-        async_task(repositories_services.sync_user_repositories, vcs_account=vcs_account)
+        async_task(repositories_tasks.sync_user_repositories, vcs_account=vcs_account)
         return vcs_account
     else:
         raise exceptions.InvalidVCSAccount(serializer_errors=serializer.errors)
@@ -241,3 +243,31 @@ def send_notification(*, user: models.User, message: str) -> None:
 
     redis = get_redis_connection()
     redis.publish(str(user.id), message)
+
+
+def _get_token_version_key(vcs_account: models.VCSAccount) -> str:
+    return f"vcs_account:{vcs_account.id}:token_version"
+
+
+def get_token_version(*, vcs_account: models.VCSAccount) -> Optional[int]:
+    """
+    Returns VCS account token version, that is changed on every token rotation.
+    None is returned if the version is unknown (redis is unavailable).
+    """
+    try:
+        version = get_redis_connection().get(_get_token_version_key(vcs_account))
+    except RedisError as e:
+        log.warning(f"[Service] failed to get token version for vcs account {vcs_account.id}: {e}")
+        return None
+    else:
+        return int(version) if version else 0
+
+
+def bump_token_version(*, vcs_account: models.VCSAccount) -> None:
+    """
+    Notifies VCS clients, that VCS account token was rotated and cached token should be reloaded.
+    """
+    try:
+        get_redis_connection().incr(_get_token_version_key(vcs_account))
+    except RedisError as e:
+        log.warning(f"[Service] failed to bump token version for vcs account {vcs_account.id}: {e}")
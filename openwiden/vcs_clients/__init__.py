@@ -1,4 +1,7 @@
+from .abstract import RepositoryData
 from .github.client import GitHubClient
+from .github.async_client import AsyncGitHubClient
 from .gitlab.client import GitlabClient
+from .gitlab.async_client import AsyncGitlabClient
 
-__all__ = ("GitHubClient", "GitlabClient")
+__all__ = ("GitHubClient", "GitlabClient", "AsyncGitHubClient", "AsyncGitlabClient", "RepositoryData")
@@ -1,26 +1,108 @@
-from typing import Union, List, Dict
+import time
+from typing import Union, List, Dict, Iterable, Iterator, NamedTuple, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin
 
+from django.conf import settings
 from requests import Response
 
+from openwiden.enums import OrganizationMembershipType
 from openwiden.users import services, models
 
+from . import cache, exceptions, rate_limit, sessions
+
 JsonAbleType = Union[str, int, float, bool, None]
 JsonDictType = Dict[JsonAbleType, Union[JsonAbleType, List[dict]]]
 JsonListType = List[JsonDictType]
 JsonType = Union[JsonListType, JsonDictType]
 
 
+def set_query_params(url: str, **params) -> str:
+    """
+    Returns url with the specified query params added or replaced.
+    """
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    query_params = dict(parse_qsl(query, keep_blank_values=True))
+    query_params.update({k: str(v) for k, v in params.items()})
+    return urlunsplit((scheme, netloc, path, urlencode(query_params), fragment))
+
+
+class RepositoryData(NamedTuple):
+    """
+    Repository data, that is fetched from VCS on repository add.
+    """
+
+    repository: object
+    programming_languages: dict
+    issues: Iterable
+    organization: object = None
+    membership_type: Optional[OrganizationMembershipType] = None
+
+
 class AbstractVCSClient:
+    # Maximum page size, that is supported by the VCS API list endpoints
+    per_page: int = 100
+
     def __init__(self, vcs_account: models.VCSAccount) -> None:
         self.vcs_account = vcs_account
         self._client = services.get_client(vcs=vcs_account.vcs)
+        self._session = sessions.create_session(self._client)
+        self._token: Optional[dict] = None
+        self._token_version: Optional[int] = None
+
+    def _token_expires_soon(self) -> bool:
+        expires_at = self._token.get("expires_at")
+        if expires_at is None:
+            return False
+        return expires_at - settings.VCS_CLIENTS["TOKEN_EXPIRES_LEEWAY"] <= time.time()
 
     def _get_token(self) -> dict:
-        self.vcs_account.refresh_from_db()
-        return self.vcs_account.to_token()
+        """
+        Returns cached VCS account token. Token is reloaded from the DB only if it's going to expire soon
+        or it was rotated since the last load (token version is changed or unknown).
+        """
+        token_version = services.get_token_version(vcs_account=self.vcs_account)
+
+        token_is_rotated = token_version is None or token_version != self._token_version
+
+        if self._token is None or token_is_rotated or self._token_expires_soon():
+            self.vcs_account.refresh_from_db()
+            self._token = self.vcs_account.to_token()
+            self._token_version = token_version
+
+        return self._token
+
+    def _get_active_token(self) -> dict:
+        """
+        Returns cached VCS account token, that is refreshed in place if it's expired.
+        Used by the async clients, that send requests with another HTTP client.
+        """
+        self._session.token = self._get_token()
+        self._session.token_auth.ensure_active_token()
+        return dict(self._session.token)
+
+    def _get_next_page_url(self, url: str, response: Response) -> Optional[str]:
+        """
+        Returns next page url from the list endpoint response or None for the last page.
+        """
+        raise NotImplementedError
+
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        if not url.startswith(("https://", "http://")):
+            url = urljoin(self._client.api_base_url, url)
+
+        rate_limit.wait(vcs_account=self.vcs_account)
+
+        self._session.token = self._get_token()
+        response = self._session.request(method, url, **kwargs)
+
+        budget = rate_limit.record(vcs_account=self.vcs_account, headers=response.headers)
+        if response.status_code in (403, 429) and budget and budget["remaining"] == 0:
+            raise exceptions.RateLimitExceeded(self.vcs_account.id, rate_limit.get_reset_at(budget))
+
+        return response
 
     def _post(self, url: str, data: dict) -> JsonType:
-        response = self._client.post(url, token=self._get_token(), json=data)
+        response = self._request("POST", url, json=data)
 
         # TODO: rewrite exception handler
         if response.status_code not in [201, 200]:
@@ -29,7 +111,7 @@ class AbstractVCSClient:
         return response.json()
 
     def _get(self, url: str, return_response: bool = False) -> Union[JsonType, Response]:
-        response = self._client.get(url, token=self._get_token())
+        response = self._request("GET", url)
 
         if return_response:
             return response
@@ -39,8 +121,42 @@ class AbstractVCSClient:
 
         return response.json()
 
+    def _get_conditional(self, url: str) -> JsonType:
+        """
+        Sends conditional GET request with the cached response validators (If-None-Match / If-Modified-Since)
+        and returns cached response body, if resource is not modified (304 responses do not count against
+        the rate limit).
+        """
+        cached_response = cache.get_response(vcs_account=self.vcs_account, url=url)
+        response = self._request("GET", url, headers=cache.get_conditional_headers(cached_response))
+        data, etag, last_modified = cache.resolve_response(response, cached_response)
+
+        if etag or last_modified:
+            cache.set_response(
+                vcs_account=self.vcs_account, url=url, etag=etag, last_modified=last_modified, data=data,
+            )
+
+        return data
+
+    def _get_paginated(self, url: str) -> Iterator[JsonDictType]:
+        """
+        Yields items of the list endpoint page by page, following next page links until the last page.
+        Only one page is kept in memory at a time.
+        """
+        url = set_query_params(url, per_page=self.per_page)
+
+        while url:
+            response = self._get(url, return_response=True)
+
+            if response.status_code != 200:
+                raise ValueError(f"request failed: {response.json()}")
+
+            yield from response.json()
+
+            url = self._get_next_page_url(url, response)
+
     def _delete(self, url: str) -> None:
-        response = self._client.delete(url=url, token=self._get_token())
+        response = self._request("DELETE", url)
 
         if response.status_code != 204:
             raise ValueError(f"request failed: {response.json()}")
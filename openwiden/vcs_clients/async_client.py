@@ -0,0 +1,95 @@
+import asyncio
+from typing import List, Type
+from urllib.parse import urljoin
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from openwiden.users import models
+
+from . import cache, exceptions, rate_limit
+from .abstract import AbstractVCSClient, JsonDictType, JsonType, set_query_params
+
+
+class AbstractAsyncVCSClient:
+    """
+    Asyncio variant of the VCS client: requests are sent with httpx concurrently (bounded by the semaphore),
+    while token management, url building and response parsing are shared with the sync client.
+    Blocking calls (DB, Redis) are run in threads, so the client could be used from the ASGI app.
+    """
+
+    sync_client_class: Type[AbstractVCSClient]
+
+    def __init__(self, vcs_account: models.VCSAccount) -> None:
+        self.vcs_account = vcs_account
+        self._sync_client = self.sync_client_class(vcs_account)
+        self._semaphore = asyncio.Semaphore(settings.VCS_CLIENTS["ASYNC_MAX_CONCURRENCY"])
+        self._http = httpx.AsyncClient()
+
+    async def __aenter__(self) -> "AbstractAsyncVCSClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _request(self, method: str, url: str, headers: dict = None, **kwargs) -> httpx.Response:
+        if not url.startswith(("https://", "http://")):
+            url = urljoin(self._sync_client._client.api_base_url, url)
+
+        async with self._semaphore:
+            await sync_to_async(rate_limit.wait)(vcs_account=self.vcs_account)
+            token = await sync_to_async(self._sync_client._get_active_token)()
+            headers = dict(headers or {}, Authorization=f"{token['token_type'].title()} {token['access_token']}")
+            response = await self._http.request(method, url, headers=headers, **kwargs)
+
+        budget = await sync_to_async(rate_limit.record)(vcs_account=self.vcs_account, headers=response.headers)
+        if response.status_code in (403, 429) and budget and budget["remaining"] == 0:
+            raise exceptions.RateLimitExceeded(self.vcs_account.id, rate_limit.get_reset_at(budget))
+
+        return response
+
+    async def _get(self, url: str) -> JsonType:
+        response = await self._request("GET", url)
+
+        if response.status_code != 200:
+            raise ValueError(f"request failed: {response.json()}")
+
+        return response.json()
+
+    async def _get_conditional(self, url: str) -> JsonType:
+        """
+        Async variant of the AbstractVCSClient._get_conditional.
+        """
+        cached_response = await sync_to_async(cache.get_response)(vcs_account=self.vcs_account, url=url)
+        response = await self._request("GET", url, headers=cache.get_conditional_headers(cached_response))
+        data, etag, last_modified = cache.resolve_response(response, cached_response)
+
+        if etag or last_modified:
+            await sync_to_async(cache.set_response)(
+                vcs_account=self.vcs_account, url=url, etag=etag, last_modified=last_modified, data=data,
+            )
+
+        return data
+
+    async def _get_paginated(self, url: str) -> List[JsonDictType]:
+        """
+        Returns items of all list endpoint pages (pages are requested one by one, following next page links).
+        """
+        url = set_query_params(url, per_page=self._sync_client.per_page)
+        items = []
+
+        while url:
+            response = await self._request("GET", url)
+
+            if response.status_code != 200:
+                raise ValueError(f"request failed: {response.json()}")
+
+            items.extend(response.json())
+
+            url = self._sync_client._get_next_page_url(url, response)
+
+        return items
@@ -0,0 +1,99 @@
+import json
+import time
+from hashlib import sha1
+from logging import getLogger
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from openwiden.users import models
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "vcs_clients:validators"
+
+# Sorted set of the cached response keys scored by the write time, that is used to evict the oldest entries
+INDEX_KEY = f"{KEY_PREFIX}:index"
+
+
+def _get_key(vcs_account: models.VCSAccount, url: str) -> str:
+    # Responses are cached per account, because the same url may return different data for different accounts
+    url_hash = sha1(url.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{vcs_account.id}:{url_hash}"
+
+
+def get_response(*, vcs_account: models.VCSAccount, url: str) -> Optional[dict]:
+    """
+    Returns cached response validators (etag, last_modified) and parsed response body (data) or None.
+    """
+    try:
+        value = get_redis_connection().get(_get_key(vcs_account, url))
+    except RedisError as e:
+        log.warning(f"[VCS cache] failed to get cached response for {url}: {e}")
+        return None
+
+    return json.loads(value) if value else None
+
+
+def set_response(
+    *, vcs_account: models.VCSAccount, url: str, etag: Optional[str], last_modified: Optional[str], data,
+) -> None:
+    """
+    Caches response validators and parsed response body. Cache size is bounded by the max entries count:
+    the oldest entries are evicted on write. Every entry also expires after TTL.
+    """
+    ttl = settings.VCS_CLIENTS["VALIDATORS_CACHE_TTL"]
+    max_entries = settings.VCS_CLIENTS["VALIDATORS_CACHE_MAX_ENTRIES"]
+    key = _get_key(vcs_account, url)
+    value = json.dumps(dict(etag=etag, last_modified=last_modified, data=data))
+    now = time.time()
+
+    try:
+        redis = get_redis_connection()
+
+        pipeline = redis.pipeline()
+        pipeline.setex(key, ttl, value)
+        pipeline.zadd(INDEX_KEY, {key: now})
+        pipeline.zremrangebyscore(INDEX_KEY, "-inf", now - ttl)
+        pipeline.execute()
+
+        evicted_keys = redis.zrange(INDEX_KEY, 0, -(max_entries + 1))
+        if evicted_keys:
+            pipeline = redis.pipeline()
+            pipeline.delete(*evicted_keys)
+            pipeline.zrem(INDEX_KEY, *evicted_keys)
+            pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[VCS cache] failed to cache response for {url}: {e}")
+
+
+def get_conditional_headers(cached_response: Optional[dict]) -> dict:
+    """
+    Returns conditional request headers from the cached response validators.
+    """
+    headers = {}
+    if cached_response:
+        if cached_response["etag"]:
+            headers["If-None-Match"] = cached_response["etag"]
+        if cached_response["last_modified"]:
+            headers["If-Modified-Since"] = cached_response["last_modified"]
+    return headers
+
+
+def resolve_response(response, cached_response: Optional[dict]) -> Tuple[object, Optional[str], Optional[str]]:
+    """
+    Returns parsed response body (cached one, if resource is not modified) and actual response validators.
+    """
+    if response.status_code == 304 and cached_response:
+        data = cached_response["data"]
+    elif response.status_code == 200:
+        data = response.json()
+    else:
+        raise ValueError(f"request failed: {response.json()}")
+
+    etag = response.headers.get("ETag") or (cached_response or {}).get("etag")
+    last_modified = response.headers.get("Last-Modified") or (cached_response or {}).get("last_modified")
+
+    return data, etag, last_modified
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+
+class RateLimitExceeded(Exception):
+    """
+    VCS account rate limit is exhausted (or is going to be exhausted) until reset time.
+    """
+
+    def __init__(self, vcs_account_id, reset_at: datetime) -> None:
+        self.vcs_account_id = vcs_account_id
+        self.reset_at = reset_at
+        super().__init__(f"rate limit of vcs account {vcs_account_id} is exceeded until {reset_at.isoformat()}")
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+from typing import List
+
+from . import models
+from .client import (
+    GitHubClient,
+    convert_lines_count_to_percentages,
+    get_repository_issues_url,
+    parse_issues,
+    parse_organization_membership,
+)
+from ..abstract import RepositoryData
+from ..async_client import AbstractAsyncVCSClient
+from ...enums import OrganizationMembershipType
+
+
+class AsyncGitHubClient(AbstractAsyncVCSClient):
+    sync_client_class = GitHubClient
+
+    async def get_repository(self, repository_id: int) -> models.Repository:
+        json = await self._get_conditional(f"repositories/{repository_id}")
+        return models.Repository.from_json(json)
+
+    async def get_repository_languages(self, repository_id: int) -> dict:
+        json = await self._get_conditional(f"repositories/{repository_id}/languages")
+        return convert_lines_count_to_percentages(json)
+
+    async def get_repository_issues(
+        self, repository_id: int, state: str = "open", since: datetime = None,
+    ) -> List[models.Issue]:
+        url = get_repository_issues_url(repository_id, state=state, since=since)
+        return list(parse_issues(await self._get_paginated(url)))
+
+    async def get_organization(self, organization_id: int) -> models.Organization:
+        json = await self._get_conditional(f"organizations/{organization_id}")
+        return models.Organization.from_json(json)
+
+    async def check_organization_membership(self, organization_id: int) -> OrganizationMembershipType:
+        response = await self._request("GET", f"user/memberships/organizations/{organization_id}")
+        return parse_organization_membership(response)
+
+    async def get_repository_data(
+        self, repository_id: int, organization_id: int = None, issues_since: datetime = None,
+    ) -> RepositoryData:
+        """
+        Fetches repository, its programming languages, issues and organization (if specified) concurrently.
+        """
+        requests = [
+            self.get_repository(repository_id),
+            self.get_repository_languages(repository_id),
+            self.get_repository_issues(repository_id, since=issues_since),
+        ]
+        if organization_id:
+            requests += [self.get_organization(organization_id), self.check_organization_membership(organization_id)]
+
+        return RepositoryData(*await asyncio.gather(*requests))
@@ -1,7 +1,11 @@
-from typing import List
+from datetime import datetime, timezone
+from itertools import chain
+from typing import List, Iterable, Iterator, Optional
 
-from . import models
-from ..abstract import AbstractVCSClient
+from requests import Response
+
+from . import graphql, models
+from ..abstract import AbstractVCSClient, RepositoryData, set_query_params
 from ...enums import OrganizationMembershipType
 
 
@@ -15,7 +19,51 @@ def convert_lines_count_to_percentages(repository_languages: dict) -> dict:
     return repository_languages
 
 
+def get_repository_issues_url(repository_id: int, state: str = "open", since: datetime = None) -> str:
+    url = f"repositories/{repository_id}/issues?state={state}"
+
+    if since:
+        since = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        url = set_query_params(url, state="all", since=since)
+
+    return url
+
+
+def parse_issues(issues_data: Iterable[dict]) -> Iterator[models.Issue]:
+    for issue_data in issues_data:
+        # Note: GitHub's REST API v3 considers every pull request an issue,
+        # but not every issue is a pull request. For this reason, "Issues"
+        # endpoints may return both issues and pull requests in the response.
+        # We can identify pull requests by the pull_request key.
+        if "pull_request" not in issue_data:
+            yield models.Issue.from_json(issue_data)
+
+
+def parse_organization_membership(response: Response) -> OrganizationMembershipType:
+    response_json = response.json()
+
+    # Check response status code and role, if request is success
+    if response.status_code == 200:
+        if response_json["role"] == OrganizationMembershipType.ADMIN:
+            return OrganizationMembershipType.ADMIN
+        elif response_json["role"] == OrganizationMembershipType.MEMBER:
+            return OrganizationMembershipType.MEMBER
+        else:
+            raise ValueError(f"unexpected role retrieved: {response_json['role']}")
+    elif response.status_code == 404:
+        return OrganizationMembershipType.NOT_A_MEMBER
+    else:
+        raise ValueError("check organization membership failed, please, try again.")
+
+
 class GitHubClient(AbstractVCSClient):
+    def _get_next_page_url(self, url: str, response: Response) -> Optional[str]:
+        """
+        GitHub docs:
+        https://developer.github.com/v3/guides/traversing-with-pagination/
+        """
+        return response.links.get("next", {}).get("url")
+
     def create_webhook(
         self, repository_id: int, url: str, secret: str, events: List[str] = None, active: bool = True,
     ) -> models.Webhook:
@@ -46,25 +94,64 @@ class GitHubClient(AbstractVCSClient):
         url = f"repositories/{repository_id}/hooks/{webhook_id}"
         self._delete(url=url)
 
-    def get_repository_issues(self, repository_id: int, state: str = "open") -> List[models.Issue]:
-        json = self._get(url=f"repositories/{repository_id}/issues?state={state}")
-        # Note: GitHub's REST API v3 considers every pull request an issue,
-        # but not every issue is a pull request. For this reason, "Issues"
-        # endpoints may return both issues and pull requests in the response.
-        # We can identify pull requests by the pull_request key.
-        json = [issue for issue in json if "pull_request" not in issue]
-        return [models.Issue.from_json(issue_data) for issue_data in json]
+    def get_repository_issues(
+        self, repository_id: int, state: str = "open", since: datetime = None,
+    ) -> Iterator[models.Issue]:
+        """
+        Returns repository issues. If since is specified, then only issues updated at or after this time
+        are returned including closed ones, so issue state changes could be synced too.
+
+        GitHub docs:
+        https://developer.github.com/v3/issues/#list-repository-issues
+        """
+        url = get_repository_issues_url(repository_id, state=state, since=since)
+        return parse_issues(self._get_paginated(url=url))
+
+    def _query_repository(self, variables: dict) -> dict:
+        json = self._post("graphql", data=dict(query=graphql.REPOSITORY_QUERY, variables=variables))
+
+        if json.get("errors"):
+            raise ValueError(f"query failed: {json['errors']}")
+
+        return json["data"]["repository"]
+
+    def _query_repository_issues(self, variables: dict, cursor: str) -> Iterator[models.Issue]:
+        while cursor:
+            data = self._query_repository(dict(variables, issuesCursor=cursor))
+            yield from graphql.parse_issues(data)
+            page_info = data["issues"]["pageInfo"]
+            cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+    def get_repository_data(self, *, owner: str, name: str, issues_since: datetime = None) -> RepositoryData:
+        """
+        Fetches repository, its programming languages and issues (open ones or all updated since the specified
+        time) with the GraphQL API: the first query returns everything with the first issues page,
+        next issues pages are requested lazily, while the issues are consumed.
+        """
+        variables = dict(owner=owner, name=name, issuesStates=["OPEN"])
+        if issues_since:
+            variables.update(issuesStates=None, issuesSince=issues_since.astimezone(timezone.utc).isoformat())
+
+        data = self._query_repository(variables)
+        page_info = data["issues"]["pageInfo"]
+        next_cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+        return RepositoryData(
+            repository=graphql.parse_repository(data),
+            programming_languages=convert_lines_count_to_percentages(graphql.parse_languages(data)),
+            issues=chain(graphql.parse_issues(data), self._query_repository_issues(variables, next_cursor)),
+        )
 
     def get_repository_languages(self, repository_id: int) -> dict:
-        json = self._get(url=f"repositories/{repository_id}/languages")
+        json = self._get_conditional(f"repositories/{repository_id}/languages")
         return convert_lines_count_to_percentages(json)
 
     def get_repository(self, repository_id: int) -> models.Repository:
-        json = self._get(f"repositories/{repository_id}")
+        json = self._get_conditional(f"repositories/{repository_id}")
         return models.Repository.from_json(json)
 
     def get_organization(self, organization_id: int) -> models.Organization:
-        json = self._get(url=f"organizations/{organization_id}")
+        json = self._get_conditional(f"organizations/{organization_id}")
         return models.Organization.from_json(json)
 
     def check_organization_membership(self, organization_id: int) -> OrganizationMembershipType:
@@ -72,21 +159,9 @@ class GitHubClient(AbstractVCSClient):
             f"user/memberships/organizations/{organization_id}",
             return_response=True,
         )
-        response_json = response.json()
-
-        # Check response status code and role, if request is success
-        if response.status_code == 200:
-            if response_json["role"] == OrganizationMembershipType.ADMIN:
-                return OrganizationMembershipType.ADMIN
-            elif response_json["role"] == OrganizationMembershipType.MEMBER:
-                return OrganizationMembershipType.MEMBER
-            else:
-                raise ValueError(f"unexpected role retrieved: {response_json['role']}")
-        elif response.status_code == 404:
-            return OrganizationMembershipType.NOT_A_MEMBER
-        else:
-            raise ValueError("check organization membership failed, please, try again.")
+        return parse_organization_membership(response)
 
-    def get_user_repositories(self) -> List[models.Repository]:
-        json = self._get(url="user/repos?affiliation=owner,organization_member&visibility=public")
-        return [models.Repository.from_json(data) for data in json if not data["archived"]]
+    def get_user_repositories(self) -> Iterator[models.Repository]:
+        for data in self._get_paginated(url="user/repos?affiliation=owner,organization_member&visibility=public"):
+            if not data["archived"]:
+                yield models.Repository.from_json(data)
@@ -0,0 +1,118 @@
+"""
+GitHub GraphQL API v4 query, that fetches repository with its languages and issues in one paged request.
+
+GitHub docs:
+https://developer.github.com/v4/object/repository/
+"""
+from typing import List
+
+from . import models
+
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!, $issuesCursor: String, $issuesStates: [IssueState!], $issuesSince: DateTime) {
+  repository(owner: $owner, name: $name) {
+    databaseId
+    name
+    description
+    url
+    isPrivate
+    forkCount
+    createdAt
+    updatedAt
+    stargazers {
+      totalCount
+    }
+    openIssues: issues(states: OPEN) {
+      totalCount
+    }
+    openPullRequests: pullRequests(states: OPEN) {
+      totalCount
+    }
+    owner {
+      __typename
+      login
+      ... on User {
+        databaseId
+      }
+      ... on Organization {
+        databaseId
+      }
+    }
+    languages(first: 100) {
+      edges {
+        size
+        node {
+          name
+        }
+      }
+    }
+    issues(first: 100, after: $issuesCursor, states: $issuesStates, filterBy: {since: $issuesSince}) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        databaseId
+        title
+        url
+        body
+        state
+        createdAt
+        updatedAt
+        closedAt
+        labels(first: 100) {
+          nodes {
+            name
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def parse_repository(data: dict) -> models.Repository:
+    owner_type = models.OwnerType(data["owner"]["__typename"])
+    return models.Repository.from_json(
+        dict(
+            id=data["databaseId"],
+            name=data["name"],
+            description=data["description"],
+            html_url=data["url"],
+            stargazers_count=data["stargazers"]["totalCount"],
+            # REST API counts open pull requests as issues as well
+            open_issues_count=data["openIssues"]["totalCount"] + data["openPullRequests"]["totalCount"],
+            forks_count=data["forkCount"],
+            created_at=data["createdAt"],
+            updated_at=data["updatedAt"],
+            private=data["isPrivate"],
+            owner=dict(id=data["owner"]["databaseId"], login=data["owner"]["login"], type=owner_type),
+        )
+    )
+
+
+def parse_languages(data: dict) -> dict:
+    """
+    Returns languages lines count (bytes) by language name, as the REST API does.
+    """
+    return {edge["node"]["name"]: edge["size"] for edge in data["languages"]["edges"]}
+
+
+def parse_issues(data: dict) -> List[models.Issue]:
+    return [
+        models.Issue.from_json(
+            dict(
+                id=issue["databaseId"],
+                title=issue["title"],
+                html_url=issue["url"],
+                body=issue["body"],
+                state=issue["state"].lower(),
+                labels=issue["labels"]["nodes"],
+                created_at=issue["createdAt"],
+                updated_at=issue["updatedAt"],
+                closed_at=issue["closedAt"],
+            )
+        )
+        for issue in data["issues"]["nodes"]
+    ]
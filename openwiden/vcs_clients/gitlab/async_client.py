@@ -0,0 +1,48 @@
+import asyncio
+from datetime import datetime
+from typing import List
+
+from .client import GitlabClient, get_repository_issues_url, parse_organization_membership
+from .models import Repository, Issue, Organization
+from ..abstract import RepositoryData
+from ..async_client import AbstractAsyncVCSClient
+from ...enums import OrganizationMembershipType
+
+
+class AsyncGitlabClient(AbstractAsyncVCSClient):
+    sync_client_class = GitlabClient
+
+    async def get_repository(self, repository_id: int) -> Repository:
+        json = await self._get_conditional(f"projects/{repository_id}")
+        return Repository.from_json(json)
+
+    async def get_repository_programming_languages(self, repository_id: int) -> dict:
+        return await self._get_conditional(f"projects/{repository_id}/languages")
+
+    async def get_repository_issues(self, repository_id: int, updated_after: datetime = None) -> List[Issue]:
+        url = get_repository_issues_url(repository_id, updated_after=updated_after)
+        return [Issue.from_json(data) for data in await self._get_paginated(url)]
+
+    async def get_organization(self, organization_id: int) -> Organization:
+        json = await self._get_conditional(f"groups/{organization_id}")
+        return Organization.from_json(json)
+
+    async def check_organization_membership(self, organization_id: int) -> OrganizationMembershipType:
+        response = await self._request("GET", f"groups/{organization_id}/members/{self.vcs_account.remote_id}")
+        return parse_organization_membership(response)
+
+    async def get_repository_data(
+        self, repository_id: int, organization_id: int = None, issues_since: datetime = None,
+    ) -> RepositoryData:
+        """
+        Fetches repository, its programming languages, issues and organization (if specified) concurrently.
+        """
+        requests = [
+            self.get_repository(repository_id),
+            self.get_repository_programming_languages(repository_id),
+            self.get_repository_issues(repository_id, updated_after=issues_since),
+        ]
+        if organization_id:
+            requests += [self.get_organization(organization_id), self.check_organization_membership(organization_id)]
+
+        return RepositoryData(*await asyncio.gather(*requests))
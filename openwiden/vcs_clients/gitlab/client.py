@@ -1,28 +1,72 @@
-from typing import List
+from datetime import datetime
+from typing import Iterator, Optional
+
+from requests import Response
 
 from .models import Repository, Issue, Webhook, Organization
-from ..abstract import AbstractVCSClient
+from ..abstract import AbstractVCSClient, set_query_params
 from ...enums import OrganizationMembershipType
 
 
+def get_repository_issues_url(repository_id: int, updated_after: datetime = None) -> str:
+    url = f"projects/{repository_id}/issues?state=opened"
+
+    if updated_after:
+        url = set_query_params(url, state="all", updated_after=updated_after.isoformat())
+
+    return url
+
+
+def parse_organization_membership(response: Response) -> OrganizationMembershipType:
+    response_json = response.json()
+
+    # Check membership
+    if response.status_code == 200:
+        if response_json["access_level"] >= 40:
+            return OrganizationMembershipType.ADMIN
+        else:
+            return OrganizationMembershipType.MEMBER
+    elif response.status_code == 404:
+        return OrganizationMembershipType.NOT_A_MEMBER
+    else:
+        raise ValueError("unexpected status code for memebership check")
+
+
 class GitlabClient(AbstractVCSClient):
-    def get_user_repositories(self) -> List[Repository]:
-        json = self._get("projects/?membership=True&archived=False&visibility=public")
-        return [Repository.from_json(data) for data in json]
+    def _get_next_page_url(self, url: str, response: Response) -> Optional[str]:
+        """
+        Gitlab docs:
+        https://docs.gitlab.com/ee/api/README.html#pagination
+        """
+        next_page = response.headers.get("X-Next-Page")
+        if next_page:
+            return set_query_params(url, page=next_page)
+        return None
+
+    def get_user_repositories(self) -> Iterator[Repository]:
+        for data in self._get_paginated("projects/?membership=True&archived=False&visibility=public"):
+            yield Repository.from_json(data)
 
     def get_repository(self, repository_id: int) -> Repository:
-        json = self._get(f"projects/{repository_id}")
+        json = self._get_conditional(f"projects/{repository_id}")
         return Repository.from_json(json)
 
     def get_repository_programming_languages(self, repository_id: int) -> dict:
-        return self._get(f"projects/{repository_id}/languages")
+        return self._get_conditional(f"projects/{repository_id}/languages")
+
+    def get_repository_issues(self, repository_id: int, updated_after: datetime = None) -> Iterator[Issue]:
+        """
+        Returns opened repository issues. If updated_after is specified, then only issues updated at or
+        after this time are returned including closed ones, so issue state changes could be synced too.
 
-    def get_repository_issues(self, repository_id: int) -> List[Issue]:
-        json = self._get(f"projects/{repository_id}/issues?state=opened")
-        return [Issue.from_json(data) for data in json]
+        Gitlab docs:
+        https://docs.gitlab.com/ee/api/issues.html#list-project-issues
+        """
+        url = get_repository_issues_url(repository_id, updated_after=updated_after)
+        return (Issue.from_json(data) for data in self._get_paginated(url))
 
     def get_organization(self, organization_id: int) -> Organization:
-        data = self._get(f"groups/{organization_id}")
+        data = self._get_conditional(f"groups/{organization_id}")
         return Organization.from_json(data)
 
     def check_organization_membership(
@@ -33,18 +77,7 @@ class GitlabClient(AbstractVCSClient):
             f"groups/{organization_id}/members/{self.vcs_account.remote_id}",
             return_response=True,
         )
-        response_json = response.json()
-
-        # Check membership
-        if response.status_code == 200:
-            if response_json["access_level"] >= 40:
-                return OrganizationMembershipType.ADMIN
-            else:
-                return OrganizationMembershipType.MEMBER
-        elif response.status_code == 404:
-            return OrganizationMembershipType.NOT_A_MEMBER
-        else:
-            raise ValueError("unexpected status code for memebership check")
+        return parse_organization_membership(response)
 
     def create_webhook(
         self, *, repository_id: int, webhook_url: str, enable_issues_events: bool = True, secret: str,
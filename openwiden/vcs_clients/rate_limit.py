@@ -0,0 +1,132 @@
+import time
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import List, Mapping, Optional
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from openwiden.users import models
+
+from . import exceptions
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "vcs_clients:rate_limit"
+
+# Sorted set of the VCS accounts ids scored by the last budget update time
+INDEX_KEY = f"{KEY_PREFIX}:accounts"
+
+# GitHub sends X-RateLimit-* headers, GitLab sends RateLimit-* headers
+HEADER_PREFIXES = ("X-RateLimit-", "RateLimit-")
+
+
+def _get_key(vcs_account_id) -> str:
+    return f"{KEY_PREFIX}:{vcs_account_id}"
+
+
+def parse_headers(headers: Mapping[str, str]) -> Optional[dict]:
+    """
+    Returns rate limit budget (limit, remaining, reset) from the response headers or None,
+    if response has no rate limit headers.
+    """
+    for prefix in HEADER_PREFIXES:
+        remaining = headers.get(f"{prefix}Remaining")
+        if remaining is not None:
+            return dict(
+                limit=int(headers.get(f"{prefix}Limit", 0)),
+                remaining=int(remaining),
+                reset=int(headers.get(f"{prefix}Reset", 0)),
+            )
+    return None
+
+
+def get_reset_at(budget: dict) -> datetime:
+    return datetime.fromtimestamp(budget["reset"], timezone.utc)
+
+
+def record(*, vcs_account: models.VCSAccount, headers: Mapping[str, str]) -> Optional[dict]:
+    """
+    Saves remaining VCS account quota from the response headers, so it's shared by all workers.
+    """
+    budget = parse_headers(headers)
+    if budget is None:
+        return None
+
+    now = time.time()
+    key = _get_key(vcs_account.id)
+
+    try:
+        pipeline = get_redis_connection().pipeline()
+        pipeline.hset(key, mapping=dict(budget, vcs=vcs_account.vcs, updated_at=int(now)))
+        pipeline.expireat(key, max(budget["reset"], int(now)) + 60)
+        pipeline.zadd(INDEX_KEY, {str(vcs_account.id): now})
+        pipeline.zremrangebyscore(INDEX_KEY, "-inf", now - 60 * 60 * 24)
+        pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[VCS rate limit] failed to record budget of vcs account {vcs_account.id}: {e}")
+
+    return budget
+
+
+def _load_budget(value: dict) -> dict:
+    value = {k.decode(): v.decode() for k, v in value.items()}
+    return dict(
+        vcs=value["vcs"],
+        limit=int(value["limit"]),
+        remaining=int(value["remaining"]),
+        reset=int(value["reset"]),
+        updated_at=int(value["updated_at"]),
+    )
+
+
+def get_budget(*, vcs_account_id) -> Optional[dict]:
+    try:
+        value = get_redis_connection().hgetall(_get_key(vcs_account_id))
+    except RedisError as e:
+        log.warning(f"[VCS rate limit] failed to get budget of vcs account {vcs_account_id}: {e}")
+        return None
+
+    return _load_budget(value) if value else None
+
+
+def get_budgets() -> List[dict]:
+    """
+    Returns current rate limit budgets of the recently used VCS accounts.
+    """
+    try:
+        redis = get_redis_connection()
+        vcs_account_ids = [i.decode() for i in redis.zrange(INDEX_KEY, 0, -1)]
+        pipeline = redis.pipeline()
+        for vcs_account_id in vcs_account_ids:
+            pipeline.hgetall(_get_key(vcs_account_id))
+        values = pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[VCS rate limit] failed to get budgets: {e}")
+        return []
+
+    return [
+        dict(vcs_account_id=vcs_account_id, **_load_budget(value))
+        for vcs_account_id, value in zip(vcs_account_ids, values)
+        if value
+    ]
+
+
+def wait(*, vcs_account: models.VCSAccount) -> None:
+    """
+    Waits for the rate limit reset, if VCS account quota is almost exhausted and it's going to be reset soon.
+    Otherwise RateLimitExceeded is raised, so the task could be rescheduled to the reset time.
+    """
+    budget = get_budget(vcs_account_id=vcs_account.id)
+    if budget is None or budget["remaining"] > settings.VCS_CLIENTS["RATE_LIMIT_THRESHOLD"]:
+        return
+
+    delay = budget["reset"] - time.time()
+    if delay <= 0:
+        return
+    elif delay <= settings.VCS_CLIENTS["RATE_LIMIT_MAX_DELAY"]:
+        log.info(f"[VCS rate limit] vcs account {vcs_account.id} waits {delay:.1f}s for the rate limit reset")
+        time.sleep(delay)
+    else:
+        raise exceptions.RateLimitExceeded(vcs_account.id, get_reset_at(budget))
@@ -0,0 +1,72 @@
+from threading import Lock
+from typing import Dict
+from urllib.parse import urlsplit
+
+from authlib.integrations.django_client import DjangoRemoteApp
+from authlib.integrations.requests_client import OAuth2Session
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# Process-wide connection pools (one adapter per VCS host), that are shared
+# by all VCS clients and django-q tasks running in the same worker process.
+_adapters: Dict[str, HTTPAdapter] = {}
+_adapters_lock = Lock()
+
+
+def _get_base_url(url: str) -> str:
+    scheme, netloc, *_ = urlsplit(url)
+    return f"{scheme}://{netloc}/"
+
+
+def get_adapter(url: str) -> HTTPAdapter:
+    """
+    Returns keep-alive connection pool adapter for the host of the specified url.
+    """
+    base_url = _get_base_url(url)
+
+    with _adapters_lock:
+        if base_url not in _adapters:
+            _adapters[base_url] = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.VCS_CLIENTS["POOL_MAXSIZE"],
+                pool_block=settings.VCS_CLIENTS["POOL_BLOCK"],
+                max_retries=settings.VCS_CLIENTS["MAX_RETRIES"],
+            )
+
+    return _adapters[base_url]
+
+
+def create_session(client: DjangoRemoteApp) -> OAuth2Session:
+    """
+    Returns OAuth2 session for the authlib client, which sends API requests through the shared connection pool.
+    Token auto refresh and the token_update signal work the same way as for the authlib client requests.
+    """
+    session = client._get_oauth_client()
+    session.mount(_get_base_url(client.api_base_url), get_adapter(client.api_base_url))
+    return session
+
+
+def get_pool_stats() -> Dict[str, dict]:
+    """
+    Returns connection pool hit / miss counters for every VCS host.
+    Each request, that reuses already opened connection, is counted as a hit and
+    each new connection (TCP + TLS handshake) is counted as a miss.
+    """
+    stats = {}
+
+    with _adapters_lock:
+        adapters = list(_adapters.items())
+
+    for base_url, adapter in adapters:
+        requests_count = connections_count = 0
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                requests_count += pool.num_requests
+                connections_count += pool.num_connections
+
+        stats[base_url] = dict(
+            requests=requests_count, hits=max(requests_count - connections_count, 0), misses=connections_count,
+        )
+
+    return stats
@@ -0,0 +1,10 @@
+import pytest
+
+from openwiden.users import models as users_models
+
+
+@pytest.fixture
+def unsaved_vcs_account() -> users_models.VCSAccount:
+    return users_models.VCSAccount(
+        id=1, vcs="github", remote_id=1, login="test", access_token="token", token_type="bearer",
+    )
@@ -0,0 +1,96 @@
+import time
+from unittest import mock
+
+from openwiden.users import models as users_models
+from openwiden.vcs_clients import abstract
+from openwiden.vcs_clients.github.client import GitHubClient
+
+
+@mock.patch.object(users_models.VCSAccount, "refresh_from_db")
+@mock.patch.object(abstract.services, "get_token_version")
+class TestGetToken:
+    def test_token_is_cached(self, patched_get_token_version, patched_refresh_from_db, unsaved_vcs_account):
+        patched_get_token_version.return_value = 1
+        client = abstract.AbstractVCSClient(unsaved_vcs_account)
+
+        for _ in range(3):
+            assert client._get_token() == unsaved_vcs_account.to_token()
+
+        assert patched_refresh_from_db.call_count == 1
+
+    def test_token_is_reloaded_on_rotation(
+        self, patched_get_token_version, patched_refresh_from_db, unsaved_vcs_account
+    ):
+        patched_get_token_version.side_effect = [1, 1, 2]
+        client = abstract.AbstractVCSClient(unsaved_vcs_account)
+
+        for _ in range(3):
+            client._get_token()
+
+        assert patched_refresh_from_db.call_count == 2
+
+    def test_token_is_reloaded_if_version_is_unknown(
+        self, patched_get_token_version, patched_refresh_from_db, unsaved_vcs_account
+    ):
+        patched_get_token_version.return_value = None
+        client = abstract.AbstractVCSClient(unsaved_vcs_account)
+
+        for _ in range(2):
+            client._get_token()
+
+        assert patched_refresh_from_db.call_count == 2
+
+    def test_token_is_reloaded_if_expires_soon(
+        self, patched_get_token_version, patched_refresh_from_db, unsaved_vcs_account, settings
+    ):
+        settings.VCS_CLIENTS = {**settings.VCS_CLIENTS, "TOKEN_EXPIRES_LEEWAY": 60}
+        patched_get_token_version.return_value = 1
+        unsaved_vcs_account.expires_at = int(time.time()) + 30
+        client = abstract.AbstractVCSClient(unsaved_vcs_account)
+
+        for _ in range(2):
+            client._get_token()
+
+        assert patched_refresh_from_db.call_count == 2
+
+
+@mock.patch.object(abstract.cache, "set_response")
+@mock.patch.object(abstract.cache, "get_response")
+@mock.patch.object(abstract.AbstractVCSClient, "_get_token", return_value={"access_token": "token"})
+@mock.patch("requests.sessions.Session.request")
+def test_get_conditional_returns_cached_data_if_not_modified(
+    mock_request, mock_get_token, mock_get_response, mock_set_response, unsaved_vcs_account, create_mock_response,
+):
+    mock_get_response.return_value = dict(etag='"abc"', last_modified=None, data={"id": 1})
+    mock_request.return_value = create_mock_response(status_code=304, headers={"ETag": '"abc"'})
+
+    data = GitHubClient(unsaved_vcs_account)._get_conditional("repositories/1")
+
+    assert data == {"id": 1}
+    assert mock_request.call_args[1]["headers"] == {"If-None-Match": '"abc"'}
+    mock_set_response.assert_called_once_with(
+        vcs_account=unsaved_vcs_account, url="repositories/1", etag='"abc"', last_modified=None, data={"id": 1},
+    )
+
+
+@mock.patch.object(abstract.cache, "set_response")
+@mock.patch.object(abstract.cache, "get_response", return_value=None)
+@mock.patch.object(abstract.AbstractVCSClient, "_get_token", return_value={"access_token": "token"})
+@mock.patch("requests.sessions.Session.request")
+def test_get_conditional_caches_response_validators(
+    mock_request, mock_get_token, mock_get_response, mock_set_response, unsaved_vcs_account, create_mock_response,
+):
+    headers = {"ETag": '"abc"', "Last-Modified": "Mon, 03 Aug 2020 10:00:00 GMT"}
+    mock_request.return_value = create_mock_response({"id": 1}, headers=headers)
+
+    data = GitHubClient(unsaved_vcs_account)._get_conditional("repositories/1")
+
+    assert data == {"id": 1}
+    assert mock_request.call_args[1]["headers"] == {}
+    mock_set_response.assert_called_once_with(
+        vcs_account=unsaved_vcs_account,
+        url="repositories/1",
+        etag='"abc"',
+        last_modified="Mon, 03 Aug 2020 10:00:00 GMT",
+        data={"id": 1},
+    )
@@ -0,0 +1,53 @@
+import asyncio
+from unittest import mock
+
+from openwiden.enums import OrganizationMembershipType
+from openwiden.vcs_clients import AsyncGitHubClient, async_client
+
+
+@mock.patch("openwiden.vcs_clients.github.models.Organization.from_json")
+@mock.patch("openwiden.vcs_clients.github.models.Repository.from_json")
+@mock.patch.object(async_client.cache, "get_response", return_value=None)
+@mock.patch.object(async_client.rate_limit, "wait")
+@mock.patch.object(async_client.rate_limit, "record", return_value=None)
+@mock.patch.object(async_client.AbstractVCSClient, "_get_active_token")
+def test_get_repository_data_fetches_concurrently(
+    mock_get_active_token,
+    mock_record,
+    mock_wait,
+    mock_get_response,
+    mock_repository_from_json,
+    mock_organization_from_json,
+    unsaved_vcs_account,
+    settings,
+    create_mock_response,
+):
+    settings.VCS_CLIENTS = {**settings.VCS_CLIENTS, "ASYNC_MAX_CONCURRENCY": 2}
+    mock_get_active_token.return_value = {"access_token": "token", "token_type": "bearer"}
+    in_flight = max_in_flight = 0
+    responses = {
+        "https://api.github.com/repositories/1/languages": create_mock_response({"Python": 3, "Vue": 1}),
+        "https://api.github.com/repositories/1/issues?state=open&per_page=100": create_mock_response([]),
+        "https://api.github.com/organizations/2": create_mock_response({}),
+        "https://api.github.com/user/memberships/organizations/2": create_mock_response({"role": "admin"}),
+    }
+
+    async def request(method, url, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(in_flight, max_in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return responses.get(url, create_mock_response({}))
+
+    async def get_repository_data():
+        async with AsyncGitHubClient(unsaved_vcs_account) as client:
+            client._http.request = request
+            return await client.get_repository_data(1, organization_id=2)
+
+    data = asyncio.run(get_repository_data())
+
+    assert data.programming_languages == {"Python": 75.0, "Vue": 25.0}
+    assert data.issues == []
+    assert data.membership_type == OrganizationMembershipType.ADMIN
+    assert max_in_flight == 2
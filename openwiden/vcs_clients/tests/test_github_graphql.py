@@ -0,0 +1,87 @@
+from unittest import mock
+
+from openwiden.vcs_clients import GitHubClient
+from openwiden.vcs_clients.github import graphql, models
+from openwiden.vcs_clients.github.models import OwnerType
+
+
+def create_repository_json(issues: list, has_next_page: bool = False, end_cursor: str = None) -> dict:
+    return {
+        "data": {
+            "repository": {
+                "databaseId": 1,
+                "name": "openwiden",
+                "description": "description",
+                "url": "https://github.com/test/openwiden",
+                "isPrivate": False,
+                "forkCount": 2,
+                "createdAt": "2020-01-01T00:00:00Z",
+                "updatedAt": "2020-08-01T00:00:00Z",
+                "stargazers": {"totalCount": 3},
+                "openIssues": {"totalCount": 4},
+                "openPullRequests": {"totalCount": 1},
+                "owner": {"__typename": "Organization", "login": "test", "databaseId": 10},
+                "languages": {
+                    "edges": [{"size": 300, "node": {"name": "Python"}}, {"size": 100, "node": {"name": "Vue"}}],
+                },
+                "issues": {"pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor}, "nodes": issues},
+            }
+        }
+    }
+
+
+def create_issue_json(issue_id: int) -> dict:
+    return {
+        "databaseId": issue_id,
+        "title": "title",
+        "url": f"https://github.com/test/openwiden/issues/{issue_id}",
+        "body": "body",
+        "state": "OPEN",
+        "createdAt": "2020-08-01T00:00:00Z",
+        "updatedAt": "2020-08-01T00:00:00Z",
+        "closedAt": None,
+        "labels": {"nodes": [{"name": "good first issue"}]},
+    }
+
+
+@mock.patch.object(GitHubClient, "_post")
+def test_get_repository_data(mock_post, unsaved_vcs_account):
+    mock_post.side_effect = [
+        create_repository_json([create_issue_json(1)], has_next_page=True, end_cursor="cursor"),
+        create_repository_json([create_issue_json(2)]),
+    ]
+
+    data = GitHubClient(unsaved_vcs_account).get_repository_data(owner="test", name="openwiden")
+
+    assert data.repository.repository_id == 1
+    assert data.repository.owner.owner_type == OwnerType.ORGANIZATION
+    assert data.programming_languages == {"Python": 75.0, "Vue": 25.0}
+    assert mock_post.call_count == 1
+
+    issues = list(data.issues)
+
+    assert [issue.issue_id for issue in issues] == [1, 2]
+    assert issues[0].state == "open"
+    assert issues[0].labels == ["good first issue"]
+    assert mock_post.call_args[1]["data"]["variables"]["issuesCursor"] == "cursor"
+
+
+def test_open_issues_count_matches_rest_api():
+    rest_json = dict(
+        id=1,
+        name="openwiden",
+        description="description",
+        html_url="https://github.com/test/openwiden",
+        stargazers_count=3,
+        # Open issues and pull requests
+        open_issues_count=5,
+        forks_count=2,
+        created_at="2020-01-01T00:00:00Z",
+        updated_at="2020-08-01T00:00:00Z",
+        private=False,
+        owner=dict(id=10, login="test", type=OwnerType.ORGANIZATION),
+    )
+
+    repository = graphql.parse_repository(create_repository_json([])["data"]["repository"])
+
+    assert repository.open_issues_count == models.Repository.from_json(rest_json).open_issues_count
@@ -0,0 +1,45 @@
+import time
+from unittest import mock
+
+import pytest
+
+from openwiden.vcs_clients import rate_limit, exceptions
+
+
+@pytest.mark.parametrize("prefix", ["X-RateLimit-", "RateLimit-"])
+def test_parse_headers(prefix):
+    headers = {f"{prefix}Limit": "5000", f"{prefix}Remaining": "4999", f"{prefix}Reset": "1596456000"}
+
+    assert rate_limit.parse_headers(headers) == dict(limit=5000, remaining=4999, reset=1596456000)
+
+
+def test_parse_headers_without_rate_limit():
+    assert rate_limit.parse_headers({}) is None
+
+
+@mock.patch.object(rate_limit.time, "sleep")
+@mock.patch.object(rate_limit, "get_budget")
+class TestWait:
+    def test_budget_is_enough(self, patched_get_budget, patched_sleep, unsaved_vcs_account):
+        patched_get_budget.return_value = dict(remaining=100, reset=int(time.time()) + 10)
+
+        rate_limit.wait(vcs_account=unsaved_vcs_account)
+
+        patched_sleep.assert_not_called()
+
+    def test_waits_for_reset(self, patched_get_budget, patched_sleep, unsaved_vcs_account, settings):
+        settings.VCS_CLIENTS = {**settings.VCS_CLIENTS, "RATE_LIMIT_THRESHOLD": 10, "RATE_LIMIT_MAX_DELAY": 30}
+        patched_get_budget.return_value = dict(remaining=5, reset=int(time.time()) + 10)
+
+        rate_limit.wait(vcs_account=unsaved_vcs_account)
+
+        patched_sleep.assert_called_once()
+
+    def test_raises_if_reset_is_far(self, patched_get_budget, patched_sleep, unsaved_vcs_account, settings):
+        settings.VCS_CLIENTS = {**settings.VCS_CLIENTS, "RATE_LIMIT_THRESHOLD": 10, "RATE_LIMIT_MAX_DELAY": 30}
+        patched_get_budget.return_value = dict(remaining=0, reset=int(time.time()) + 600)
+
+        with pytest.raises(exceptions.RateLimitExceeded):
+            rate_limit.wait(vcs_account=unsaved_vcs_account)
+
+        patched_sleep.assert_not_called()
@@ -0,0 +1,20 @@
+from openwiden.users import services as users_services
+from openwiden.vcs_clients import sessions
+
+
+def test_adapter_is_shared_per_host(settings, authlib_settings_github):
+    settings.AUTHLIB_OAUTH_CLIENTS = {"github": authlib_settings_github}
+    client = users_services.get_client(vcs="github")
+
+    first_session = sessions.create_session(client)
+    second_session = sessions.create_session(client)
+
+    assert first_session is not second_session
+    assert first_session.get_adapter("https://api.github.com/user") is sessions.get_adapter("https://api.github.com/")
+    assert second_session.get_adapter("https://api.github.com/user") is sessions.get_adapter("https://api.github.com/")
+
+
+def test_get_pool_stats():
+    sessions.get_adapter("https://stats.example.com/api/")
+
+    assert sessions.get_pool_stats()["https://stats.example.com/"] == dict(requests=0, hits=0, misses=0)
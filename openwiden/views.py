@@ -1,8 +1,12 @@
 import typing as t
 
 from openwiden import exceptions
+from openwiden.vcs_clients import rate_limit, sessions
+from openwiden.webhooks import batches as webhooks_batches, deliveries as webhooks_deliveries, queue as webhooks_queue
 from rest_framework import permissions
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.views import exception_handler as drf_exception_handler
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
@@ -27,3 +31,28 @@ def exception_handler(exception, context) -> t.Optional[Response]:
         return Response(data=exception.detail, status=exception.status_code)
     else:
         return drf_exception_handler(exception, context)
+
+
+class MetricsView(APIView):
+    """
+    Admin only metrics: VCS clients connection pools usage (current process), VCS accounts rate limit budgets
+    webhook events queue depth and lag, consumer batches rate and sizes and dropped duplicate deliveries count.
+    """
+
+    permission_classes = (permissions.IsAdminUser,)
+    swagger_schema = None
+
+    def get(self, request: Request) -> Response:
+        return Response(
+            dict(
+                vcs_clients=dict(connection_pools=sessions.get_pool_stats(), rate_limits=rate_limit.get_budgets()),
+                webhooks=dict(
+                    queue=webhooks_queue.get_metrics(),
+                    batches=webhooks_batches.get_metrics(),
+                    deliveries=webhooks_deliveries.get_metrics(),
+                ),
+            )
+        )
+
+
+metrics_view = MetricsView.as_view()
@@ -0,0 +1,160 @@
+import json
+import time
+from collections import defaultdict
+from logging import getLogger
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from django.db import close_old_connections, transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from openwiden.enums import VersionControlService
+from openwiden.repositories import services as repositories_services
+from openwiden.vcs_clients.github import models as github_models
+from openwiden.vcs_clients.gitlab import models as gitlab_models
+from . import constants, queue, receivers
+
+log = getLogger(__name__)
+
+# Applied batches stats: batches and events count, processing seconds and batches count by the size bucket
+BATCHES_KEY = f"{queue.KEY_PREFIX}:batches"
+
+# Upper bounds of the batch size histogram buckets
+BATCH_SIZE_BUCKETS = (1, 10, 50, 100, 500)
+
+
+class IssueChange(NamedTuple):
+    vcs: str
+    remote_id: int
+    repository_id: str
+    # Issue is deleted, if it's not specified
+    issue: Optional[Union[github_models.Issue, gitlab_models.Issue]]
+
+
+def get_issue_change(event_data: dict) -> Optional[IssueChange]:
+    """
+    Returns issue sync (or delete) of the issue event, that could be applied in bulk.
+    Returns None, if event is applied by the receivers.
+    """
+    vcs, event = event_data["vcs"], event_data["event"]
+
+    if vcs == VersionControlService.GITHUB and event == "issues":
+        payload = json.loads(event_data["body"])
+        if payload["action"] in constants.GITHUB_SYNCED_ISSUE_ACTIONS:
+            issue = receivers.get_github_issue(payload)
+            return IssueChange(vcs, issue.issue_id, event_data["repository_id"], issue)
+        elif payload["action"] == constants.IssueEventActions.DELETED:
+            return IssueChange(vcs, payload["issue"]["id"], event_data["repository_id"], None)
+    elif vcs == VersionControlService.GITLAB and event == "Issue Hook":
+        payload = json.loads(event_data["body"])
+        if payload["object_attributes"]["action"] in constants.GITLAB_SYNCED_ISSUE_ACTIONS:
+            issue = receivers.get_gitlab_issue(payload)
+            return IssueChange(vcs, issue.issue_id, event_data["repository_id"], issue)
+
+    return None
+
+
+def _apply_issue_changes(changes: Dict[Tuple[str, int], IssueChange]) -> None:
+    deleted_remote_ids = defaultdict(list)
+    synced_issues = {vcs: defaultdict(list) for vcs in VersionControlService.values}
+    for change in changes.values():
+        if change.issue is None:
+            deleted_remote_ids[change.vcs].append(change.remote_id)
+        else:
+            synced_issues[change.vcs][change.repository_id].append(change.issue)
+
+    for vcs, remote_ids in deleted_remote_ids.items():
+        repositories_services.delete_issues_by_remote_ids(vcs=vcs, remote_ids=remote_ids)
+    for vcs, bulk_sync in (
+        (VersionControlService.GITHUB, repositories_services.bulk_sync_github_issues),
+        (VersionControlService.GITLAB, repositories_services.bulk_sync_gitlab_issues),
+    ):
+        if synced_issues[vcs]:
+            bulk_sync(issues=synced_issues[vcs])
+
+
+def apply(events: List[dict]) -> None:
+    """
+    Applies events in the receive order: consecutive issue changes are grouped by repository and applied in bulk
+    (only the last change of every issue is applied, so the result is the same) before the next other event
+    is dispatched to the receivers.
+    """
+    changes: Dict[Tuple[str, int], IssueChange] = {}
+    for event_data in events:
+        change = get_issue_change(event_data)
+        if change is not None:
+            changes[(change.vcs, change.remote_id)] = change
+            continue
+
+        _apply_issue_changes(changes)
+        changes = {}
+        queue.dispatch(event_data)
+
+    _apply_issue_changes(changes)
+
+
+def _get_bucket(size: int) -> str:
+    for bucket in BATCH_SIZE_BUCKETS:
+        if size <= bucket:
+            return str(bucket)
+    return "+Inf"
+
+
+def update_stats(*, size: int, duration: float) -> None:
+    try:
+        pipeline = get_redis_connection().pipeline()
+        pipeline.hincrby(BATCHES_KEY, "count", 1)
+        pipeline.hincrby(BATCHES_KEY, "events", size)
+        pipeline.hincrbyfloat(BATCHES_KEY, "seconds", duration)
+        pipeline.hincrby(BATCHES_KEY, f"size:{_get_bucket(size)}", 1)
+        pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[Webhooks] failed to update batches stats: {e}")
+
+
+def process(events: List[dict], *, consumer: str) -> Tuple[int, int]:
+    """
+    Applies dequeued events batch in one transaction and acknowledges events after the commit. Events of the failed
+    batch are applied one by one, so only the failed events are moved to the failed events list.
+    Returns applied and failed events count.
+    """
+    started_at = time.monotonic()
+
+    if len(events) == 1:
+        applied_count = int(queue.process(events[0], consumer=consumer))
+    else:
+        close_old_connections()
+        try:
+            with transaction.atomic():
+                apply(events)
+        except Exception:
+            log.exception(f"[Webhooks] failed to apply batch of {len(events)} events, events are applied one by one")
+            applied_count = sum(queue.process(event_data, consumer=consumer) for event_data in events)
+        else:
+            applied_count = len(events)
+            queue.acknowledge(consumer=consumer, applied_events=events)
+
+    update_stats(size=len(events), duration=time.monotonic() - started_at)
+    return applied_count, len(events) - applied_count
+
+
+def get_metrics() -> dict:
+    """
+    Returns applied batches count, events per second (processing time only) and batches count by the size
+    bucket (upper bound).
+    """
+    try:
+        stats = get_redis_connection().hgetall(BATCHES_KEY)
+    except RedisError as e:
+        log.warning(f"[Webhooks] failed to get batches metrics: {e}")
+        return {}
+
+    seconds = float(stats.get(b"seconds", 0))
+    return dict(
+        count=int(stats.get(b"count", 0)),
+        events_per_second=int(stats.get(b"events", 0)) / seconds if seconds else 0.0,
+        sizes={
+            bucket: int(stats.get(f"size:{bucket}".encode(), 0))
+            for bucket in [str(bucket) for bucket in BATCH_SIZE_BUCKETS] + ["+Inf"]
+        },
+    )
@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from typing import NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from . import selectors
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "webhooks:secrets"
+
+
+class WebhookData(NamedTuple):
+    secret: str
+    repository_id: str
+
+
+class LRUCache:
+    """
+    Thread safe in-process LRU cache with entries TTL.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[str, Tuple[float, WebhookData]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[WebhookData]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: WebhookData) -> None:
+        expires_at = time.monotonic() + settings.WEBHOOKS["SECRETS_LOCAL_CACHE_TTL"]
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.WEBHOOKS["SECRETS_LOCAL_CACHE_MAX_ENTRIES"]:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LRUCache()
+
+
+def _get_key(webhook_id: str) -> str:
+    return f"{KEY_PREFIX}:{webhook_id}"
+
+
+def _get_from_redis(webhook_id: str) -> Optional[WebhookData]:
+    try:
+        values = get_redis_connection().hmget(_get_key(webhook_id), "secret", "repository_id")
+    except RedisError as e:
+        log.warning(f"[Webhooks cache] failed to get webhook {webhook_id}: {e}")
+        return None
+
+    if None in values:
+        return None
+    return WebhookData(*(value.decode() for value in values))
+
+
+def _set_to_redis(webhook_id: str, data: WebhookData) -> None:
+    key = _get_key(webhook_id)
+    try:
+        pipeline = get_redis_connection().pipeline()
+        pipeline.hset(key, mapping=data._asdict())
+        pipeline.expire(key, settings.WEBHOOKS["SECRETS_CACHE_TTL"])
+        pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[Webhooks cache] failed to cache webhook {webhook_id}: {e}")
+
+
+def get_webhook(*, id: str) -> Optional[WebhookData]:
+    """
+    Returns webhook secret and repository id from the in-process cache, Redis or the DB (cached on read).
+    Returns None, if webhook does not exist.
+    """
+    webhook_id = str(id)
+
+    data = local_cache.get(webhook_id)
+    if data is not None:
+        return data
+
+    data = _get_from_redis(webhook_id)
+    if data is None:
+        values = selectors.get_webhooks().filter(id=webhook_id).values_list("secret", "repository_id").first()
+        if values is None:
+            return None
+        data = WebhookData(secret=values[0], repository_id=str(values[1]))
+        _set_to_redis(webhook_id, data)
+
+    local_cache.set(webhook_id, data)
+    return data
+
+
+def _delete(webhook_id: str) -> None:
+    local_cache.delete(webhook_id)
+    try:
+        get_redis_connection().delete(_get_key(webhook_id))
+    except RedisError as e:
+        log.warning(f"[Webhooks cache] failed to delete webhook {webhook_id}: {e}")
+
+
+def invalidate(*, id: str) -> None:
+    """
+    Deletes cached webhook after the current transaction commit. Other processes keep the webhook
+    in the in-process cache up to the local cache TTL.
+    """
+    webhook_id = str(id)
+    transaction.on_commit(lambda: _delete(webhook_id))
@@ -20,6 +20,16 @@ class IssueEventActions(str, Enum):
     DEMILESTONED = "demilestoned"
 
 
+# Issue actions, that are applied with the issue payload sync
+GITHUB_SYNCED_ISSUE_ACTIONS = (
+    IssueEventActions.OPENED,
+    IssueEventActions.CLOSED,
+    IssueEventActions.EDITED,
+    IssueEventActions.LABELED,
+    IssueEventActions.UNLABELED,
+)
+
+
 class GithubRepositoryAction(str, Enum):
     CREATED = "created"
     DELETED = "deleted"
@@ -37,3 +47,11 @@ class GitlabIssueAction(str, Enum):
     CLOSE = "close"
     REOPEN = "reopen"
     UPDATE = "update"
+
+
+GITLAB_SYNCED_ISSUE_ACTIONS = (
+    GitlabIssueAction.OPEN,
+    GitlabIssueAction.CLOSE,
+    GitlabIssueAction.REOPEN,
+    GitlabIssueAction.UPDATE,
+)
@@ -0,0 +1,65 @@
+from logging import getLogger
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from openwiden.enums import VersionControlService
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "webhooks:deliveries"
+
+# Dropped duplicate deliveries count per VCS
+DUPLICATES_KEY = f"{KEY_PREFIX}:duplicates"
+
+# Unique delivery id headers (GitHub sends the same delivery id on the redelivery)
+DELIVERY_ID_HEADERS = {
+    VersionControlService.GITHUB: "HTTP_X_GITHUB_DELIVERY",
+    VersionControlService.GITLAB: "HTTP_X_GITLAB_EVENT_UUID",
+}
+
+
+def _get_key(vcs: str, delivery_id: str) -> str:
+    return f"{KEY_PREFIX}:{vcs}:{delivery_id}"
+
+
+def register(*, vcs: str, delivery_id: str) -> bool:
+    """
+    Records delivery id for the TTL. Returns False, if delivery was already recorded (duplicate).
+    Deliveries are not deduplicated, if Redis is not available.
+    """
+    try:
+        redis = get_redis_connection()
+        if redis.set(_get_key(vcs, delivery_id), 1, nx=True, ex=settings.WEBHOOKS["DELIVERIES_TTL"]):
+            return True
+        redis.hincrby(DUPLICATES_KEY, vcs, 1)
+    except RedisError as e:
+        log.warning(f"[Webhooks deliveries] failed to register {vcs} delivery {delivery_id}: {e}")
+        return True
+
+    log.info(f"[Webhooks deliveries] duplicate {vcs} delivery {delivery_id} is dropped")
+    return False
+
+
+def release(*, vcs: str, delivery_id: str) -> None:
+    """
+    Deletes delivery id, so the delivery could be retried (e.g. if it's failed).
+    """
+    try:
+        get_redis_connection().delete(_get_key(vcs, delivery_id))
+    except RedisError as e:
+        log.warning(f"[Webhooks deliveries] failed to release {vcs} delivery {delivery_id}: {e}")
+
+
+def get_metrics() -> dict:
+    """
+    Returns dropped duplicate deliveries count per VCS.
+    """
+    try:
+        duplicates = get_redis_connection().hgetall(DUPLICATES_KEY)
+    except RedisError as e:
+        log.warning(f"[Webhooks deliveries] failed to get metrics: {e}")
+        return {}
+
+    return dict(duplicates={vcs.decode(): int(count) for vcs, count in duplicates.items()})
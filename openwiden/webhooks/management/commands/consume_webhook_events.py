@@ -0,0 +1,73 @@
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from openwiden.webhooks import batches, queue
+
+# Seconds between the checks for the coalesced events, which window is ended
+FLUSH_INTERVAL = 1
+
+
+class Command(BaseCommand):
+    help = "Applies the queued webhook events (see WEBHOOKS_ASYNC setting) in batches in the receive order."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--burst", action="store_true", help="Exit when the queue is empty instead of waiting for new events.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.WEBHOOKS["CONSUMER_BATCH_SIZE"],
+            help="Max events count, that are applied in one transaction.",
+        )
+        parser.add_argument(
+            "--consumer",
+            default=socket.gethostname(),
+            help="Consumer name (host name by default), that should be the same after the restart, so events,"
+            " which were not applied before the stop, are requeued.",
+        )
+
+    def handle(self, *args, **options):
+        timeout = settings.WEBHOOKS["CONSUMER_TIMEOUT"]
+        if settings.WEBHOOKS["COALESCE_WINDOW"]:
+            # Queue is not waited longer than the window, so the held events are not delayed
+            timeout = max(1, min(timeout, settings.WEBHOOKS["COALESCE_WINDOW"]))
+        processed = failed = 0
+        flushed_at = duration = 0.0
+
+        requeued_count = queue.requeue_processing(consumer=options["consumer"])
+        if requeued_count:
+            self.stdout.write(f"{requeued_count} not applied events are requeued.")
+
+        try:
+            while True:
+                if time.monotonic() - flushed_at >= FLUSH_INTERVAL:
+                    queue.flush_pending()
+                    flushed_at = time.monotonic()
+
+                events = queue.dequeue_batch(consumer=options["consumer"], size=options["batch_size"], timeout=timeout)
+                if not events:
+                    # Held events are applied without waiting for the window end before the exit
+                    if options["burst"] and not queue.flush_pending(force=True):
+                        break
+                    continue
+
+                started_at = time.monotonic()
+                applied_count, failed_count = batches.process(events, consumer=options["consumer"])
+                batch_duration = time.monotonic() - started_at
+
+                processed += applied_count
+                failed += failed_count
+                duration += batch_duration
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"Batch of {len(events)} events is applied in {batch_duration:.3f}s.")
+        except KeyboardInterrupt:
+            pass
+
+        events_per_second = (processed + failed) / duration if duration else 0.0
+        self.stdout.write(
+            f"{processed} events are applied, {failed} events are failed ({events_per_second:.1f} events/s)."
+        )
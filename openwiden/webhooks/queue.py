@@ -0,0 +1,284 @@
+import json
+import time
+from logging import getLogger
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.dispatch import Signal
+from django_redis import get_redis_connection
+from github_webhooks.views import GitHubWebhookView
+from gitlab_webhooks.views import WebhookView as GitlabWebhookView
+from redis.exceptions import RedisError
+
+from openwiden.enums import VersionControlService
+from . import constants, deliveries
+
+log = getLogger(__name__)
+
+KEY_PREFIX = "webhooks:events"
+
+# Events are pushed to the head and popped from the tail of the list (FIFO)
+QUEUE_KEY = f"{KEY_PREFIX}:queue"
+
+# Events are moved to the consumer processing list on dequeue and removed from it after the transaction commit,
+# so events of the crashed consumer are not lost (see requeue_processing)
+PROCESSING_KEY = f"{KEY_PREFIX}:processing:{{consumer}}"
+
+# Events, that failed to be applied, are kept for the investigation
+FAILED_KEY = f"{KEY_PREFIX}:failed"
+
+# Consumer stats: processed, failed and coalesced (dropped) events count, last processed event lag
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# Coalesced events are held in the list per key (repository id, VCS, event and remote object id) during the window,
+# keys are scored with the window end. Repository keys are flushed before the other events of the repository
+# are enqueued, so events of the same repository are not reordered.
+PENDING_KEY = f"{KEY_PREFIX}:pending"
+PENDING_EVENTS_KEY = f"{KEY_PREFIX}:pending:{{key}}"
+PENDING_REPOSITORY_KEY = f"{KEY_PREFIX}:pending:repository:{{repository_id}}"
+
+# Issue actions, that are applied with the issue payload (other actions are skipped by the receivers)
+GITHUB_COALESCED_ISSUE_ACTIONS = constants.GITHUB_SYNCED_ISSUE_ACTIONS + (constants.IssueEventActions.DELETED,)
+GITLAB_COALESCED_ISSUE_ACTIONS = constants.GITLAB_SYNCED_ISSUE_ACTIONS
+
+SIGNAL_GETTERS = {
+    VersionControlService.GITHUB: GitHubWebhookView.get_signal,
+    VersionControlService.GITLAB: GitlabWebhookView.get_signal,
+}
+
+
+def get_coalesced_object(*, vcs: str, event: str, payload: dict) -> Optional[dict]:
+    """
+    Returns remote object (issue or starred repository), that is fully synced by the event, so only the newest
+    event of the object should be applied. Returns None, if event is not coalesced.
+    """
+    if vcs == VersionControlService.GITHUB and event == "issues":
+        if payload.get("action") in GITHUB_COALESCED_ISSUE_ACTIONS:
+            return payload["issue"]
+    elif vcs == VersionControlService.GITHUB and event == "star":
+        return payload["repository"]
+    elif vcs == VersionControlService.GITLAB and event == "Issue Hook":
+        if payload["object_attributes"].get("action") in GITLAB_COALESCED_ISSUE_ACTIONS:
+            return payload["object_attributes"]
+    return None
+
+
+def enqueue(*, vcs: str, event: str, webhook_id: str, repository_id: str, body: bytes, delivery_id: str = None) -> None:
+    """
+    Enqueues raw webhook event payload with the receive time and the delivery id (released, if event is failed).
+    Issue and star events are held for the coalesce window instead (see flush_pending), held events of the
+    repository are enqueued before the other events. Raises RedisError, if event is not enqueued.
+    """
+    event_data = dict(
+        vcs=vcs,
+        event=event,
+        webhook_id=webhook_id,
+        repository_id=repository_id,
+        body=body.decode(),
+        delivery_id=delivery_id,
+        received_at=time.time(),
+    )
+
+    window = settings.WEBHOOKS["COALESCE_WINDOW"]
+    obj = get_coalesced_object(vcs=vcs, event=event, payload=json.loads(body)) if window else None
+    redis = get_redis_connection()
+    if obj is None:
+        _flush_repository_pending_events(redis, repository_id)
+        redis.lpush(QUEUE_KEY, json.dumps(event_data))
+        return
+
+    # Datetime strings of the same VCS and event are in the same format, so they are compared as strings
+    event_data["updated_at"] = obj.get("updated_at") or ""
+    key = f"{repository_id}:{vcs}:{event}:{obj['id']}"
+
+    pipeline = redis.pipeline()
+    pipeline.rpush(PENDING_EVENTS_KEY.format(key=key), json.dumps(event_data))
+    # Window is not extended by the next events, so events are delayed for the window at most
+    pipeline.zadd(PENDING_KEY, {key: event_data["received_at"] + window}, nx=True)
+    pipeline.sadd(PENDING_REPOSITORY_KEY.format(repository_id=repository_id), key)
+    pipeline.execute()
+
+
+def _flush_pending_events(redis, key: str) -> int:
+    events_key = PENDING_EVENTS_KEY.format(key=key)
+    repository_key = PENDING_REPOSITORY_KEY.format(repository_id=key.split(":", 1)[0])
+    coalesced_count = 0
+
+    def flush(pipeline) -> None:
+        nonlocal coalesced_count
+
+        events = [json.loads(value) for value in pipeline.lrange(events_key, 0, -1)]
+        pipeline.multi()
+        pipeline.zrem(PENDING_KEY, key)
+        pipeline.srem(repository_key, key)
+        if events:
+            # Newest event is applied, the last received one wins on the same updated_at
+            newest = max(reversed(events), key=lambda event_data: event_data["updated_at"])
+            coalesced_count = len(events) - 1
+            pipeline.delete(events_key)
+            pipeline.lpush(QUEUE_KEY, json.dumps(newest))
+            pipeline.hincrby(STATS_KEY, "coalesced", coalesced_count)
+
+    # Events list is watched, so events pushed during the flush are not lost
+    redis.transaction(flush, events_key)
+    return coalesced_count
+
+
+def _flush_repository_pending_events(redis, repository_id: str) -> None:
+    for key in redis.smembers(PENDING_REPOSITORY_KEY.format(repository_id=repository_id)):
+        _flush_pending_events(redis, key.decode())
+
+
+def flush_pending(*, force: bool = False) -> int:
+    """
+    Enqueues the newest event of every coalesced object, which window is ended (or all held events, if force
+    is specified). Returns flushed objects count.
+    """
+    redis = get_redis_connection()
+    keys = redis.zrangebyscore(PENDING_KEY, "-inf", "+inf" if force else time.time())
+    for key in keys:
+        _flush_pending_events(redis, key.decode())
+    return len(keys)
+
+
+def dequeue(*, consumer: str, timeout: int) -> Optional[dict]:
+    """
+    Moves the oldest queued event to the consumer processing list and returns it or None, if queue is empty
+    during the timeout (seconds). Event is kept in the processing list until it's acknowledged.
+    """
+    value = get_redis_connection().brpoplpush(QUEUE_KEY, PROCESSING_KEY.format(consumer=consumer), timeout=timeout)
+    return json.loads(value) if value else None
+
+
+def requeue_processing(*, consumer: str) -> int:
+    """
+    Moves events, that were not acknowledged by the consumer (e.g. it was killed), back to the queue tail,
+    so they are applied first. Returns requeued events count.
+    """
+    redis = get_redis_connection()
+    processing_key = PROCESSING_KEY.format(consumer=consumer)
+
+    values = redis.lrange(processing_key, 0, -1)
+    if values:
+        # Processing list head is the newest event, so the oldest event is pushed to the queue tail last
+        pipeline = redis.pipeline()
+        pipeline.rpush(QUEUE_KEY, *values)
+        pipeline.delete(processing_key)
+        pipeline.execute()
+
+    return len(values)
+
+
+def dequeue_batch(*, consumer: str, size: int, timeout: int) -> List[dict]:
+    """
+    Moves up to size oldest queued events to the consumer processing list and returns them in the receive order.
+    Waits for the first event during the timeout (seconds), empty list is returned, if queue is empty.
+    Events are kept in the processing list until they are acknowledged.
+    """
+    event_data = dequeue(consumer=consumer, timeout=timeout)
+    if event_data is None or size == 1:
+        return [event_data] if event_data else []
+
+    # Events are moved in one transaction, so they are not interleaved with the events of the other consumers
+    pipeline = get_redis_connection().pipeline()
+    for _ in range(size - 1):
+        pipeline.rpoplpush(QUEUE_KEY, PROCESSING_KEY.format(consumer=consumer))
+    values = pipeline.execute()
+    return [event_data] + [json.loads(value) for value in values if value is not None]
+
+
+def get_signal(event_data: dict) -> Signal:
+    return SIGNAL_GETTERS[event_data["vcs"]](event_data["event"])
+
+
+def dispatch(event_data: dict) -> None:
+    """
+    Sends the webhook event signal, so receivers are applied in the same way as for the synchronous processing.
+    """
+    signal = get_signal(event_data)
+    signal.send(
+        sender=dispatch,
+        payload=json.loads(event_data["body"]),
+        webhook_id=event_data["webhook_id"],
+        repository_id=event_data["repository_id"],
+    )
+
+
+def process(event_data: dict, *, consumer: str) -> bool:
+    """
+    Applies dequeued event in a transaction and acknowledges it after the commit. Failed events are moved
+    to the failed events list. Returns True, if event is applied.
+    """
+    close_old_connections()
+
+    try:
+        with transaction.atomic():
+            dispatch(event_data)
+    except Exception:
+        log.exception(f"[Webhooks] failed to apply {event_data['vcs']} {event_data['event']} event")
+        acknowledge(consumer=consumer, failed_events=[event_data])
+        # Failed delivery could be redelivered
+        if event_data.get("delivery_id"):
+            deliveries.release(vcs=event_data["vcs"], delivery_id=event_data["delivery_id"])
+        return False
+
+    acknowledge(consumer=consumer, applied_events=[event_data])
+    return True
+
+
+def acknowledge(*, consumer: str, applied_events: List[dict] = (), failed_events: List[dict] = ()) -> None:
+    """
+    Removes events from the consumer processing list, moves failed events to the failed events list
+    and updates consumer stats in one transaction. Not acknowledged events are requeued on the consumer start,
+    so they could be applied twice.
+    """
+    events = [*applied_events, *failed_events]
+    processing_key = PROCESSING_KEY.format(consumer=consumer)
+    lag = time.time() - events[-1]["received_at"]
+
+    try:
+        pipeline = get_redis_connection().pipeline()
+        for event_data in events:
+            # Events are serialized with the default json.dumps params only, so the dumped value is the same
+            pipeline.lrem(processing_key, 1, json.dumps(event_data))
+        if applied_events:
+            pipeline.hincrby(STATS_KEY, "processed", len(applied_events))
+        if failed_events:
+            pipeline.lpush(FAILED_KEY, *(json.dumps(event_data) for event_data in failed_events))
+            pipeline.hincrby(STATS_KEY, "failed", len(failed_events))
+        pipeline.hset(STATS_KEY, "last_lag", lag)
+        pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[Webhooks] failed to acknowledge events: {e}")
+
+
+def get_metrics() -> dict:
+    """
+    Returns queue depth, age of the oldest queued event (lag), failed events count, held coalesced objects count
+    and consumer stats.
+    """
+    try:
+        redis = get_redis_connection()
+
+        pipeline = redis.pipeline()
+        pipeline.llen(QUEUE_KEY)
+        pipeline.lindex(QUEUE_KEY, -1)
+        pipeline.llen(FAILED_KEY)
+        pipeline.zcard(PENDING_KEY)
+        pipeline.hgetall(STATS_KEY)
+        depth, oldest, failed_depth, pending, stats = pipeline.execute()
+    except RedisError as e:
+        log.warning(f"[Webhooks] failed to get queue metrics: {e}")
+        return {}
+
+    return dict(
+        depth=depth,
+        lag=time.time() - json.loads(oldest)["received_at"] if oldest else 0.0,
+        failed_depth=failed_depth,
+        pending=pending,
+        processed=int(stats.get(b"processed", 0)),
+        failed=int(stats.get(b"failed", 0)),
+        coalesced=int(stats.get(b"coalesced", 0)),
+        last_lag=float(stats.get(b"last_lag", 0)),
+    )
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
 
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from github_webhooks import signals as github_signals
 from gitlab_webhooks import signals as gitlab_signals
@@ -9,25 +10,38 @@ from openwiden.enums import VersionControlService
 from openwiden.repositories import services as repositories_services
 from openwiden.vcs_clients.gitlab import models as gitlab_models
 from openwiden.vcs_clients.github import models as github_models
-from . import constants
+from . import cache, constants, models
 
 log = logging.getLogger(__name__)
 
 
+def get_github_issue(payload: dict) -> github_models.Issue:
+    payload["issue"]["repository_id"] = payload["repository"]["id"]
+    return github_models.Issue.from_json(payload["issue"])
+
+
+def get_gitlab_issue(payload: dict) -> gitlab_models.Issue:
+    data = payload["object_attributes"]
+    data["project_id"] = payload["project"]["id"]
+    # Rename key here, because webhook data and API data is not similar
+    data["web_url"] = data.pop("url")
+
+    # Format datetime strings to datetime, because webhook datetime fields
+    # is not similar as API requests
+    for dt_key in ("created_at", "updated_at", "closed_at"):
+        if dt_key in data and data.get(dt_key) is not None:
+            data[dt_key] = datetime.strptime(data[dt_key], "%Y-%m-%d %H:%M:%S %Z")
+
+    return gitlab_models.Issue.from_json(data)
+
+
 @receiver(github_signals.issues)
-def handle_github_issue_event(payload, **kwargs):
+def handle_github_issue_event(payload, repository_id: str = None, **kwargs):
     log.info("issues payload received: {payload}".format(payload=payload))
 
-    if payload["action"] in [
-        constants.IssueEventActions.OPENED,
-        constants.IssueEventActions.CLOSED,
-        constants.IssueEventActions.EDITED,
-        constants.IssueEventActions.LABELED,
-        constants.IssueEventActions.UNLABELED,
-    ]:
-        payload["issue"]["repository_id"] = payload["repository"]["id"]
-        issue = github_models.Issue.from_json(payload["issue"])
-        repositories_services.sync_github_repository_issue(issue=issue)
+    if payload["action"] in constants.GITHUB_SYNCED_ISSUE_ACTIONS:
+        issue = get_github_issue(payload)
+        repositories_services.sync_github_repository_issue(issue=issue, repository_id=repository_id)
     elif payload["action"] == constants.IssueEventActions.DELETED:
         repositories_services.delete_issue_by_remote_id(
             vcs=VersionControlService.GITHUB, remote_id=payload["issue"]["id"]
@@ -68,28 +82,19 @@ def handle_github_star_event(payload: dict, **kwargs) -> None:
 
 
 @receiver(gitlab_signals.issue)
-def handle_gitlab_issue_event(payload: dict, **kwargs) -> None:
+def handle_gitlab_issue_event(payload: dict, repository_id: str = None, **kwargs) -> None:
     log.info("received Gitlab issue event: {payload}".format(payload=payload))
 
-    data = payload["object_attributes"]
-    data["project_id"] = payload["project"]["id"]
-    # Rename key here, because webhook data and API data is not similar
-    data["web_url"] = data.pop("url")
-
-    if data["action"] in [
-        constants.GitlabIssueAction.OPEN,
-        constants.GitlabIssueAction.CLOSE,
-        constants.GitlabIssueAction.REOPEN,
-        constants.GitlabIssueAction.UPDATE,
-    ]:
-        # Format datetime strings to datetime, because webhook datetime fields
-        # is not similar as API requests
-        for dt_key in ("created_at", "updated_at", "closed_at"):
-            if dt_key in data and data.get(dt_key) is not None:
-                data[dt_key] = datetime.strptime(data[dt_key], "%Y-%m-%d %H:%M:%S %Z")
-
-        issue = gitlab_models.Issue.from_json(data)
-        repositories_services.sync_gitlab_repository_issue(issue=issue)
+    if payload["object_attributes"]["action"] in constants.GITLAB_SYNCED_ISSUE_ACTIONS:
+        issue = get_gitlab_issue(payload)
+        repositories_services.sync_gitlab_repository_issue(issue=issue, repository_id=repository_id)
 
     # TODO: issue delete on delete event
     # https://gitlab.com/gitlab-org/gitlab/-/issues/17769
+
+
+@receiver(post_save, sender=models.RepositoryWebhook)
+@receiver(post_delete, sender=models.RepositoryWebhook)
+def invalidate_webhook_cache(instance: models.RepositoryWebhook, **kwargs) -> None:
+    # Post delete is sent for the cascade deletes too (e.g. repository is deleted by the repository event)
+    cache.invalidate(id=instance.id)
@@ -0,0 +1,100 @@
+import json
+from unittest import mock
+
+from openwiden.enums import VersionControlService
+from openwiden.webhooks import batches, queue
+
+
+def get_event_data(event: str, payload: dict, repository_id: str = "1") -> dict:
+    return dict(
+        vcs=VersionControlService.GITHUB,
+        event=event,
+        webhook_id="1",
+        repository_id=repository_id,
+        body=json.dumps(payload),
+        received_at=1.0,
+    )
+
+
+@mock.patch.object(batches, "repositories_services")
+@mock.patch.object(queue, "dispatch")
+@mock.patch.object(batches.receivers, "get_github_issue", side_effect=lambda payload: mock.Mock(**payload["issue"]))
+def test_apply(patched_get_github_issue, patched_dispatch, patched_services):
+    calls = mock.Mock()
+    calls.attach_mock(patched_dispatch, "dispatch")
+    calls.attach_mock(patched_services, "services")
+    repository_event = get_event_data("repository", {"action": "deleted", "repository": {"id": 1}}, "2")
+    events = [
+        get_event_data("issues", {"action": "opened", "issue": {"issue_id": 1, "title": "first"}}),
+        get_event_data("issues", {"action": "opened", "issue": {"issue_id": 2, "title": "first"}}, "2"),
+        repository_event,
+        get_event_data("issues", {"action": "edited", "issue": {"issue_id": 1, "title": "first"}}),
+        get_event_data("issues", {"action": "edited", "issue": {"issue_id": 1, "title": "last"}}),
+        get_event_data("issues", {"action": "opened", "issue": {"issue_id": 3, "title": "first"}}),
+        get_event_data("issues", {"action": "deleted", "issue": {"id": 3}}),
+    ]
+
+    batches.apply(events)
+
+    # Issue changes, that are received before the repository event, are applied before it
+    assert [name for name, args, kwargs in calls.mock_calls] == [
+        "services.bulk_sync_github_issues",
+        "dispatch",
+        "services.delete_issues_by_remote_ids",
+        "services.bulk_sync_github_issues",
+    ]
+    patched_dispatch.assert_called_once_with(repository_event)
+    patched_services.delete_issues_by_remote_ids.assert_called_once_with(
+        vcs=VersionControlService.GITHUB, remote_ids=[3],
+    )
+    synced_issues = [
+        {repository_id: [issue.title for issue in issues] for repository_id, issues in call[1]["issues"].items()}
+        for call in patched_services.bulk_sync_github_issues.call_args_list
+    ]
+    assert synced_issues == [{"1": ["first"], "2": ["first"]}, {"1": ["last"]}]
+    patched_services.bulk_sync_gitlab_issues.assert_not_called()
+
+
+@mock.patch.object(queue, "get_redis_connection")
+def test_dequeue_batch(patched_get_redis_connection):
+    events = [dict(webhook_id=str(i)) for i in range(3)]
+    redis = patched_get_redis_connection.return_value
+    redis.brpoplpush.return_value = json.dumps(events[0])
+    pipeline = redis.pipeline.return_value
+    processing_key = queue.PROCESSING_KEY.format(consumer="host")
+    # Queue is empty after two events are moved
+    pipeline.execute.return_value = [json.dumps(events[1]), json.dumps(events[2])] + [None] * 7
+
+    assert queue.dequeue_batch(consumer="host", size=10, timeout=1) == events
+    assert pipeline.rpoplpush.call_args_list == [mock.call(queue.QUEUE_KEY, processing_key)] * 9
+
+
+@mock.patch.object(batches, "get_redis_connection")
+def test_get_metrics(patched_get_redis_connection):
+    patched_get_redis_connection.return_value.hgetall.return_value = {
+        b"count": b"3",
+        b"events": b"120",
+        b"seconds": b"0.5",
+        b"size:1": b"1",
+        b"size:+Inf": b"2",
+    }
+
+    assert batches.get_metrics() == dict(
+        count=3, events_per_second=240.0, sizes={"1": 1, "10": 0, "50": 0, "100": 0, "500": 0, "+Inf": 2},
+    )
+
+
+@mock.patch.object(batches, "update_stats")
+@mock.patch.object(queue, "acknowledge")
+@mock.patch.object(batches, "apply")
+@mock.patch.object(batches, "transaction")
+@mock.patch.object(batches, "close_old_connections")
+def test_process_acknowledges_batch_after_commit(
+    patched_close_old_connections, patched_transaction, patched_apply, patched_acknowledge, patched_update_stats
+):
+    events = [dict(webhook_id="1"), dict(webhook_id="2")]
+    patched_acknowledge.side_effect = lambda **kwargs: patched_transaction.atomic.return_value.__exit__.assert_called()
+
+    assert batches.process(events, consumer="host") == (2, 0)
+    patched_apply.assert_called_once_with(events)
+    patched_acknowledge.assert_called_once_with(consumer="host", applied_events=events)
@@ -0,0 +1,81 @@
+from unittest import mock
+
+import pytest
+from django.db.models.signals import post_delete
+
+from openwiden.repositories.tests import factories as repositories_factories
+from openwiden.webhooks import cache, models
+from openwiden.webhooks.tests import factories
+
+WEBHOOK = cache.WebhookData(secret="secret", repository_id="repository id")
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    cache.local_cache.clear()
+    yield
+    cache.local_cache.clear()
+
+
+def test_local_cache_evicts_least_recently_used_entries(settings):
+    settings.WEBHOOKS = {**settings.WEBHOOKS, "SECRETS_LOCAL_CACHE_MAX_ENTRIES": 2}
+
+    cache.local_cache.set("1", WEBHOOK)
+    cache.local_cache.set("2", WEBHOOK)
+    cache.local_cache.get("1")
+    cache.local_cache.set("3", WEBHOOK)
+
+    assert cache.local_cache.get("1") == WEBHOOK
+    assert cache.local_cache.get("2") is None
+    assert cache.local_cache.get("3") == WEBHOOK
+
+
+def test_local_cache_entries_expire(settings):
+    settings.WEBHOOKS = {**settings.WEBHOOKS, "SECRETS_LOCAL_CACHE_TTL": -1}
+
+    cache.local_cache.set("1", WEBHOOK)
+
+    assert cache.local_cache.get("1") is None
+
+
+@mock.patch.object(cache, "_set_to_redis")
+@mock.patch.object(cache, "_get_from_redis", return_value=None)
+@mock.patch.object(cache.selectors, "get_webhooks")
+def test_get_webhook_is_cached(patched_get_webhooks, patched_get_from_redis, patched_set_to_redis):
+    values_list = patched_get_webhooks.return_value.filter.return_value.values_list
+    values_list.return_value.first.return_value = ("secret", "repository id")
+
+    for _ in range(3):
+        assert cache.get_webhook(id="1") == WEBHOOK
+
+    patched_get_webhooks.assert_called_once()
+    patched_get_from_redis.assert_called_once_with("1")
+    patched_set_to_redis.assert_called_once_with("1", WEBHOOK)
+
+
+@mock.patch.object(cache, "_get_from_redis", return_value=WEBHOOK)
+@mock.patch.object(cache.selectors, "get_webhooks")
+def test_get_webhook_from_redis(patched_get_webhooks, patched_get_from_redis):
+    assert cache.get_webhook(id="1") == WEBHOOK
+    patched_get_webhooks.assert_not_called()
+
+
+@mock.patch.object(cache, "invalidate")
+def test_webhook_delete_invalidates_cache(patched_invalidate):
+    webhook = mock.Mock(id="1")
+
+    post_delete.send(sender=models.RepositoryWebhook, instance=webhook)
+
+    patched_invalidate.assert_called_once_with(id="1")
+
+
+@pytest.mark.django_db
+@mock.patch.object(cache, "invalidate")
+def test_repository_delete_invalidates_webhook_cache(patched_invalidate):
+    repository = repositories_factories.Repository()
+    webhook = factories.RepositoryWebhookFactory(repository=repository)
+    patched_invalidate.reset_mock()
+
+    repository.delete()
+
+    patched_invalidate.assert_called_once_with(id=webhook.id)
@@ -0,0 +1,55 @@
+from unittest import mock
+from uuid import uuid4
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from openwiden.enums import VersionControlService
+from openwiden.webhooks import cache, deliveries, queue, views
+
+
+@mock.patch.object(deliveries, "get_redis_connection")
+def test_register(patched_get_redis_connection, settings):
+    redis = patched_get_redis_connection.return_value
+    redis.set.return_value = True
+
+    assert deliveries.register(vcs=VersionControlService.GITHUB, delivery_id="1") is True
+    redis.set.assert_called_once_with(
+        f"{deliveries.KEY_PREFIX}:github:1", 1, nx=True, ex=settings.WEBHOOKS["DELIVERIES_TTL"],
+    )
+    redis.hincrby.assert_not_called()
+
+
+@mock.patch.object(deliveries, "get_redis_connection")
+def test_register_duplicate(patched_get_redis_connection):
+    redis = patched_get_redis_connection.return_value
+    redis.set.return_value = None
+
+    assert deliveries.register(vcs=VersionControlService.GITHUB, delivery_id="1") is False
+    redis.hincrby.assert_called_once_with(deliveries.DUPLICATES_KEY, VersionControlService.GITHUB, 1)
+
+
+@mock.patch.object(queue, "enqueue")
+@mock.patch.object(deliveries, "register", return_value=False)
+@mock.patch.object(cache, "get_webhook", return_value=cache.WebhookData(secret="secret", repository_id="1"))
+@mock.patch("github_webhooks.utils.compare_signatures", return_value=True)
+def test_duplicate_delivery_is_dropped(
+    patched_compare_signatures, patched_get_webhook, patched_register, patched_enqueue, settings
+):
+    settings.WEBHOOKS = {**settings.WEBHOOKS, "ASYNC": True}
+    webhook_id = uuid4()
+    request = APIRequestFactory().post(
+        reverse("api-v1:webhooks:github", kwargs={"id": webhook_id}),
+        data={"action": "created", "repository": {"id": 1}},
+        format="json",
+        HTTP_X_GITHUB_EVENT="star",
+        HTTP_X_GITHUB_DELIVERY="delivery id",
+        HTTP_X_HUB_SIGNATURE="sha1=signature",
+    )
+
+    response = views.GithubWebhookView.as_view()(request, id=webhook_id)
+
+    assert response.status_code == status.HTTP_200_OK
+    patched_register.assert_called_once_with(vcs=VersionControlService.GITHUB, delivery_id="delivery id")
+    patched_enqueue.assert_not_called()
@@ -0,0 +1,148 @@
+import json
+from unittest import mock
+from uuid import uuid4
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from openwiden.enums import VersionControlService
+from openwiden.webhooks import cache, queue, views
+
+PAYLOAD = {"action": "created", "repository": {"id": 1}}
+
+
+@mock.patch.object(queue, "enqueue")
+@mock.patch.object(cache, "get_webhook", return_value=cache.WebhookData(secret="secret", repository_id="1"))
+@mock.patch("github_webhooks.utils.compare_signatures", return_value=True)
+def test_github_event_is_enqueued(patched_compare_signatures, patched_get_webhook, patched_enqueue, settings):
+    settings.WEBHOOKS = {**settings.WEBHOOKS, "ASYNC": True}
+    webhook_id = uuid4()
+    request = APIRequestFactory().post(
+        reverse("api-v1:webhooks:github", kwargs={"id": webhook_id}),
+        data=PAYLOAD,
+        format="json",
+        HTTP_X_GITHUB_EVENT="star",
+        HTTP_X_HUB_SIGNATURE="sha1=signature",
+    )
+
+    response = views.GithubWebhookView.as_view()(request, id=webhook_id)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    patched_enqueue.assert_called_once_with(
+        vcs=VersionControlService.GITHUB,
+        event="star",
+        webhook_id=str(webhook_id),
+        repository_id="1",
+        body=request.body,
+        delivery_id=None,
+    )
+
+
+@mock.patch.object(queue, "get_redis_connection")
+def test_dequeue(patched_get_redis_connection):
+    event_data = dict(vcs="github", event="star", webhook_id="1", body="{}", received_at=1.0)
+    patched_get_redis_connection.return_value.brpoplpush.return_value = json.dumps(event_data)
+
+    assert queue.dequeue(consumer="host", timeout=1) == event_data
+    patched_get_redis_connection.return_value.brpoplpush.assert_called_once_with(
+        queue.QUEUE_KEY, queue.PROCESSING_KEY.format(consumer="host"), timeout=1,
+    )
+
+
+@mock.patch.object(queue, "get_redis_connection")
+def test_requeue_processing(patched_get_redis_connection):
+    redis = patched_get_redis_connection.return_value
+    redis.lrange.return_value = [b"newest", b"oldest"]
+
+    assert queue.requeue_processing(consumer="host") == 2
+    redis.pipeline.return_value.rpush.assert_called_once_with(queue.QUEUE_KEY, b"newest", b"oldest")
+    redis.pipeline.return_value.delete.assert_called_once_with(queue.PROCESSING_KEY.format(consumer="host"))
+
+
+@mock.patch.object(queue.deliveries, "release")
+@mock.patch.object(queue, "get_redis_connection")
+@mock.patch.object(queue, "transaction")
+@mock.patch.object(queue, "close_old_connections")
+@mock.patch.object(queue, "dispatch", side_effect=ValueError)
+def test_process_acknowledges_failed_event(
+    patched_dispatch, patched_close_old_connections, patched_transaction, patched_get_redis_connection, patched_release,
+):
+    event_data = dict(vcs="github", event="star", webhook_id="1", body="{}", delivery_id="2", received_at=1.0)
+    pipeline = patched_get_redis_connection.return_value.pipeline.return_value
+
+    assert queue.process(event_data, consumer="host") is False
+    pipeline.lrem.assert_called_once_with(queue.PROCESSING_KEY.format(consumer="host"), 1, json.dumps(event_data))
+    pipeline.lpush.assert_called_once_with(queue.FAILED_KEY, json.dumps(event_data))
+    patched_release.assert_called_once_with(vcs="github", delivery_id="2")
+
+
+@mock.patch.object(queue, "get_signal")
+def test_dispatch(patched_get_signal):
+    event_data = dict(
+        vcs="github", event="star", webhook_id="1", repository_id="2", body=json.dumps(PAYLOAD), received_at=1.0,
+    )
+
+    queue.dispatch(event_data)
+
+    patched_get_signal.return_value.send.assert_called_once_with(
+        sender=queue.dispatch, payload=PAYLOAD, webhook_id="1", repository_id="2",
+    )
+
+
+@mock.patch.object(queue, "get_redis_connection")
+def test_issue_events_are_coalesced(patched_get_redis_connection, settings):
+    settings.WEBHOOKS = {**settings.WEBHOOKS, "COALESCE_WINDOW": 2}
+    pipeline = patched_get_redis_connection.return_value.pipeline.return_value
+    payload = {"action": "labeled", "issue": {"id": 1, "updated_at": "2020-08-17T18:11:16Z"}}
+
+    body = json.dumps(payload).encode()
+
+    queue.enqueue(vcs=VersionControlService.GITHUB, event="issues", webhook_id="1", repository_id="2", body=body)
+
+    patched_get_redis_connection.return_value.lpush.assert_not_called()
+    events_key, value = pipeline.rpush.call_args[0]
+    assert events_key == queue.PENDING_EVENTS_KEY.format(key="2:github:issues:1")
+    assert json.loads(value)["updated_at"] == "2020-08-17T18:11:16Z"
+    pipeline.zadd.assert_called_once_with(queue.PENDING_KEY, {"2:github:issues:1": mock.ANY}, nx=True)
+    pipeline.sadd.assert_called_once_with(queue.PENDING_REPOSITORY_KEY.format(repository_id="2"), "2:github:issues:1")
+
+
+@mock.patch.object(queue, "_flush_pending_events")
+@mock.patch.object(queue, "get_redis_connection")
+def test_repository_pending_events_are_flushed_before_repository_event(
+    patched_get_redis_connection, patched_flush_pending_events
+):
+    redis = patched_get_redis_connection.return_value
+    redis.smembers.return_value = {b"2:github:star:1"}
+    patched_flush_pending_events.side_effect = lambda *args: redis.lpush.assert_not_called()
+    body = json.dumps({"action": "deleted", "repository": {"id": 1}}).encode()
+
+    queue.enqueue(vcs=VersionControlService.GITHUB, event="repository", webhook_id="1", repository_id="2", body=body)
+
+    redis.smembers.assert_called_once_with(queue.PENDING_REPOSITORY_KEY.format(repository_id="2"))
+    patched_flush_pending_events.assert_called_once_with(redis, "2:github:star:1")
+    redis.lpush.assert_called_once_with(queue.QUEUE_KEY, mock.ANY)
+
+
+def test_skipped_issue_actions_are_not_coalesced():
+    payload = {"action": "pinned", "issue": {"id": 1}}
+    assert queue.get_coalesced_object(vcs=VersionControlService.GITHUB, event="issues", payload=payload) is None
+
+
+def test_flush_pending_events_enqueues_newest_event():
+    events = [
+        dict(webhook_id="1", updated_at="2020-08-17T18:11:17Z"),
+        dict(webhook_id="2", updated_at="2020-08-17T18:11:16Z"),
+        dict(webhook_id="3", updated_at="2020-08-17T18:11:17Z"),
+    ]
+    redis, pipeline = mock.Mock(), mock.Mock()
+    pipeline.lrange.return_value = [json.dumps(event_data) for event_data in events]
+    redis.transaction.side_effect = lambda func, *watches: func(pipeline)
+
+    assert queue._flush_pending_events(redis, "2:github:issues:1") == 2
+
+    pipeline.zrem.assert_called_once_with(queue.PENDING_KEY, "2:github:issues:1")
+    pipeline.srem.assert_called_once_with(queue.PENDING_REPOSITORY_KEY.format(repository_id="2"), "2:github:issues:1")
+    pipeline.delete.assert_called_once_with(queue.PENDING_EVENTS_KEY.format(key="2:github:issues:1"))
+    pipeline.lpush.assert_called_once_with(queue.QUEUE_KEY, json.dumps(events[2]))
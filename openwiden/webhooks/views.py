@@ -1,16 +1,93 @@
-from rest_framework.generics import get_object_or_404
+from logging import getLogger
 
-from . import selectors
+from django.conf import settings
+from django.dispatch import Signal
+from django.http import Http404, HttpRequest, JsonResponse
+from redis.exceptions import RedisError
+from rest_framework import status
+
+from openwiden.enums import VersionControlService
+from . import cache, deliveries, queue
 
 from github_webhooks.views import GitHubWebhookView as BaseGitHubWebhookView
 from gitlab_webhooks.views import WebhookView as BaseGitlabWebhookView
 
+log = getLogger(__name__)
 
-class GithubWebhookView(BaseGitHubWebhookView):
-    def get_secret(self) -> str:
-        return get_object_or_404(selectors.get_webhooks(), id=self.kwargs["id"]).secret
+
+class WebhookSignal:
+    """
+    Signal proxy, that sends the signal with the webhook id and the repository id or enqueues the raw
+    event payload instead, if async webhooks processing is enabled (receivers are applied by the consumer).
+    Signal is sent synchronously, if the event is not enqueued. Duplicate deliveries are dropped.
+    """
+
+    def __init__(self, *, view: "WebhookMixin", event: str, signal: Signal) -> None:
+        self.view = view
+        self.event = event
+        self.signal = signal
+
+    def send(self, sender, **kwargs) -> list:
+        webhook_id, repository_id = str(self.view.kwargs["id"]), self.view.webhook.repository_id
+
+        delivery_id = self.view.request.META.get(deliveries.DELIVERY_ID_HEADERS[self.view.vcs])
+        if delivery_id and not deliveries.register(vcs=self.view.vcs, delivery_id=delivery_id):
+            return []
+
+        if settings.WEBHOOKS["ASYNC"]:
+            try:
+                queue.enqueue(
+                    vcs=self.view.vcs,
+                    event=self.event,
+                    webhook_id=webhook_id,
+                    repository_id=repository_id,
+                    body=self.view.request.body,
+                    delivery_id=delivery_id,
+                )
+            except RedisError as e:
+                log.warning(f"[Webhooks] failed to enqueue {self.view.vcs} {self.event} event: {e}")
+            else:
+                self.view.is_enqueued = True
+                return []
+
+        try:
+            return self.signal.send(sender, webhook_id=webhook_id, repository_id=repository_id, **kwargs)
+        except Exception:
+            # Failed delivery could be retried
+            if delivery_id:
+                deliveries.release(vcs=self.view.vcs, delivery_id=delivery_id)
+            raise
 
 
-class GitlabWebhookView(BaseGitlabWebhookView):
+class WebhookMixin:
+    """
+    Verifies events with the cached webhook secret. Enqueues verified events and responds with 202 immediately,
+    if async webhooks processing is enabled.
+    """
+
+    vcs: str = None
+    webhook: cache.WebhookData = None
+    is_enqueued = False
+
     def get_secret(self) -> str:
-        return get_object_or_404(selectors.get_webhooks(), id=self.kwargs["id"]).secret
+        self.webhook = cache.get_webhook(id=self.kwargs["id"])
+        if self.webhook is None:
+            raise Http404()
+        return self.webhook.secret
+
+    def get_signal(self, event: str) -> WebhookSignal:
+        return WebhookSignal(view=self, event=event, signal=super().get_signal(event))
+
+    def post(self, request: HttpRequest, **kwargs) -> JsonResponse:
+        response = super().post(request, **kwargs)
+        if self.is_enqueued and response.status_code == status.HTTP_200_OK:
+            return JsonResponse({"detail": "Accepted"}, status=status.HTTP_202_ACCEPTED)
+        return response
+
+
+class GithubWebhookView(WebhookMixin, BaseGitHubWebhookView):
+    vcs = VersionControlService.GITHUB
+
+
+class GitlabWebhookView(WebhookMixin, BaseGitlabWebhookView):
+    vcs = VersionControlService.GITLAB